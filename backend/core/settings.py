@@ -52,6 +52,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 
     'rest_framework',
     'corsheaders',
@@ -60,6 +61,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'dispatch.timing.ServerTimingMiddleware',
+    'dispatch.metrics.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -118,6 +121,32 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+# Point CACHE_BACKEND/CACHE_LOCATION at a shared cache (e.g. Redis) when running
+# several worker processes so idempotency records are visible to all of them.
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', 'grow-trucking'),
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.getenv('CACHE_MAX_ENTRIES', '10000')),
+        },
+    },
+    # Read-through cache for the *QueryService lookups (dispatch/query_cache.py).
+    # LocMemCache evicts least-recently-used entries past MAX_ENTRIES; for Redis set
+    # QUERY_CACHE_BACKEND=django.core.cache.backends.redis.RedisCache,
+    # QUERY_CACHE_LOCATION=redis://127.0.0.1:6379/1 and maxmemory-policy allkeys-lru.
+    'query': {
+        'BACKEND': os.getenv('QUERY_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('QUERY_CACHE_LOCATION', 'grow-trucking-queries'),
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.getenv('QUERY_CACHE_MAX_ENTRIES', '5000')),
+        },
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
@@ -162,6 +191,10 @@ REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': [
         'rest_framework.renderers.JSONRenderer',
     ],
+    'DEFAULT_THROTTLE_RATES': {
+        # Batch submissions (dispatch.throttles.BatchRateThrottle), per staff user
+        'batch': os.getenv('BATCH_THROTTLE_RATE', '60/hour'),
+    },
 }
 
 # Email Configuration
@@ -176,3 +209,123 @@ DEFAULT_FROM_EMAIL = os.getenv('DEFAULT_FROM_EMAIL', EMAIL_HOST_USER)
 
 # Admin email for contact form notifications
 ADMIN_EMAIL = os.getenv('ADMIN_EMAIL', 'admin@example.com')
+
+# Email outbox delivery (see `python manage.py deliver_outbox`)
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv('EMAIL_OUTBOX_MAX_ATTEMPTS', '8'))
+EMAIL_OUTBOX_BACKOFF_BASE = int(os.getenv('EMAIL_OUTBOX_BACKOFF_BASE', '30'))  # seconds
+EMAIL_OUTBOX_BACKOFF_MAX = int(os.getenv('EMAIL_OUTBOX_BACKOFF_MAX', '3600'))  # seconds
+EMAIL_OUTBOX_LEASE_TIMEOUT = int(os.getenv('EMAIL_OUTBOX_LEASE_TIMEOUT', '300'))  # seconds
+
+# SMTP connection pool shared by the email services
+EMAIL_POOL_SIZE = int(os.getenv('EMAIL_POOL_SIZE', '4'))
+EMAIL_POOL_MAX_IDLE = int(os.getenv('EMAIL_POOL_MAX_IDLE', '30'))  # seconds before a NOOP health check
+EMAIL_POOL_MAX_AGE = int(os.getenv('EMAIL_POOL_MAX_AGE', '600'))  # seconds before a connection is recycled
+EMAIL_POOL_CHECKOUT_TIMEOUT = int(os.getenv('EMAIL_POOL_CHECKOUT_TIMEOUT', '30'))  # seconds
+
+# Bulk submission endpoint limits
+BATCH_SUBMISSION_MAX_ITEMS = int(os.getenv('BATCH_SUBMISSION_MAX_ITEMS', '50000'))
+BATCH_SUBMISSION_CHUNK_SIZE = int(os.getenv('BATCH_SUBMISSION_CHUNK_SIZE', '1000'))
+
+# Bulk state-transition endpoint (bulk/<kind>/)
+BULK_ACTION_MAX_IDS = int(os.getenv('BULK_ACTION_MAX_IDS', '10000'))
+
+# Route the submit endpoints to native async views (use with core.asgi / uvicorn)
+DISPATCH_ASYNC_VIEWS = os.getenv('DISPATCH_ASYNC_VIEWS', 'False') == 'True'
+
+# Idempotent submit endpoints (Idempotency-Key header, per-client request fingerprint fallback)
+IDEMPOTENCY_CACHE_ALIAS = 'default'
+IDEMPOTENCY_KEY_TTL = int(os.getenv('IDEMPOTENCY_KEY_TTL', '86400'))  # seconds
+IDEMPOTENCY_FINGERPRINT_TTL = int(os.getenv('IDEMPOTENCY_FINGERPRINT_TTL', '300'))  # seconds
+IDEMPOTENCY_LOCK_TIMEOUT = int(os.getenv('IDEMPOTENCY_LOCK_TIMEOUT', '30'))  # seconds
+
+# Lead list endpoints (keyset pagination)
+LEAD_LIST_PAGE_SIZE = int(os.getenv('LEAD_LIST_PAGE_SIZE', '50'))
+LEAD_LIST_MAX_PAGE_SIZE = int(os.getenv('LEAD_LIST_MAX_PAGE_SIZE', '200'))
+
+# Rows fetched per server-side cursor round trip when streaming CSV exports
+EXPORT_CHUNK_SIZE = int(os.getenv('EXPORT_CHUNK_SIZE', '2000'))
+
+# Read-through query cache (invalidated by post_save/post_delete)
+QUERY_CACHE_ENABLED = os.getenv('QUERY_CACHE_ENABLED', 'True') == 'True'
+QUERY_CACHE_ALIAS = 'query'
+QUERY_CACHE_TTL = int(os.getenv('QUERY_CACHE_TTL', '300'))  # seconds, single-row lookups
+QUERY_CACHE_LIST_TTL = int(os.getenv('QUERY_CACHE_LIST_TTL', '60'))  # seconds, list queries
+
+# Retention: archived contacts/claims older than this move to the *_archive tables
+# (see `python manage.py archive_leads`)
+LEAD_ARCHIVE_AFTER_DAYS = int(os.getenv('LEAD_ARCHIVE_AFTER_DAYS', '365'))
+LEAD_ARCHIVE_LOCK_TIMEOUT_MS = int(os.getenv('LEAD_ARCHIVE_LOCK_TIMEOUT_MS', '2000'))
+
+# Optional monthly partitioning of contacts/claims/career_applications
+# (see `python manage.py partition_leads`; run `create` daily from cron)
+LEAD_PARTITION_MONTHS_AHEAD = int(os.getenv('LEAD_PARTITION_MONTHS_AHEAD', '3'))
+LEAD_PARTITION_LOCK_TIMEOUT_MS = int(os.getenv('LEAD_PARTITION_LOCK_TIMEOUT_MS', '3000'))
+
+# Admin changelists: estimate row counts above this many rows (PostgreSQL only)
+ADMIN_ESTIMATED_COUNT_THRESHOLD = int(os.getenv('ADMIN_ESTIMATED_COUNT_THRESHOLD', '100000'))
+ADMIN_DATE_HIERARCHY_CACHE_TTL = int(os.getenv('ADMIN_DATE_HIERARCHY_CACHE_TTL', '300'))  # seconds
+
+# orjson-backed JSON renderer/parser for the REST API; without orjson installed
+# they behave like DRF's JSONRenderer/JSONParser
+FAST_JSON_ENABLED = os.getenv('FAST_JSON_ENABLED', 'True') == 'True'
+if FAST_JSON_ENABLED:
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'] = ['dispatch.renderers.FastJSONRenderer']
+    REST_FRAMEWORK['DEFAULT_PARSER_CLASSES'] = [
+        'dispatch.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ]
+
+# Build API responses from precompiled serializer field plans (False: plain DRF serializers)
+COMPILED_RESPONSE_SERIALIZERS = os.getenv('COMPILED_RESPONSE_SERIALIZERS', 'True') == 'True'
+
+# Validate JSON form submissions with the compiled single-pass validators
+# (dispatch/validation.py); False: the DRF create serializers
+COMPILED_FORM_VALIDATORS = os.getenv('COMPILED_FORM_VALIDATORS', 'True') == 'True'
+
+# Per-request phase timing (parse/validate/db/email/render and query count) as a
+# Server-Timing header and structured 'dispatch.timing' log fields; when False
+# the middleware removes itself at startup. SERVER_TIMING_HEADER=False: logs only.
+# SERVER_TIMING_SAMPLE_RATE: fraction of requests timed (their queries are wrapped)
+SERVER_TIMING_ENABLED = os.getenv('SERVER_TIMING_ENABLED', 'False') == 'True'
+SERVER_TIMING_HEADER = os.getenv('SERVER_TIMING_HEADER', 'True') == 'True'
+SERVER_TIMING_SAMPLE_RATE = float(os.getenv('SERVER_TIMING_SAMPLE_RATE', '1'))
+
+# Prometheus metrics at /metrics (request counts/latency per view, errors by
+# error_type, DB queries, email send latency, outbox depth). For several worker
+# processes point METRICS_MULTIPROC_DIR at a per-host directory emptied on start;
+# each process writes its snapshot there every METRICS_FLUSH_INTERVAL seconds.
+# Outside DEBUG the endpoint answers only scrapers sending METRICS_TOKEN
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'False') == 'True'
+METRICS_MULTIPROC_DIR = os.getenv('METRICS_MULTIPROC_DIR', '')
+METRICS_FLUSH_INTERVAL = float(os.getenv('METRICS_FLUSH_INTERVAL', '5'))  # seconds
+METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')  # bearer token required to scrape (optional with DEBUG)
+
+# Logging: records go through a bounded in-process queue to a listener thread,
+# which formats and writes them (JSON lines by default), so a slow sink never
+# blocks a request. When the queue is full records are dropped and counted
+# (dispatch_log_records_dropped_total at /metrics)
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'json')  # 'json' or 'text'
+LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', '10000'))
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'json': {'()': 'dispatch.log_pipeline.JSONFormatter'},
+        'text': {'format': '%(asctime)s %(levelname)s %(name)s: %(message)s'},
+    },
+    'handlers': {
+        'queue': {
+            '()': 'dispatch.log_pipeline.QueueLogHandler',
+            'sink': 'logging.StreamHandler',
+            'maxsize': LOG_QUEUE_SIZE,
+            'formatter': LOG_FORMAT,
+        },
+    },
+    'root': {'handlers': ['queue'], 'level': 'WARNING'},
+    'loggers': {
+        'django': {'handlers': ['queue'], 'level': 'INFO', 'propagate': False},
+        'dispatch': {'handlers': ['queue'], 'level': LOG_LEVEL, 'propagate': False},
+    },
+}
@@ -17,7 +17,10 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include
 
+from dispatch import views as dispatch_views
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/v1/dispatch/', include('dispatch.urls')),
+    path('metrics', dispatch_views.prometheus_metrics, name='metrics'),
 ]
@@ -1,9 +1,159 @@
+from django.conf import settings
 from django.contrib import admin
-from .models import Contact, Signup, Claim, CareerApplication
+from django.contrib.admin.views.main import ORDER_VAR, PAGE_VAR
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connection
+from django.db.models import Q
+from rest_framework import serializers
+from .models import Contact, Signup, Claim, CareerApplication, EmailOutbox
+from .services import LeadSearchService
+from .exports import csv_export_response
+from .pagination import EstimatedCountPaginator, decode_cursor, encode_cursor
+
+
+class FullTextSearchAdminMixin:
+    """
+    Routes the changelist search box through the GIN-indexed search_vector
+    column instead of ILIKE '%term%' scans over search_fields.
+    Falls back to the default search on non-PostgreSQL databases.
+    """
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term.strip() or connection.vendor != 'postgresql':
+            return super().get_search_results(request, queryset, search_term)
+        return queryset.filter(search_vector=LeadSearchService.build_query(search_term)), False
+
+
+class CSVExportAdminMixin:
+    """
+    Adds streaming CSV / gzip export actions for the selected rows.
+    """
+    actions = ['export_as_csv', 'export_as_csv_gzip']
+
+    @admin.action(description='Export selected as CSV')
+    def export_as_csv(self, request, queryset):
+        """Stream the selected rows as a CSV download"""
+        return csv_export_response(queryset.order_by('-created_at'), self.model._meta.db_table)
+
+    @admin.action(description='Export selected as CSV (gzip)')
+    def export_as_csv_gzip(self, request, queryset):
+        """Stream the selected rows as a gzip-compressed CSV download"""
+        return csv_export_response(queryset.order_by('-created_at'), self.model._meta.db_table, compress=True)
+
+
+class LeadStateAdminMixin:
+    """
+    Adds bulk mark-as-read / archive actions, each a single UPDATE for all
+    selected rows instead of one save() per row.
+    """
+    actions = CSVExportAdminMixin.actions + ['mark_selected_as_read', 'archive_selected']
+
+    @admin.action(description='Mark selected as read')
+    def mark_selected_as_read(self, request, queryset):
+        """Mark the selected rows as read"""
+        self.message_user(request, f"{queryset.mark_as_read()} row(s) marked as read.")
+
+    @admin.action(description='Archive selected')
+    def archive_selected(self, request, queryset):
+        """Archive the selected rows"""
+        self.message_user(request, f"{queryset.archive()} row(s) archived.")
+
+
+class LargeTableAdminMixin:
+    """
+    Keeps changelists fast on large tables:
+    - estimated row counts above ADMIN_ESTIMATED_COUNT_THRESHOLD instead of
+      COUNT(*), and no second unfiltered count
+    - the date hierarchy (MIN/MAX plus DISTINCT over dates) cached per filter
+      combination for ADMIN_DATE_HIERARCHY_CACHE_TTL seconds
+    - a keyset "Next page" link (?after=<cursor>) that continues after the
+      last row shown instead of using OFFSET, when sorted newest first
+    """
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    change_list_template = 'admin/dispatch/large_table_change_list.html'
+    keyset_param = 'after'
+
+    def changelist_view(self, request, extra_context=None):
+        # Take the cursor out of GET first: ChangeList treats unknown parameters as filters
+        request.GET = request.GET.copy()
+        request.keyset_after = request.GET.pop(self.keyset_param, [None])[-1]
+        response = super().changelist_view(request, extra_context)
+        context = getattr(response, 'context_data', None) or {}
+        if 'cl' in context:
+            context.update(self._large_table_context(request, context['cl']))
+        return response
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        after = getattr(request, 'keyset_after', None)
+        if not after or not self._keyset_ordering(request):
+            return queryset
+        try:
+            created_at, pk = decode_cursor(after)
+        except serializers.ValidationError:
+            return queryset
+        return queryset.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk))
+
+    def _keyset_ordering(self, request):
+        """Keyset links only follow the default newest-first order (-created_at, -pk)"""
+        return ORDER_VAR not in request.GET and not self.ordering and self.model._meta.ordering == ['-created_at']
+
+    def _large_table_context(self, request, cl):
+        context = {
+            'date_hierarchy_cache_ttl': getattr(settings, 'ADMIN_DATE_HIERARCHY_CACHE_TTL', 300),
+            'date_hierarchy_cache_key': cl.get_query_string(remove=[PAGE_VAR, ORDER_VAR]),
+            'keyset_first_url': cl.get_query_string(remove=[PAGE_VAR]) if request.keyset_after else None,
+            'keyset_next_url': None,
+        }
+        if self._keyset_ordering(request) and cl.multi_page and not cl.show_all:
+            rows = list(cl.result_list)
+            if len(rows) == cl.list_per_page:
+                last = rows[-1]
+                context['keyset_next_url'] = cl.get_query_string(
+                    {self.keyset_param: encode_cursor(last.created_at, last.pk)}, [PAGE_VAR]
+                )
+        return context
+
+
+class ListColumnsAdminMixin:
+    """
+    Loads only the columns the changelist displays (.only()), so large text
+    fields such as message, cover_note and notes are not read for list pages.
+    Derived columns are SQL annotations added in get_queryset, which also
+    makes them sortable. Actions and list_editable saves (POST) load full rows.
+    """
+    # Fields the model's __str__ reads (the row checkbox label uses it)
+    str_fields = ()
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if request.method == 'GET' and self._is_changelist(request):
+            queryset = queryset.only(*self._list_columns(request))
+        return queryset
+
+    def _is_changelist(self, request):
+        opts = self.model._meta
+        match = request.resolver_match
+        return match is not None and match.url_name == f'{opts.app_label}_{opts.model_name}_changelist'
+
+    def _list_columns(self, request):
+        """Concrete fields shown in the list, plus the keys keyset paging needs"""
+        opts = self.model._meta
+        columns = [opts.pk.name, 'created_at']
+        columns += [name for name in self.str_fields if name not in columns]
+        for name in self.get_list_display(request):
+            try:
+                field = opts.get_field(name)
+            except FieldDoesNotExist:
+                continue
+            if field.concrete and name not in columns:
+                columns.append(name)
+        return columns
 
 
 @admin.register(Contact)
-class ContactAdmin(admin.ModelAdmin):
+class ContactAdmin(LargeTableAdminMixin, ListColumnsAdminMixin, FullTextSearchAdminMixin, LeadStateAdminMixin, CSVExportAdminMixin, admin.ModelAdmin):
     """
     Admin interface for Contact model
     """
@@ -13,6 +163,7 @@ class ContactAdmin(admin.ModelAdmin):
     readonly_fields = ['created_at', 'updated_at']
     list_editable = ['is_read', 'is_archived']
     date_hierarchy = 'created_at'
+    str_fields = ('first_name', 'last_name', 'email')
     
     fieldsets = (
         ('Contact Information', {
@@ -31,12 +182,16 @@ class ContactAdmin(admin.ModelAdmin):
     )
     
     def get_queryset(self, request):
-        """Optimize queryset with select_related if needed"""
-        return super().get_queryset(request)
+        """Compute full_name in SQL so the column is sortable"""
+        return super().get_queryset(request).annotate(full_name_sql=Contact.full_name_expression())
+
+    @admin.display(description='Full name', ordering='full_name_sql')
+    def full_name(self, obj):
+        return obj.full_name_sql
 
 
 @admin.register(Signup)
-class SignupAdmin(admin.ModelAdmin):
+class SignupAdmin(LargeTableAdminMixin, ListColumnsAdminMixin, FullTextSearchAdminMixin, CSVExportAdminMixin, admin.ModelAdmin):
     """
     Admin interface for Signup model
     """
@@ -46,6 +201,8 @@ class SignupAdmin(admin.ModelAdmin):
     readonly_fields = ['created_at', 'updated_at']
     list_editable = ['is_approved', 'is_active']
     date_hierarchy = 'created_at'
+    actions = CSVExportAdminMixin.actions + ['approve_selected', 'deactivate_selected']
+    str_fields = ('signup_type', 'company_name', 'owner_name', 'first_name', 'last_name', 'email')
     
     fieldsets = (
         ('Signup Type', {
@@ -75,12 +232,33 @@ class SignupAdmin(admin.ModelAdmin):
     )
     
     def get_queryset(self, request):
-        """Optimize queryset"""
-        return super().get_queryset(request)
+        """Compute primary_name/primary_email in SQL so the columns are sortable"""
+        return super().get_queryset(request).annotate(
+            primary_name_sql=Signup.primary_name_expression(),
+            primary_email_sql=Signup.primary_email_expression(),
+        )
+
+    @admin.display(description='Primary name', ordering='primary_name_sql')
+    def primary_name(self, obj):
+        return obj.primary_name_sql
+
+    @admin.display(description='Primary email', ordering='primary_email_sql')
+    def primary_email(self, obj):
+        return obj.primary_email_sql
+
+    @admin.action(description='Approve selected signups')
+    def approve_selected(self, request, queryset):
+        """Approve the selected signups in one UPDATE"""
+        self.message_user(request, f"{queryset.approve()} signup(s) approved.")
+
+    @admin.action(description='Deactivate selected signups')
+    def deactivate_selected(self, request, queryset):
+        """Deactivate the selected signups in one UPDATE"""
+        self.message_user(request, f"{queryset.deactivate()} signup(s) deactivated.")
 
 
 @admin.register(Claim)
-class ClaimAdmin(admin.ModelAdmin):
+class ClaimAdmin(LargeTableAdminMixin, ListColumnsAdminMixin, FullTextSearchAdminMixin, LeadStateAdminMixin, CSVExportAdminMixin, admin.ModelAdmin):
     """
     Admin interface for Claim model
     """
@@ -90,6 +268,7 @@ class ClaimAdmin(admin.ModelAdmin):
     readonly_fields = ['created_at', 'updated_at']
     list_editable = ['is_read', 'is_archived']
     date_hierarchy = 'created_at'
+    str_fields = ('full_name', 'email')
     
     fieldsets = (
         ('Claimant Information', {
@@ -107,6 +286,74 @@ class ClaimAdmin(admin.ModelAdmin):
         }),
     )
     
-    def get_queryset(self, request):
-        """Optimize queryset"""
-        return super().get_queryset(request)
+@admin.register(CareerApplication)
+class CareerApplicationAdmin(LargeTableAdminMixin, ListColumnsAdminMixin, FullTextSearchAdminMixin, LeadStateAdminMixin, CSVExportAdminMixin, admin.ModelAdmin):
+    """
+    Admin interface for CareerApplication model
+    """
+    list_display = ['id', 'full_name', 'email', 'position_type', 'status', 'is_read', 'is_archived', 'created_at']
+    list_filter = ['status', 'position_type', 'is_read', 'is_archived', 'created_at']
+    search_fields = ['full_name', 'email', 'phone', 'city_state']
+    readonly_fields = ['created_at', 'updated_at', 'reviewed_by', 'reviewed_at']
+    date_hierarchy = 'created_at'
+    str_fields = ('full_name', 'email', 'position_type')
+    actions = LeadStateAdminMixin.actions + [
+        'mark_reviewing', 'mark_interviewing', 'mark_accepted', 'mark_rejected'
+    ]
+    
+    fieldsets = (
+        ('Applicant Information', {
+            'fields': ('full_name', 'email', 'phone', 'city_state', 'linkedin_url', 'years_of_experience')
+        }),
+        ('Position', {
+            'fields': ('position_type', 'job_title', 'cover_note')
+        }),
+        ('Review', {
+            'fields': ('status', 'reviewed_by', 'reviewed_at', 'notes', 'is_read', 'is_archived')
+        }),
+        ('Timestamps', {
+            'fields': ('created_at', 'updated_at'),
+            'classes': ('collapse',)
+        }),
+    )
+
+    def _set_status(self, request, queryset, new_status):
+        """Set the status of the selected applications in one UPDATE, recording the reviewer"""
+        count = queryset.update_status(new_status, reviewed_by=request.user.get_username())
+        self.message_user(request, f"{count} application(s) set to {new_status}.")
+
+    @admin.action(description='Set selected to Under Review')
+    def mark_reviewing(self, request, queryset):
+        self._set_status(request, queryset, 'reviewing')
+
+    @admin.action(description='Set selected to Interviewing')
+    def mark_interviewing(self, request, queryset):
+        self._set_status(request, queryset, 'interviewing')
+
+    @admin.action(description='Set selected to Accepted')
+    def mark_accepted(self, request, queryset):
+        self._set_status(request, queryset, 'accepted')
+
+    @admin.action(description='Set selected to Rejected')
+    def mark_rejected(self, request, queryset):
+        self._set_status(request, queryset, 'rejected')
+
+
+@admin.register(EmailOutbox)
+class EmailOutboxAdmin(admin.ModelAdmin):
+    """
+    Admin interface for EmailOutbox model
+    """
+    list_display = ['id', 'kind', 'status', 'attempts', 'next_attempt_at', 'sent_at', 'created_at']
+    list_filter = ['status', 'kind']
+    readonly_fields = ['kind', 'payload', 'attempts', 'locked_at', 'last_error', 'created_at', 'updated_at', 'sent_at']
+    actions = ['requeue_messages']
+
+    @admin.action(description='Requeue selected messages for delivery')
+    def requeue_messages(self, request, queryset):
+        """Return dead-lettered messages to the delivery queue"""
+        count = 0
+        for message in queryset.exclude(status=EmailOutbox.STATUS_SENT):
+            message.requeue()
+            count += 1
+        self.message_user(request, f"{count} message(s) requeued.")
@@ -2,4 +2,9 @@ from django.apps import AppConfig
 
 
 class DispatchConfig(AppConfig):
+    # Matches the implicit ids in the migrations (contacts, daily_lead_rollups)
+    default_auto_field = 'django.db.models.BigAutoField'
     name = 'dispatch'
+
+    def ready(self):
+        from . import receivers  # noqa: F401
@@ -2,11 +2,11 @@
 Infrastructure Layer: Email Service
 Handles email notifications for contact form submissions.
 """
-from django.core.mail import send_mail
 from django.conf import settings
 from django.template.loader import render_to_string
 from typing import Dict, Any
 import logging
+from .smtp_pool import send_pooled_mail
 
 logger = logging.getLogger(__name__)
 
@@ -18,12 +18,13 @@ class ContactEmailService:
     """
 
     @staticmethod
-    def send_contact_notification(contact_data: Dict[str, Any]) -> bool:
+    def send_contact_notification(contact_data: Dict[str, Any], fail_silently: bool = True) -> bool:
         """
         Send email notification to admin when contact form is submitted
         
         Args:
             contact_data: Dictionary containing contact submission data
+            fail_silently: Return False on a send error instead of raising it
             
         Returns:
             True if email sent successfully, False otherwise
@@ -59,7 +60,7 @@ Contact ID: {contact_data.get('id', 'N/A')}
             # Send email
             from_email = getattr(settings, 'DEFAULT_FROM_EMAIL', settings.EMAIL_HOST_USER)
             
-            send_mail(
+            send_pooled_mail(
                 subject=subject,
                 message=message,
                 from_email=from_email,
@@ -67,20 +68,23 @@ Contact ID: {contact_data.get('id', 'N/A')}
                 fail_silently=False,
             )
             
-            logger.info(f"Contact notification email sent to {admin_email} for contact ID: {contact_data.get('id')}")
+            logger.info("Contact notification email sent to %s for contact ID: %s", admin_email, contact_data.get('id'))
             return True
             
         except Exception as e:
-            logger.error(f"Failed to send contact notification email: {str(e)}", exc_info=True)
+            if not fail_silently:
+                raise
+            logger.error("Failed to send contact notification email: %s", e, exc_info=True)
             return False
 
     @staticmethod
-    def send_confirmation_email(contact_data: Dict[str, Any]) -> bool:
+    def send_confirmation_email(contact_data: Dict[str, Any], fail_silently: bool = True) -> bool:
         """
         Send confirmation email to the user who submitted the form
         
         Args:
             contact_data: Dictionary containing contact submission data
+            fail_silently: Return False on a send error instead of raising it
             
         Returns:
             True if email sent successfully, False otherwise
@@ -106,7 +110,7 @@ Truck Dispatch Team
 
             from_email = getattr(settings, 'DEFAULT_FROM_EMAIL', settings.EMAIL_HOST_USER)
             
-            send_mail(
+            send_pooled_mail(
                 subject=subject,
                 message=message,
                 from_email=from_email,
@@ -114,11 +118,13 @@ Truck Dispatch Team
                 fail_silently=False,
             )
             
-            logger.info(f"Confirmation email sent to {user_email}")
+            logger.info("Confirmation email sent to %s", user_email)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to send confirmation email: {str(e)}", exc_info=True)
+            if not fail_silently:
+                raise
+            logger.error("Failed to send confirmation email: %s", e, exc_info=True)
             return False
 
 
@@ -129,12 +135,13 @@ class CareerApplicationEmailService:
     """
 
     @staticmethod
-    def send_application_notification(application_data: Dict[str, Any]) -> bool:
+    def send_application_notification(application_data: Dict[str, Any], fail_silently: bool = True) -> bool:
         """
         Send email notification to HR/admin when career application is submitted
         
         Args:
             application_data: Dictionary containing career application data
+            fail_silently: Return False on a send error instead of raising it
             
         Returns:
             True if email sent successfully, False otherwise
@@ -179,7 +186,7 @@ Application ID: {application_data.get('id', 'N/A')}
             # Send email
             from_email = getattr(settings, 'DEFAULT_FROM_EMAIL', settings.EMAIL_HOST_USER)
             
-            send_mail(
+            send_pooled_mail(
                 subject=subject,
                 message=message,
                 from_email=from_email,
@@ -187,20 +194,23 @@ Application ID: {application_data.get('id', 'N/A')}
                 fail_silently=False,
             )
             
-            logger.info(f"Career application notification email sent to {admin_email} for application ID: {application_data.get('id')}")
+            logger.info("Career application notification email sent to %s for application ID: %s", admin_email, application_data.get('id'))
             return True
             
         except Exception as e:
-            logger.error(f"Failed to send career application notification email: {str(e)}", exc_info=True)
+            if not fail_silently:
+                raise
+            logger.error("Failed to send career application notification email: %s", e, exc_info=True)
             return False
 
     @staticmethod
-    def send_confirmation_email(application_data: Dict[str, Any]) -> bool:
+    def send_confirmation_email(application_data: Dict[str, Any], fail_silently: bool = True) -> bool:
         """
         Send confirmation email to the applicant
         
         Args:
             application_data: Dictionary containing career application data
+            fail_silently: Return False on a send error instead of raising it
             
         Returns:
             True if email sent successfully, False otherwise
@@ -235,7 +245,7 @@ Grow Trucking Hiring Team
 
             from_email = getattr(settings, 'DEFAULT_FROM_EMAIL', settings.EMAIL_HOST_USER)
             
-            send_mail(
+            send_pooled_mail(
                 subject=subject,
                 message=message,
                 from_email=from_email,
@@ -243,9 +253,11 @@ Grow Trucking Hiring Team
                 fail_silently=False,
             )
             
-            logger.info(f"Career application confirmation email sent to {applicant_email}")
+            logger.info("Career application confirmation email sent to %s", applicant_email)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to send career application confirmation email: {str(e)}", exc_info=True)
+            if not fail_silently:
+                raise
+            logger.error("Failed to send career application confirmation email: %s", e, exc_info=True)
             return False
\ No newline at end of file
@@ -0,0 +1,170 @@
+"""
+Presentation Layer: Idempotent Request Handling
+Replays the stored response for retried POSTs so a retry never creates a
+second row. Requests are keyed by the Idempotency-Key header, or by the
+client address plus a fingerprint of the request when the client does not
+send one.
+
+DRF views are fingerprinted from the parsed request.data rather than
+request.body: reading request.body enforces DATA_UPLOAD_MAX_MEMORY_SIZE,
+which large batch uploads exceed.
+"""
+import functools
+import hashlib
+import inspect
+import json
+import logging
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import JsonResponse
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.throttling import BaseThrottle
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+REPLAY_HEADER = 'Idempotent-Replayed'
+
+
+def _cache():
+    return caches[getattr(settings, 'IDEMPOTENCY_CACHE_ALIAS', 'default')]
+
+
+def _canonical(data) -> bytes:
+    """Parsed request data serialized with sorted keys, so formatting and key order don't matter"""
+    if hasattr(data, 'lists'):
+        # QueryDict (form-encoded or multipart body)
+        data = sorted(data.lists())
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # e.g. integers beyond 64 bits parsed by the stdlib json
+            pass
+    return json.dumps(data, default=str, sort_keys=True, separators=(',', ':')).encode()
+
+
+def _view_scope(scope: str, args, kwargs) -> str:
+    """The scope plus the view's URL arguments: /batch/contact/ and /batch/claim/ never share keys"""
+    parts = [str(arg) for arg in args] + [f'{name}={value}' for name, value in sorted(kwargs.items())]
+    return ':'.join([scope, *parts])
+
+
+def _request_keys(scope: str, request, content: bytes):
+    """Return (cache key, lock key, fingerprint, ttl) for a request with the given content"""
+    fingerprint = hashlib.sha256(content).hexdigest()
+    client_key = request.headers.get(IDEMPOTENCY_HEADER, '').strip()
+
+    if client_key:
+        identity = hashlib.sha256(client_key.encode()).hexdigest()
+        ttl = getattr(settings, 'IDEMPOTENCY_KEY_TTL', 86400)
+    else:
+        # Same body from two clients is two requests; the address comes from
+        # X-Forwarded-For / REMOTE_ADDR as for DRF throttling (NUM_PROXIES)
+        client = hashlib.sha256((BaseThrottle().get_ident(request) or '').encode()).hexdigest()[:16]
+        identity = f'body:{client}:{fingerprint}'
+        ttl = getattr(settings, 'IDEMPOTENCY_FINGERPRINT_TTL', 300)
+
+    cache_key = f'idempotency:{scope}:{identity}'
+    return cache_key, f'{cache_key}:lock', fingerprint, ttl
+
+
+def _conflict(message: str, status_code: int, is_drf: bool):
+    payload = {'success': False, 'message': message}
+    return Response(payload, status=status_code) if is_drf else JsonResponse(payload, status=status_code)
+
+
+def _replay(stored: dict, fingerprint: str, is_drf: bool):
+    if stored['fingerprint'] != fingerprint:
+        return _conflict(
+            f'{IDEMPOTENCY_HEADER} was already used with a different request body.',
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            is_drf,
+        )
+    if is_drf:
+        response = Response(stored['data'], status=stored['status'])
+    else:
+        response = JsonResponse(stored['data'], status=stored['status'])
+    response[REPLAY_HEADER] = 'true'
+    return response
+
+
+def _record(response, fingerprint: str) -> dict:
+    data = response.data if isinstance(response, Response) else json.loads(response.content)
+    return {'status': response.status_code, 'data': data, 'fingerprint': fingerprint}
+
+
+def idempotent(scope: str):
+    """
+    Decorator for submit views (DRF function views or native async views)
+
+    - A completed (2xx) response is cached per scope, URL arguments and
+      key; a replay returns it without running the view, serializers or
+      queries.
+    - A retry that arrives while the original is still running gets 409.
+    - Reusing a key with a different body gets 422.
+    Storage is the IDEMPOTENCY_CACHE_ALIAS cache, which bounds and
+    expires entries (MAX_ENTRIES / TTL).
+    """
+    in_flight_message = 'A request with this idempotency key is already being processed.'
+
+    def decorator(view_func):
+        if inspect.iscoroutinefunction(view_func):
+            @functools.wraps(view_func)
+            async def async_wrapper(request, *args, **kwargs):
+                cache = _cache()
+                # Native views take single forms, which request.body handles
+                cache_key, lock_key, fingerprint, ttl = _request_keys(
+                    _view_scope(scope, args, kwargs), request, request.body or b''
+                )
+
+                stored = await cache.aget(cache_key)
+                if stored is not None:
+                    logger.info("Replaying idempotent %s response", scope)
+                    return _replay(stored, fingerprint, is_drf=False)
+                if not await cache.aadd(lock_key, True, timeout=getattr(settings, 'IDEMPOTENCY_LOCK_TIMEOUT', 30)):
+                    return _conflict(in_flight_message, status.HTTP_409_CONFLICT, is_drf=False)
+
+                try:
+                    response = await view_func(request, *args, **kwargs)
+                    if 200 <= response.status_code < 300:
+                        await cache.aset(cache_key, _record(response, fingerprint), timeout=ttl)
+                    return response
+                finally:
+                    await cache.adelete(lock_key)
+
+            return async_wrapper
+
+        @functools.wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            cache = _cache()
+            # Parse errors raised here are answered by DRF like any other
+            cache_key, lock_key, fingerprint, ttl = _request_keys(
+                _view_scope(scope, args, kwargs), request, _canonical(request.data)
+            )
+
+            stored = cache.get(cache_key)
+            if stored is not None:
+                logger.info("Replaying idempotent %s response", scope)
+                return _replay(stored, fingerprint, is_drf=True)
+            if not cache.add(lock_key, True, timeout=getattr(settings, 'IDEMPOTENCY_LOCK_TIMEOUT', 30)):
+                return _conflict(in_flight_message, status.HTTP_409_CONFLICT, is_drf=True)
+
+            try:
+                response = view_func(request, *args, **kwargs)
+                if 200 <= response.status_code < 300:
+                    cache.set(cache_key, _record(response, fingerprint), timeout=ttl)
+                return response
+            finally:
+                cache.delete(lock_key)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,160 @@
+"""
+Infrastructure Layer: Non-Blocking Log Pipeline
+Logging handlers for the LOGGING setting that keep log I/O off the request
+path:
+
+- QueueLogHandler puts each record on a bounded in-process queue and
+  returns; a QueueListener thread formats it and writes it to the real
+  handler (the sink). When every `logger.info('... %s', value)` argument
+  is immutable (str, int, float, None, tuples of those) the message is only
+  rendered on the listener thread; other arguments, which the caller may
+  still change, are rendered on the way in. When the queue is full the
+  record is dropped and counted (dropped(), exported at /metrics) instead
+  of blocking the caller.
+- JSONFormatter writes one JSON object per line, including any `extra`
+  fields passed to the logging call.
+
+Loaded by logging.config.dictConfig before the apps are ready, so this
+module must not import models.
+"""
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import weakref
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+from django.utils.module_loading import import_string
+
+# Attributes every LogRecord has; anything else on a record came from `extra`
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+# Message arguments that cannot change after the logging call
+_IMMUTABLE_ARG_TYPES = (str, int, float, type(None))
+
+_dropped_lock = threading.Lock()
+_dropped = 0
+
+_handlers = weakref.WeakSet()
+
+
+def _immutable(value) -> bool:
+    if isinstance(value, tuple):
+        return all(_immutable(item) for item in value)
+    return isinstance(value, _IMMUTABLE_ARG_TYPES)
+
+
+def dropped() -> int:
+    """Records this process dropped because a log queue was full"""
+    return _dropped
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per record: timestamp, level, logger, message, extra fields, exception"""
+
+    def format(self, record):
+        entry = {
+            'timestamp': datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        if record.stack_info:
+            entry['stack'] = self.formatStack(record.stack_info)
+        return json.dumps(entry, default=str)
+
+
+class _Listener(QueueListener):
+    def enqueue_sentinel(self):
+        # Block (briefly) instead of raising queue.Full when stopping with a full queue
+        try:
+            self.queue.put(self._sentinel, timeout=5)
+        except queue.Full:
+            pass
+
+
+class QueueLogHandler(QueueHandler):
+    """
+    Hands records to a listener thread that writes them to `sink`
+
+    Args:
+        sink: Dotted path of the handler that does the I/O
+        sink_kwargs: Keyword arguments for the sink
+        maxsize: Queue bound; records beyond it are dropped and counted
+    The handler's formatter (dictConfig 'formatter') is used by the sink.
+    """
+
+    def __init__(self, sink='logging.StreamHandler', sink_kwargs=None, maxsize=10000):
+        super().__init__(queue.Queue(maxsize))
+        self.maxsize = maxsize
+        self.sink = import_string(sink)(**(sink_kwargs or {}))
+        self.listener = _Listener(self.queue, self.sink, respect_handler_level=True)
+        self.listener.start()
+        _handlers.add(self)
+
+    def setFormatter(self, fmt):
+        super().setFormatter(fmt)
+        self.sink.setFormatter(fmt)
+
+    def prepare(self, record):
+        # The listener thread renders the traceback, and the message when its
+        # arguments are immutable; mutable ones (a dict, a model instance) are
+        # rendered now, in the state they had at the logging call.
+        # (The stdlib version formats everything eagerly so records can be pickled.)
+        if record.args and not _immutable(record.args):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record):
+        global _dropped
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with _dropped_lock:
+                _dropped += 1
+
+    def stop(self):
+        """Drain the queue and stop the listener thread"""
+        if self.listener._thread is not None:
+            self.listener.stop()
+
+    def close(self):
+        self.stop()
+        self.sink.close()
+        super().close()
+
+    def _restart_after_fork(self):
+        # The listener thread did not survive the fork, and the queue's lock may
+        # have been held by it; the child starts over with a fresh queue
+        self.queue = queue.Queue(self.maxsize)
+        self.listener = _Listener(self.queue, self.sink, respect_handler_level=True)
+        self.listener.start()
+
+
+def _stop_all():
+    for handler in list(_handlers):
+        handler.stop()
+
+
+def _after_fork():
+    global _dropped_lock, _dropped
+    _dropped_lock = threading.Lock()
+    _dropped = 0
+    for handler in list(_handlers):
+        handler._restart_after_fork()
+
+
+atexit.register(_stop_all)
+os.register_at_fork(after_in_child=_after_fork)
@@ -0,0 +1,87 @@
+"""
+Management Command: Move old archived leads into the archive tables
+Copies archived contacts/claims older than the retention age into
+contacts_archive/claims_archive and deletes them from the hot tables, in
+small batches that each commit on their own. Safe to stop (Ctrl+C) and
+re-run: it simply continues with the rows that are left.
+
+Usage:
+    python manage.py archive_leads
+    python manage.py archive_leads --kind contact --older-than-days 180 --batch-size 500
+    python manage.py archive_leads --dry-run
+"""
+import signal
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from dispatch.services import LeadArchiveService
+
+
+class Command(BaseCommand):
+    help = 'Move archived contacts and claims past the retention age into the archive tables.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--kind', action='append', choices=sorted(LeadArchiveService.SOURCES),
+                            help='Lead kind to process (repeatable, default: all)')
+        parser.add_argument('--older-than-days', type=int, default=None,
+                            help='Retention age in days (default: LEAD_ARCHIVE_AFTER_DAYS)')
+        parser.add_argument('--batch-size', type=int, default=500, help='Rows moved per transaction')
+        parser.add_argument('--sleep', type=float, default=0.1, help='Seconds to pause between batches')
+        parser.add_argument('--max-batches', type=int, default=None, help='Stop after this many batches per kind')
+        parser.add_argument('--dry-run', action='store_true', help='Only report how many rows would move')
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be at least 1')
+        if options['older_than_days'] is not None and options['older_than_days'] < 0:
+            raise CommandError('--older-than-days cannot be negative')
+
+        self._stopping = False
+        signal.signal(signal.SIGTERM, self._request_stop)
+        signal.signal(signal.SIGINT, self._request_stop)
+
+        cutoff = LeadArchiveService.cutoff(options['older_than_days'])
+        self.stdout.write(f"Archiving rows created before {cutoff:%Y-%m-%d %H:%M %Z}")
+        for kind in options['kind'] or sorted(LeadArchiveService.SOURCES):
+            if self._stopping:
+                break
+            self._archive(kind, cutoff, options)
+
+    def _archive(self, kind, cutoff, options):
+        conflicting = LeadArchiveService.conflicting(kind, cutoff).count()
+        if conflicting:
+            self.stderr.write(self.style.WARNING(
+                f"{kind}: {conflicting} eligible row(s) left in place, their id is already in the archive table"
+            ))
+        total = LeadArchiveService.movable(kind, cutoff).count()
+        if options['dry_run'] or not total:
+            self.stdout.write(f"{kind}: {total} row(s) eligible")
+            return
+
+        moved = batches = 0
+        finished = False
+        started = time.perf_counter()
+        while not self._stopping:
+            if options['max_batches'] is not None and batches >= options['max_batches']:
+                break
+            count = LeadArchiveService.archive_batch(kind, cutoff, options['batch_size'])
+            if not count:
+                finished = True
+                break
+            moved += count
+            batches += 1
+            rate = moved / max(time.perf_counter() - started, 1e-9)
+            self.stdout.write(
+                f"{kind}: {moved}/{total} moved ({min(moved / total, 1):.0%}), "
+                f"{rate:.0f} rows/s, ~{max(total - moved, 0) / rate:.0f}s left"
+            )
+            if options['sleep']:
+                time.sleep(options['sleep'])
+
+        remaining = 'done' if finished else 'stopped early, re-run to continue'
+        self.stdout.write(self.style.SUCCESS(f"{kind}: moved {moved} row(s) in {batches} batch(es) ({remaining})"))
+
+    def _request_stop(self, signum, frame):
+        self.stdout.write('Stopping after the current batch...')
+        self._stopping = True
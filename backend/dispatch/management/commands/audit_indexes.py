@@ -0,0 +1,214 @@
+"""
+Management Command: Report duplicate, redundant and unused indexes
+Reads the index definitions implied by the model metadata (db_index, unique,
+Meta.indexes, constraints) and, on PostgreSQL, the live pg_stat_user_indexes
+counters, then estimates what each removable index costs on the write path.
+
+Usage:
+    python manage.py audit_indexes
+    python manage.py audit_indexes --app dispatch --app auth
+    python manage.py audit_indexes --fail-on-findings   # non-zero exit for CI
+"""
+from collections import defaultdict
+
+from django.apps import apps
+from django.contrib.postgres.indexes import PostgresIndex
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections, models
+
+# On PostgreSQL, db_index on a CharField/TextField also creates a *_like
+# (varchar_pattern_ops) index for LIKE 'prefix%' lookups
+PATTERN_OPS_FIELDS = (models.CharField, models.TextField)
+
+INDEX_STATS_SQL = """
+    SELECT s.relname, s.indexrelname, s.idx_scan, pg_relation_size(s.indexrelid),
+           i.indisunique OR i.indisprimary, t.n_tup_ins, t.n_tup_upd - t.n_tup_hot_upd
+    FROM pg_stat_user_indexes s
+    JOIN pg_index i ON i.indexrelid = s.indexrelid
+    JOIN pg_stat_user_tables t ON t.relid = s.relid
+    WHERE s.relname = ANY(%s)
+    ORDER BY s.relname, s.indexrelname
+"""
+
+# Indexes on the same table with identical keys, operator classes,
+# expressions and predicates; they differ only by name
+DUPLICATE_INDEXES_SQL = """
+    SELECT c.relname, array_agg(ic.relname ORDER BY ic.relname)
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indrelid
+    JOIN pg_class ic ON ic.oid = i.indexrelid
+    WHERE c.relname = ANY(%s)
+    GROUP BY c.relname, i.indkey::text, i.indclass::text, i.indcollation::text, i.indoption::text,
+             COALESCE(pg_get_expr(i.indexprs, i.indrelid), ''), COALESCE(pg_get_expr(i.indpred, i.indrelid), '')
+    HAVING count(*) > 1
+"""
+
+STATS_RESET_SQL = "SELECT stats_reset FROM pg_stat_database WHERE datname = current_database()"
+
+
+def _declared_indexes(model, vendor):
+    """Index definitions implied by one model's metadata, as comparable dicts"""
+    meta = model._meta
+    found = []
+
+    def add(source, columns, method='btree', condition=None, unique=False, opclasses=()):
+        found.append({
+            'source': source,
+            'columns': tuple(columns),
+            'method': method,
+            'condition': condition,
+            'unique': unique,
+            'opclasses': tuple(opclasses),
+        })
+
+    for field in meta.local_concrete_fields:
+        if field.primary_key:
+            add(f'{field.name} (primary key)', [field.column], unique=True)
+        elif field.unique:
+            add(f'{field.name} (unique=True)', [field.column], unique=True)
+        elif field.db_index:
+            add(f'{field.name} (db_index=True)', [field.column])
+            if vendor == 'postgresql' and isinstance(field, PATTERN_OPS_FIELDS):
+                add(f'{field.name} (db_index=True, _like)', [field.column], opclasses=['pattern_ops'])
+
+    for fields in meta.unique_together:
+        add(f'unique_together {fields}', [meta.get_field(name).column for name in fields], unique=True)
+
+    for index in meta.indexes:
+        method = index.suffix if isinstance(index, PostgresIndex) else 'btree'
+        condition = str(index.condition) if index.condition else None
+        if index.expressions:
+            add(f'Meta.indexes {index.name}', [str(expression) for expression in index.expressions],
+                method, condition, opclasses=index.opclasses)
+        else:
+            columns = [meta.get_field(name.lstrip('-')).column for name in index.fields]
+            add(f'Meta.indexes {index.name}', columns, method, condition, opclasses=index.opclasses)
+
+    for constraint in meta.constraints:
+        if not isinstance(constraint, models.UniqueConstraint):
+            continue
+        condition = str(constraint.condition) if constraint.condition else None
+        if constraint.expressions:
+            columns = [str(expression) for expression in constraint.expressions]
+        else:
+            columns = [meta.get_field(name).column for name in constraint.fields]
+        add(f'constraint {constraint.name}', columns, condition=condition, unique=True,
+            opclasses=constraint.opclasses)
+
+    return found
+
+
+def _redundant(indexes):
+    """
+    (index, reason) pairs for indexes another index on the table already serves
+
+    A btree is redundant when an earlier index has the same key, operator
+    classes and predicate (exact duplicate; direction is ignored because a
+    btree scans both ways), or when its key is a left prefix of a wider
+    btree with the same predicate. Unique indexes are never reported.
+    """
+    findings = []
+    for position, index in enumerate(indexes):
+        if index['unique']:
+            continue
+        for other_position, other in enumerate(indexes):
+            if other is index or other['method'] != index['method'] or other['condition'] != index['condition']:
+                continue
+            if other['opclasses'] != index['opclasses']:
+                continue
+            if other['columns'] == index['columns'] and (other['unique'] or other_position < position):
+                findings.append((index, f"duplicate of {other['source']}"))
+                break
+            width = len(index['columns'])
+            if (index['method'] == 'btree' and len(other['columns']) > width
+                    and other['columns'][:width] == index['columns']):
+                findings.append((index, f"left prefix of {other['source']}"))
+                break
+    return findings
+
+
+class Command(BaseCommand):
+    help = 'Report duplicate, redundant and unused indexes with an estimate of their write cost.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--app', action='append', dest='apps',
+                            help='App label to audit (repeatable, default: dispatch)')
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS)
+        parser.add_argument('--fail-on-findings', action='store_true',
+                            help='Exit with an error if any removable index is found')
+
+    def handle(self, *args, **options):
+        connection = connections[options['database']]
+        labels = options['apps'] or ['dispatch']
+        try:
+            app_models = [model for label in labels for model in apps.get_app_config(label).get_models()]
+        except LookupError as e:
+            raise CommandError(str(e))
+
+        findings = 0
+        declared_by_table = {}
+        self.stdout.write(self.style.MIGRATE_HEADING('Model metadata'))
+        for model in app_models:
+            if not model._meta.managed or model._meta.proxy:
+                continue
+            indexes = _declared_indexes(model, connection.vendor)
+            declared_by_table[model._meta.db_table] = indexes
+            redundant = _redundant(indexes)
+            findings += len(redundant)
+            for index, reason in redundant:
+                self.stdout.write(
+                    f"  {model._meta.db_table}: {index['source']} is {reason} "
+                    f"-> 1 of {len(indexes)} index writes per INSERT"
+                )
+        if not findings:
+            self.stdout.write('  No duplicate or prefix-redundant indexes declared.')
+
+        if connection.vendor == 'postgresql':
+            findings += self._audit_postgres(connection, sorted(declared_by_table))
+        else:
+            self.stdout.write(f'\nSkipping live index statistics: {connection.vendor} is not PostgreSQL.')
+
+        if findings and options['fail_on_findings']:
+            raise CommandError(f'{findings} removable index(es) found')
+
+    def _audit_postgres(self, connection, tables):
+        findings = 0
+        with connection.cursor() as cursor:
+            cursor.execute(STATS_RESET_SQL)
+            row = cursor.fetchone()
+            stats_reset = row[0] if row else None
+            cursor.execute(DUPLICATE_INDEXES_SQL, [tables])
+            duplicates = cursor.fetchall()
+            cursor.execute(INDEX_STATS_SQL, [tables])
+            stats = cursor.fetchall()
+
+        self.stdout.write(self.style.MIGRATE_HEADING('\nDatabase duplicates (identical definitions)'))
+        for table, names in duplicates:
+            findings += len(names) - 1
+            self.stdout.write(f"  {table}: {', '.join(names)}")
+        if not duplicates:
+            self.stdout.write('  None.')
+
+        per_table = defaultdict(list)
+        for row in stats:
+            per_table[row[0]].append(row)
+
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f"\nUnused indexes (idx_scan = 0 since {stats_reset or 'statistics were last reset'})"
+        ))
+        unused_total = 0
+        for table, rows in per_table.items():
+            # Every INSERT and every non-HOT UPDATE adds an entry to each index
+            writes = rows[0][5] + rows[0][6]
+            for _, name, scans, size, is_unique, _, _ in rows:
+                if scans or is_unique:
+                    continue
+                unused_total += 1
+                self.stdout.write(
+                    f"  {table}.{name}: {size / 1024:.0f} KiB, "
+                    f"{writes} index writes since reset, 1 of {len(rows)} index updates per INSERT "
+                    f"(~{100 / len(rows):.0f}% of index maintenance)"
+                )
+        if not unused_total:
+            self.stdout.write('  None.')
+        return findings + unused_total
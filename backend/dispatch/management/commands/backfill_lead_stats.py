@@ -0,0 +1,32 @@
+"""
+Management Command: Rebuild daily lead rollups
+Recomputes DailyLeadRollup from the lead tables, e.g. after deploying the
+rollup table or to repair drift from deletes and raw SQL edits.
+
+Usage:
+    python manage.py backfill_lead_stats
+    python manage.py backfill_lead_stats --since 2026-01-01 --until 2026-01-31
+"""
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from dispatch.services import LeadStatsService
+
+
+class Command(BaseCommand):
+    help = 'Rebuild daily lead rollups from the lead tables for a date range (default: all time).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--since', help='First day to rebuild (YYYY-MM-DD)')
+        parser.add_argument('--until', help='Last day to rebuild (YYYY-MM-DD)')
+
+    def handle(self, *args, **options):
+        try:
+            since = date.fromisoformat(options['since']) if options['since'] else None
+            until = date.fromisoformat(options['until']) if options['until'] else None
+        except ValueError as e:
+            raise CommandError(f'Invalid date: {e}')
+
+        written = LeadStatsService.backfill(since, until)
+        self.stdout.write(self.style.SUCCESS(f'Wrote {written} rollup rows'))
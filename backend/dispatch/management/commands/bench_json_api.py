@@ -0,0 +1,114 @@
+"""
+Management Command: Benchmark JSON API endpoints in-process
+Calls the list and submit views directly (no HTTP server, no middleware)
+with realistic payloads, inside a transaction that is rolled back, and
+reports requests per second per endpoint. Isolates the per-request CPU of
+parsing, serializing and rendering; run it once per configuration.
+
+Usage:
+    FAST_JSON_ENABLED=False COMPILED_RESPONSE_SERIALIZERS=False \\
+        python manage.py bench_json_api --requests 500 > before.txt
+    python manage.py bench_json_api --requests 500 > after.txt
+"""
+import json
+import statistics
+import time
+import uuid
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.settings import api_settings
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from dispatch import views
+from dispatch.management.commands.bench_lead_inserts import ROW_FACTORIES
+from dispatch.management.commands.bench_submit_load import ENDPOINTS as SUBMIT_PAYLOADS
+from dispatch.parsers import orjson
+
+PREFIX = '/api/v1/dispatch/'
+
+# name -> (method, view, view kwargs, path, payload factory for POSTs)
+ENDPOINTS = {
+    'list-contacts': ('get', views.list_leads, {'kind': 'contact'}, 'contacts/', None),
+    'list-signups': ('get', views.list_leads, {'kind': 'signup'}, 'signups/', None),
+    'list-claims': ('get', views.list_leads, {'kind': 'claim'}, 'claims/', None),
+    'list-career-applications': (
+        'get', views.list_leads, {'kind': 'career_application'}, 'career-applications/', None
+    ),
+    'submit-contact': ('post', views.submit_contact, {}, 'contact/', SUBMIT_PAYLOADS['contact'][1]),
+    'submit-signup': ('post', views.submit_signup, {}, 'signup/', SUBMIT_PAYLOADS['signup'][1]),
+    'submit-claim': ('post', views.submit_claim, {}, 'claim/', SUBMIT_PAYLOADS['claim'][1]),
+    'submit-career-application': (
+        'post', views.submit_career_application, {}, 'career-application/',
+        SUBMIT_PAYLOADS['career-application'][1],
+    ),
+}
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Measure requests/s of the JSON API views in-process (rolled back).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=500, help='Timed requests per endpoint')
+        parser.add_argument('--rows', type=int, default=200, help='Rows seeded per lead table for the list endpoints')
+        parser.add_argument('--limit', type=int, default=50, help='Page size for the list endpoints')
+        parser.add_argument('--endpoint', action='append', choices=sorted(ENDPOINTS),
+                            help='Endpoint to benchmark (repeatable, default: all)')
+
+    def handle(self, *args, **options):
+        if options['requests'] < 1:
+            raise CommandError('--requests must be at least 1')
+
+        renderers = ', '.join(cls.__name__ for cls in api_settings.DEFAULT_RENDERER_CLASSES)
+        self.stdout.write(
+            f"renderer: {renderers} | orjson: {'yes' if orjson else 'not installed'} | "
+            f"compiled serializers: {getattr(settings, 'COMPILED_RESPONSE_SERIALIZERS', True)}"
+        )
+        run_id = uuid.uuid4().hex[:8]
+        try:
+            with transaction.atomic():
+                for kind, (model, make_row) in ROW_FACTORIES.items():
+                    model.objects.bulk_create([make_row(f'{run_id}-seed-{n}') for n in range(options['rows'])])
+                for name in options['endpoint'] or ENDPOINTS:
+                    self._run(name, run_id, options)
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _run(self, name, run_id, options):
+        method, view, view_kwargs, path, make_payload = ENDPOINTS[name]
+        factory = APIRequestFactory()
+        staff = User(username='bench', is_staff=True, is_active=True)
+
+        def call(n):
+            if method == 'get':
+                request = factory.get(PREFIX + path, {'limit': options['limit']})
+                force_authenticate(request, user=staff)
+            else:
+                body = json.dumps(make_payload(f'{run_id}-{name}-{n}'))
+                request = factory.post(PREFIX + path, body, content_type='application/json')
+            started = time.perf_counter()
+            response = view(request, **view_kwargs)
+            response.render()
+            return time.perf_counter() - started, response.status_code
+
+        for n in range(min(20, options['requests'])):
+            call(f'warmup-{n}')
+        latencies, statuses = [], {}
+        for n in range(options['requests']):
+            latency, code = call(n)
+            latencies.append(latency)
+            statuses[code] = statuses.get(code, 0) + 1
+
+        latencies.sort()
+        self.stdout.write(
+            f"{name:>26}: {len(latencies) / sum(latencies):8.0f} req/s | "
+            f"mean {statistics.mean(latencies) * 1e6:7.0f}us "
+            f"p95 {latencies[max(int(len(latencies) * 0.95) - 1, 0)] * 1e6:7.0f}us | statuses {statuses}"
+        )
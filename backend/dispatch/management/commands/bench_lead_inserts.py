@@ -0,0 +1,88 @@
+"""
+Management Command: Benchmark single-row INSERTs into the lead tables
+Times one INSERT per row, the same statement shape the submit endpoints use,
+inside a transaction that is rolled back. Run it before and after an index
+migration to measure the write cost of the table's indexes.
+
+Usage:
+    python manage.py migrate dispatch 0014_partial_active_indexes
+    python manage.py bench_lead_inserts --rows 5000 > before.txt
+    python manage.py migrate dispatch 0015_drop_redundant_indexes
+    python manage.py bench_lead_inserts --rows 5000 > after.txt
+"""
+import statistics
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from dispatch.models import Contact, Signup, Claim, CareerApplication
+
+ROW_FACTORIES = {
+    'contact': (Contact, lambda n: Contact(
+        first_name='Bench', last_name=f'Row {n}', email=f'bench-{n}@example.com',
+        phone='555-555-5555', message='Benchmark contact submission.',
+    )),
+    'signup': (Signup, lambda n: Signup(
+        signup_type='owner-operator', owner_name=f'Bench Row {n}', owner_email=f'owner-{n}@example.com',
+        owner_contact_number='5555555555', motor_carrier_no='MC123', number_of_trucks='1',
+        truck_type='Dry Van', communication_method='email', email=f'bench-{n}@example.com',
+    )),
+    'claim': (Claim, lambda n: Claim(
+        full_name=f'Bench Row {n}', email=f'bench-{n}@example.com', company_name=f'Bench Co {n}',
+        age_of_mc_authority=2,
+    )),
+    'career_application': (CareerApplication, lambda n: CareerApplication(
+        full_name=f'Bench Row {n}', email=f'bench-{n}@example.com', phone='555-555-5555',
+        position_type='remote',
+    )),
+}
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Time single-row INSERTs into each lead table (rolled back) and show its index count.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=2000)
+        parser.add_argument('--kind', action='append', choices=sorted(ROW_FACTORIES),
+                            help='Lead table to benchmark (repeatable, default: all)')
+
+    def handle(self, *args, **options):
+        if options['rows'] < 1:
+            raise CommandError('--rows must be at least 1')
+        run_id = uuid.uuid4().hex[:8]
+        for kind in options['kind'] or sorted(ROW_FACTORIES):
+            model, make_row = ROW_FACTORIES[kind]
+            self._run(kind, model, make_row, run_id, options['rows'])
+
+    def _index_count(self, model):
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, model._meta.db_table)
+        return sum(1 for constraint in constraints.values() if constraint['index'])
+
+    def _run(self, kind, model, make_row, run_id, rows):
+        latencies = []
+        try:
+            with transaction.atomic():
+                for n in range(rows):
+                    row = make_row(f'{run_id}-{n}')
+                    started = time.perf_counter()
+                    # bulk_create issues a bare INSERT: no post_save receivers in the timing
+                    model.objects.bulk_create([row])
+                    latencies.append(time.perf_counter() - started)
+                raise _Rollback
+        except _Rollback:
+            pass
+
+        latencies.sort()
+        total = sum(latencies)
+        self.stdout.write(
+            f"{kind:>18}: {self._index_count(model):2d} indexes | {rows / total:8.0f} rows/s | "
+            f"mean {statistics.mean(latencies) * 1e6:7.0f}us "
+            f"p95 {latencies[max(int(len(latencies) * 0.95) - 1, 0)] * 1e6:7.0f}us"
+        )
@@ -0,0 +1,85 @@
+"""
+Management Command: Benchmark pooled vs per-message SMTP delivery
+Starts a local aiosmtpd sink (or uses --host/--port) and compares the
+throughput of opening a new session per message against the shared pool.
+
+Usage:
+    python manage.py bench_smtp_pool --messages 500 --concurrency 4
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.mail import EmailMessage, get_connection
+from django.core.management.base import BaseCommand, CommandError
+
+from dispatch.smtp_pool import SMTPConnectionPool
+
+SMTP_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+
+
+class _SinkHandler:
+    """aiosmtpd handler that accepts and discards every message."""
+
+    async def handle_DATA(self, server, session, envelope):
+        return '250 OK'
+
+
+class Command(BaseCommand):
+    help = 'Benchmark SMTP throughput with and without the connection pool.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--messages', type=int, default=500)
+        parser.add_argument('--concurrency', type=int, default=4)
+        parser.add_argument('--host', default=None, help='Existing SMTP server (default: start a local aiosmtpd sink)')
+        parser.add_argument('--port', type=int, default=8025)
+
+    def handle(self, *args, **options):
+        controller = None
+        host, port = options['host'], options['port']
+        if host is None:
+            try:
+                from aiosmtpd.controller import Controller
+            except ImportError:
+                raise CommandError('aiosmtpd is required for the local SMTP sink (pip install aiosmtpd), or pass --host.')
+            host = '127.0.0.1'
+            controller = Controller(_SinkHandler(), hostname=host, port=port)
+            controller.start()
+
+        backend_kwargs = {
+            'host': host,
+            'port': port,
+            'username': '',
+            'password': '',
+            'use_tls': False,
+            'use_ssl': False,
+        }
+        count, concurrency = options['messages'], options['concurrency']
+        messages = [
+            EmailMessage(f'Benchmark {i}', 'body', 'bench@example.com', ['sink@example.com'])
+            for i in range(count)
+        ]
+
+        try:
+            def unpooled(message):
+                return get_connection(backend=SMTP_BACKEND, **backend_kwargs).send_messages([message])
+
+            pool = SMTPConnectionPool(size=concurrency, backend=SMTP_BACKEND, **backend_kwargs)
+
+            def pooled(message):
+                return pool.send_messages([message])
+
+            results = {}
+            for label, sender in (('per-message connection', unpooled), ('pooled connection', pooled)):
+                started = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                    sent = sum(executor.map(sender, messages))
+                elapsed = time.perf_counter() - started
+                results[label] = sent / elapsed
+                self.stdout.write(f"{label:>24}: {sent} msgs in {elapsed:.2f}s ({sent / elapsed:.0f} msg/s)")
+            pool.close_all()
+
+            speedup = results['pooled connection'] / results['per-message connection']
+            self.stdout.write(self.style.SUCCESS(f"Pooled speedup: {speedup:.1f}x"))
+        finally:
+            if controller is not None:
+                controller.stop()
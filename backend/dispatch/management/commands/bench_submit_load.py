@@ -0,0 +1,111 @@
+"""
+Management Command: Load-test the submit endpoints of a running server
+Used to compare WSGI (sync views) against ASGI (async views) throughput.
+
+Usage:
+    # Terminal 1 - WSGI with sync views
+    gunicorn core.wsgi -w 1 --threads 8 -b 127.0.0.1:8001
+    # Terminal 2 - ASGI with async views
+    DISPATCH_ASYNC_VIEWS=True uvicorn core.asgi:application --workers 1 --port 8002
+
+    python manage.py bench_submit_load \\
+        --target wsgi=http://127.0.0.1:8001 --target asgi=http://127.0.0.1:8002 \\
+        --endpoint claim --requests 2000 --concurrency 200
+"""
+import http.client
+import json
+import statistics
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+
+ENDPOINTS = {
+    'contact': ('contact/', lambda n: {
+        'first_name': 'Load', 'last_name': f'Test {n}', 'email': f'load-{n}@example.com',
+        'message': 'Load test contact submission.',
+    }),
+    'claim': ('claim/', lambda n: {
+        'full_name': f'Load Test {n}', 'email': f'load-{n}@example.com', 'age_of_mc_authority': 2,
+    }),
+    'signup': ('signup/', lambda n: {
+        'signup_type': 'owner-operator', 'owner_name': f'Load Test {n}',
+        'owner_email': f'owner-{n}@example.com', 'owner_contact_number': '5555555555',
+        'motor_carrier_no': 'MC123', 'number_of_trucks': '1', 'truck_type': 'Dry Van',
+        'communication_method': 'email', 'email': f'load-{n}@example.com',
+    }),
+    'career-application': ('career-application/', lambda n: {
+        'full_name': f'Load Test {n}', 'email': f'load-{n}@example.com',
+        'phone': '555-555-5555', 'position_type': 'remote',
+    }),
+}
+
+
+class Command(BaseCommand):
+    help = 'Measure submit endpoint throughput and latency against one or more running servers.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--target', action='append', required=True,
+                            help='label=base_url, e.g. asgi=http://127.0.0.1:8002 (repeatable)')
+        parser.add_argument('--endpoint', choices=sorted(ENDPOINTS), default='claim')
+        parser.add_argument('--requests', type=int, default=1000)
+        parser.add_argument('--concurrency', type=int, default=50)
+        parser.add_argument('--prefix', default='/api/v1/dispatch/')
+
+    def handle(self, *args, **options):
+        targets = []
+        for target in options['target']:
+            label, sep, url = target.partition('=')
+            if not sep:
+                raise CommandError(f'Invalid --target "{target}"; expected label=url')
+            targets.append((label, url))
+
+        path, make_payload = ENDPOINTS[options['endpoint']]
+        run_id = uuid.uuid4().hex[:8]
+        for label, url in targets:
+            self._run(label, url, options['prefix'] + path, make_payload, run_id, options)
+
+    def _run(self, label, url, path, make_payload, run_id, options):
+        parts = urlsplit(url)
+        local = threading.local()
+        statuses = {}
+        lock = threading.Lock()
+
+        def connection():
+            # One keep-alive connection per client thread
+            if getattr(local, 'conn', None) is None:
+                local.conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=60)
+            return local.conn
+
+        def request(n):
+            body = json.dumps(make_payload(f'{label}-{run_id}-{n}'))
+            started = time.perf_counter()
+            try:
+                conn = connection()
+                conn.request('POST', path, body=body, headers={'Content-Type': 'application/json'})
+                response = conn.getresponse()
+                response.read()
+                code = response.status
+            except (OSError, http.client.HTTPException):
+                local.conn = None
+                code = 'error'
+            with lock:
+                statuses[code] = statuses.get(code, 0) + 1
+            return time.perf_counter() - started
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options['concurrency']) as executor:
+            latencies = sorted(executor.map(request, range(options['requests'])))
+        elapsed = time.perf_counter() - started
+
+        def pct(p):
+            return latencies[min(int(len(latencies) * p), len(latencies) - 1)] * 1000
+
+        self.stdout.write(
+            f"{label:>8}: {len(latencies) / elapsed:8.1f} req/s | "
+            f"p50 {pct(0.50):7.1f}ms p95 {pct(0.95):7.1f}ms p99 {pct(0.99):7.1f}ms "
+            f"mean {statistics.mean(latencies) * 1000:7.1f}ms | statuses {statuses}"
+        )
@@ -0,0 +1,86 @@
+"""
+Management Command: Benchmark per-request validation of the submit forms
+Validates the same payloads with the DRF create serializers (plus the
+service's build_*_data) and with the compiled validators, and reports the
+time per payload for each. No database access; both paths run in one
+invocation, valid and invalid payloads separately.
+
+Usage:
+    python manage.py bench_submit_validation --payloads 20000
+    python manage.py bench_submit_validation --kind signup --kind claim
+"""
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework import serializers
+
+from dispatch.management.commands.bench_submit_load import ENDPOINTS
+from dispatch.services import SignupSubmissionService, CareerApplicationSubmissionService
+from dispatch.validation import FORM_SERIALIZERS, FORM_VALIDATORS
+
+# Form kind -> (payload factory, build step after the DRF serializer)
+FORMS = {
+    'contact': (ENDPOINTS['contact'][1], None),
+    'claim': (ENDPOINTS['claim'][1], None),
+    'signup': (ENDPOINTS['signup'][1], SignupSubmissionService.build_signup_data),
+    'career_application': (
+        ENDPOINTS['career-application'][1], CareerApplicationSubmissionService.build_application_data
+    ),
+}
+
+# Applied to every other payload for the invalid run: one field error and one missing field
+INVALID_CHANGES = {
+    'contact': ({'email': 'not-an-email'}, 'message'),
+    'claim': ({'age_of_mc_authority': -1}, 'full_name'),
+    'signup': ({'owner_email': 'not-an-email'}, 'truck_type'),
+    'career_application': ({'phone': '12345'}, 'position_type'),
+}
+
+
+def _drf(serializer_class, build):
+    def validate(data):
+        serializer = serializer_class(data=data)
+        if not serializer.is_valid():
+            raise serializers.ValidationError(serializer.errors)
+        return build(serializer.validated_data) if build else serializer.validated_data
+    return validate
+
+
+class Command(BaseCommand):
+    help = 'Time per-payload validation of the submit forms: DRF serializers vs compiled validators.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--payloads', type=int, default=10000)
+        parser.add_argument('--kind', action='append', choices=sorted(FORMS),
+                            help='Form to benchmark (repeatable, default: all)')
+
+    def handle(self, *args, **options):
+        if options['payloads'] < 1:
+            raise CommandError('--payloads must be at least 1')
+        run_id = uuid.uuid4().hex[:8]
+        for kind in options['kind'] or sorted(FORMS):
+            make_payload, build = FORMS[kind]
+            valid = [make_payload(f'{run_id}-{n}') for n in range(options['payloads'])]
+            changes, missing = INVALID_CHANGES[kind]
+            invalid = [dict(payload, **changes) for payload in valid]
+            for payload in invalid:
+                payload.pop(missing, None)
+
+            for label, payloads in (('valid', valid), ('invalid', invalid)):
+                drf = self._time(_drf(FORM_SERIALIZERS[kind], build), payloads)
+                compiled = self._time(FORM_VALIDATORS[kind].validate, payloads)
+                self.stdout.write(
+                    f"{kind:>18} {label:>7}: drf {drf * 1e6:7.1f}us | compiled {compiled * 1e6:7.1f}us "
+                    f"| {drf / compiled:5.1f}x"
+                )
+
+    def _time(self, validate, payloads):
+        """Mean seconds per payload"""
+        started = time.perf_counter()
+        for payload in payloads:
+            try:
+                validate(payload)
+            except serializers.ValidationError:
+                pass
+        return (time.perf_counter() - started) / len(payloads)
@@ -0,0 +1,63 @@
+"""
+Management Command: Deliver queued email notifications
+Drains the email outbox with a pool of concurrent senders.
+
+Usage:
+    python manage.py deliver_outbox --workers 4 --batch-size 50
+    python manage.py deliver_outbox --once
+"""
+import signal
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from dispatch.services import EmailOutboxService
+
+
+class Command(BaseCommand):
+    help = 'Deliver pending email outbox messages with retries, backoff and dead-lettering.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=4, help='Number of concurrent senders')
+        parser.add_argument('--batch-size', type=int, default=50, help='Messages leased per poll')
+        parser.add_argument('--poll-interval', type=float, default=2.0, help='Seconds to sleep when the outbox is empty')
+        parser.add_argument('--once', action='store_true', help='Exit once no messages are due instead of polling')
+
+    def handle(self, *args, **options):
+        self._stopping = False
+        signal.signal(signal.SIGTERM, self._request_stop)
+        signal.signal(signal.SIGINT, self._request_stop)
+
+        workers = max(options['workers'], 1)
+        sent = failed = 0
+
+        self.stdout.write(f"Outbox worker started with {workers} sender(s)")
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='outbox') as executor:
+            while not self._stopping:
+                messages = EmailOutboxService.claim_batch(options['batch_size'])
+                if not messages:
+                    if options['once']:
+                        break
+                    time.sleep(options['poll_interval'])
+                    continue
+
+                for delivered in executor.map(self._deliver, messages):
+                    if delivered:
+                        sent += 1
+                    else:
+                        failed += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Outbox worker stopped: {sent} sent, {failed} failed"))
+
+    def _deliver(self, message) -> bool:
+        try:
+            return EmailOutboxService.deliver(message)
+        finally:
+            # Each sender thread holds its own DB connection
+            close_old_connections()
+
+    def _request_stop(self, signum, frame):
+        self.stdout.write('Stop requested; finishing current batch...')
+        self._stopping = True
@@ -0,0 +1,145 @@
+"""
+Management Command: Monthly range partitioning of the lead tables (PostgreSQL)
+Converts contacts, claims and career_applications into tables partitioned by
+month on created_at without a long lock (see dispatch/partitioning.py), keeps
+future partitions created ahead of time, and drops partitions past retention
+as a catalog change instead of a bulk DELETE.
+
+Usage:
+    python manage.py partition_leads status
+    python manage.py partition_leads convert --table contacts --cutover 2026-12-01
+    python manage.py partition_leads create                 # daily from cron
+    python manage.py partition_leads drop --before 2025-01-01            # list only
+    python manage.py partition_leads drop --before 2025-01-01 --confirm
+"""
+from datetime import date
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, connection, transaction
+from django.utils import timezone
+
+from dispatch import partitioning
+
+
+def _date(value):
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise CommandError(f"Invalid date '{value}', expected YYYY-MM-DD")
+
+
+class Command(BaseCommand):
+    help = 'Convert the lead tables to monthly partitions, create future partitions and drop old ones.'
+
+    def add_arguments(self, parser):
+        subparsers = parser.add_subparsers(dest='action', required=True)
+
+        def add(name, help_text):
+            subparser = subparsers.add_parser(name, help=help_text)
+            subparser.add_argument('--table', action='append', choices=sorted(partitioning.PARTITIONED_TABLES),
+                                   help='Table to process (repeatable, default: all)')
+            return subparser
+
+        add('status', 'Show partitions and estimated row counts')
+        convert = add('convert', 'Convert a plain table to a partitioned one')
+        convert.add_argument('--cutover', default=None,
+                             help='First day of the first monthly partition (default: start of next month)')
+        convert.add_argument('--months-ahead', type=int, default=None,
+                             help='Monthly partitions to create ahead (default: LEAD_PARTITION_MONTHS_AHEAD)')
+        create = add('create', 'Create the monthly partitions for the coming months')
+        create.add_argument('--months-ahead', type=int, default=None,
+                            help='Monthly partitions to create ahead (default: LEAD_PARTITION_MONTHS_AHEAD)')
+        drop = add('drop', 'Detach and drop partitions holding only rows older than --before')
+        drop.add_argument('--before', required=True, help='Drop partitions whose upper bound is on or before this date')
+        drop.add_argument('--confirm', action='store_true', help='Actually drop (default: list only)')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError(f'Partitioning requires PostgreSQL (database vendor is {connection.vendor}).')
+        months_ahead = options.get('months_ahead')
+        if months_ahead is None:
+            months_ahead = settings.LEAD_PARTITION_MONTHS_AHEAD
+        if months_ahead < 0:
+            raise CommandError('--months-ahead cannot be negative')
+        options['months_ahead'] = months_ahead
+
+        today = timezone.now().date()
+        tables = options['table'] or sorted(partitioning.PARTITIONED_TABLES)
+        handler = getattr(self, f"_{options['action']}")
+        for table in tables:
+            handler(table, today, options)
+
+    def _status(self, table, today, options):
+        with connection.cursor() as cursor:
+            if not partitioning.is_partitioned(cursor, table):
+                self.stdout.write(f'{table}: not partitioned')
+                return
+            partitions = partitioning.list_partitions(cursor, table)
+            estimates = partitioning.partition_row_estimates(cursor, table)
+        self.stdout.write(self.style.MIGRATE_HEADING(f'{table}: {len(partitions)} partition(s)'))
+        for name, expression, _ in partitions:
+            rows = estimates.get(name, -1)
+            self.stdout.write(f"  {name:<36} {'~' + str(rows) if rows >= 0 else '(not analyzed)':>14}  {expression}")
+
+    def _convert(self, table, today, options):
+        cutover = _date(options['cutover']) if options['cutover'] else partitioning.default_cutover(today)
+        if cutover.day != 1:
+            raise CommandError('--cutover must be the first day of a month')
+        if cutover <= today:
+            raise CommandError('--cutover must be in the future, so no rows land past the legacy partition')
+
+        model = apps.get_model(partitioning.PARTITIONED_TABLES[table])
+        auto_pk = model._meta.pk.get_internal_type() in partitioning.AUTO_PK_TYPES
+        with connection.cursor() as cursor:
+            if partitioning.is_partitioned(cursor, table):
+                self.stdout.write(f'{table}: already partitioned, skipping')
+                return
+
+            # Outside a transaction: CREATE INDEX CONCURRENTLY and VALIDATE must not hold locks for long
+            self.stdout.write(f'{table}: preparing (cutover {cutover:%Y-%m-%d})...')
+            for statement in partitioning.prepare(cursor, table, cutover, auto_pk):
+                self.stdout.write(f'  {statement}')
+
+            self.stdout.write(f'{table}: swapping...')
+            try:
+                with transaction.atomic():
+                    executed = partitioning.swap(cursor, table, cutover, auto_pk, options['months_ahead'], today)
+            except DatabaseError as e:
+                raise CommandError(
+                    f'{table}: swap rolled back ({e}). Nothing changed; re-run when the table is less busy.'
+                )
+        for statement in executed:
+            self.stdout.write(f'  {statement}')
+        self.stdout.write(self.style.SUCCESS(f'{table}: partitioned, legacy rows before {cutover:%Y-%m-%d}'))
+
+    def _create(self, table, today, options):
+        with connection.cursor() as cursor:
+            if not partitioning.is_partitioned(cursor, table):
+                self.stdout.write(f'{table}: not partitioned, nothing to do')
+                return
+            with transaction.atomic():
+                created = partitioning.ensure_partitions(cursor, table, today, options['months_ahead'])
+        if created:
+            self.stdout.write(self.style.SUCCESS(f"{table}: created {', '.join(created)}"))
+        else:
+            self.stdout.write(f'{table}: partitions already exist through {options["months_ahead"]} month(s) ahead')
+
+    def _drop(self, table, today, options):
+        before = _date(options['before'])
+        with connection.cursor() as cursor:
+            if not partitioning.is_partitioned(cursor, table):
+                self.stdout.write(f'{table}: not partitioned, nothing to do')
+                return
+            names = partitioning.droppable_partitions(cursor, table, before)
+            if not names:
+                self.stdout.write(f'{table}: no partitions entirely before {before:%Y-%m-%d}')
+                return
+            if not options['confirm']:
+                self.stdout.write(f"{table}: would drop {', '.join(names)} (pass --confirm)")
+                return
+            for name in names:
+                with transaction.atomic():
+                    partitioning.drop_partition(cursor, table, name)
+                self.stdout.write(self.style.SUCCESS(f'{table}: dropped {name}'))
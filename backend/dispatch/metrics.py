@@ -0,0 +1,462 @@
+"""
+Infrastructure Layer: Prometheus Metrics
+A small in-process metrics registry (counters and histograms) rendered in
+the Prometheus text exposition format at /metrics. Nothing external is
+needed: no client library, no push gateway, no StatsD.
+
+- MetricsMiddleware records per-view request counts, latency histograms,
+  error responses by the views' error_type, and DB queries per request
+  (through the timing module's query wrapper).
+- EmailOutboxService.deliver records email send latency (outbox worker).
+- Outbox depth is a gauge read from the database at scrape time.
+- Log records dropped by the log pipeline (log_pipeline.py) are counted.
+
+Off unless METRICS_ENABLED; outside DEBUG the endpoint also requires
+METRICS_TOKEN.
+
+Multi-process deployments (gunicorn workers, the outbox worker): set
+METRICS_MULTIPROC_DIR to a directory shared by the processes on a host
+and empty it when the service starts. Each process writes a snapshot of
+its metrics to <dir>/<pid>-<start time>.json every METRICS_FLUSH_INTERVAL
+seconds from a daemon thread (and at exit); the start time keeps a reused
+pid from overwriting an exited worker's file. A scrape, answered by any
+one process, sums the snapshots of all of them. Counters and histograms
+only ever grow, so a scrape folds the files of exited processes into
+<dir>/exited.json and removes them: their counts stay in the totals and
+the directory does not grow with worker restarts.
+"""
+import atexit
+import fcntl
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db.models import Count
+
+from . import log_pipeline, timing
+from .models import EmailOutbox
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200)
+
+
+class Counter:
+    """Monotonic counter per label values"""
+    kind = 'counter'
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, labels: Tuple[str, ...], amount: float = 1.0):
+        with _lock:
+            self.values[labels] = self.values.get(labels, 0.0) + amount
+
+    def snapshot(self) -> list:
+        return [[list(labels), value] for labels, value in self.values.items()]
+
+    @staticmethod
+    def merge(into: Dict[tuple, float], labels: tuple, value):
+        into[labels] = into.get(labels, 0.0) + value
+
+    def samples(self, values: Dict[tuple, float]) -> Iterable[str]:
+        for labels, value in sorted(values.items()):
+            yield f'{self.name}{_labels(self.labelnames, labels)} {_number(value)}'
+
+
+class Histogram:
+    """Bucketed observations per label values: [count per bucket..., +Inf count, sum]"""
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...], buckets: Tuple[float, ...]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = buckets
+        self.values: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, labels: Tuple[str, ...], value: float):
+        # Upper bounds are inclusive (le), so the first bucket >= value
+        index = bisect_left(self.buckets, value)
+        with _lock:
+            counts = self.values.get(labels)
+            if counts is None:
+                counts = self.values[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            counts[index] += 1
+            counts[-1] += value
+
+    def snapshot(self) -> list:
+        return [[list(labels), list(counts)] for labels, counts in self.values.items()]
+
+    @staticmethod
+    def merge(into: Dict[tuple, list], labels: tuple, counts: list):
+        current = into.get(labels)
+        if current is None or len(current) != len(counts):
+            into[labels] = list(counts)
+        else:
+            into[labels] = [a + b for a, b in zip(current, counts)]
+
+    def samples(self, values: Dict[tuple, list]) -> Iterable[str]:
+        for labels, counts in sorted(values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                bucket_labels = _labels(self.labelnames + ('le',), labels + (_number(bound),))
+                yield f'{self.name}_bucket{bucket_labels} {_number(cumulative)}'
+            yield f'{self.name}_sum{_labels(self.labelnames, labels)} {_number(counts[-1])}'
+            yield f'{self.name}_count{_labels(self.labelnames, labels)} {_number(cumulative)}'
+
+
+_lock = threading.Lock()
+
+HTTP_REQUESTS = Counter(
+    'dispatch_http_requests_total', 'HTTP requests by view, method and response status.',
+    ('view', 'method', 'status'),
+)
+HTTP_REQUEST_DURATION = Histogram(
+    'dispatch_http_request_duration_seconds', 'Time spent in the view and inner middleware.',
+    ('view', 'method'), LATENCY_BUCKETS,
+)
+HTTP_ERRORS = Counter(
+    'dispatch_http_errors_total', 'Error responses (4xx/5xx) by view, status and the error_type the view reported.',
+    ('view', 'status', 'error_type'),
+)
+DB_QUERIES = Counter(
+    'dispatch_db_queries_total', 'SQL queries executed while handling requests.', ('view',),
+)
+DB_QUERY_SECONDS = Counter(
+    'dispatch_db_query_seconds_total', 'Time spent in SQL queries while handling requests.', ('view',),
+)
+DB_QUERIES_PER_REQUEST = Histogram(
+    'dispatch_db_queries_per_request', 'SQL queries per request.', ('view',), QUERY_COUNT_BUCKETS,
+)
+EMAIL_SEND_DURATION = Histogram(
+    'dispatch_email_send_duration_seconds', 'Email send latency by outbox message kind and result.',
+    ('kind', 'result'), LATENCY_BUCKETS,
+)
+
+LOG_RECORDS_DROPPED = Counter(
+    'dispatch_log_records_dropped_total', 'Log records dropped because the log queue was full.', (),
+)
+
+METRICS = (
+    HTTP_REQUESTS, HTTP_REQUEST_DURATION, HTTP_ERRORS,
+    DB_QUERIES, DB_QUERY_SECONDS, DB_QUERIES_PER_REQUEST,
+    EMAIL_SEND_DURATION, LOG_RECORDS_DROPPED,
+)
+
+
+def is_enabled() -> bool:
+    return getattr(settings, 'METRICS_ENABLED', False)
+
+
+# ---------------------------------------------------------------------------
+# Multi-process snapshots
+# ---------------------------------------------------------------------------
+
+EXITED_FILENAME = 'exited.json'
+LOCK_FILENAME = '.lock'
+
+_flusher_started = False
+_started = time.time_ns()
+
+
+def _multiproc_dir() -> Optional[str]:
+    return getattr(settings, 'METRICS_MULTIPROC_DIR', '') or None
+
+
+def _snapshot() -> dict:
+    with _lock:
+        # Kept by the log pipeline itself, which loads before the apps
+        LOG_RECORDS_DROPPED.values[()] = float(log_pipeline.dropped())
+        return {metric.name: metric.snapshot() for metric in METRICS}
+
+
+def flush():
+    """Write this process's snapshot to the multi-process directory"""
+    directory = _multiproc_dir()
+    if directory is None:
+        return
+    path = os.path.join(directory, f'{os.getpid()}-{_started}.json')
+    temporary = f'{path}.tmp'
+    try:
+        with open(temporary, 'w') as handle:
+            json.dump(_snapshot(), handle, separators=(',', ':'))
+        os.replace(temporary, path)
+    except OSError:
+        logger.warning('Could not write metrics snapshot to %s', path, exc_info=True)
+
+
+def _flush_periodically():
+    interval = getattr(settings, 'METRICS_FLUSH_INTERVAL', 5)
+    while True:
+        time.sleep(interval)
+        flush()
+
+
+def ensure_flusher():
+    """Start the snapshot thread in this process"""
+    global _flusher_started
+    if _flusher_started or _multiproc_dir() is None:
+        return
+    with _lock:
+        if _flusher_started:
+            return
+        _flusher_started = True
+    threading.Thread(target=_flush_periodically, name='metrics-flush', daemon=True).start()
+    atexit.register(flush)
+
+
+def _after_fork():
+    """A forked worker starts empty, with its own snapshot file and thread"""
+    global _flusher_started, _lock, _started
+    _lock = threading.Lock()
+    _flusher_started = False
+    _started = time.time_ns()
+    for metric in METRICS:
+        metric.values.clear()
+
+
+os.register_at_fork(after_in_child=_after_fork)
+
+
+def _process_alive(filename: str) -> bool:
+    """Whether the process that writes this snapshot file is still running"""
+    pid = filename.split('-', 1)[0]
+    if not pid.isdigit():
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _read(path: str) -> Optional[dict]:
+    try:
+        with open(path) as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        # Removed or replaced while listing; its next flush is picked up on the next scrape
+        return None
+
+
+def _merge(snapshots: Iterable[dict]) -> Dict[str, dict]:
+    merged = {metric.name: {} for metric in METRICS}
+    by_name = {metric.name: metric for metric in METRICS}
+    for snapshot in snapshots:
+        for name, samples in snapshot.items():
+            metric = by_name.get(name)
+            if metric is None:
+                continue
+            for labels, value in samples:
+                metric.merge(merged[name], tuple(labels), value)
+    return merged
+
+
+def _exited_snapshots(directory: str) -> List[str]:
+    return [
+        name for name in os.listdir(directory)
+        if name.endswith('.json') and name != EXITED_FILENAME and not _process_alive(name)
+    ]
+
+
+def _retire_exited(directory: str):
+    """
+    Fold the snapshots of exited processes into exited.json and remove them
+
+    Runs under the directory's exclusive lock, so concurrent scrapes
+    neither fold a file twice nor read it and exited.json mid-way.
+    """
+    exited_path = os.path.join(directory, EXITED_FILENAME)
+    snapshots = [_read(exited_path) or {}]
+    retired = []
+    for filename in _exited_snapshots(directory):
+        snapshot = _read(os.path.join(directory, filename))
+        if snapshot is not None:
+            snapshots.append(snapshot)
+            retired.append(filename)
+    if not retired:
+        return
+    merged = _merge(snapshots)
+    exited = {name: [[list(labels), value] for labels, value in values.items()] for name, values in merged.items()}
+    temporary = f'{exited_path}.tmp'
+    try:
+        with open(temporary, 'w') as handle:
+            json.dump(exited, handle, separators=(',', ':'))
+        os.replace(temporary, exited_path)
+        for filename in retired:
+            os.remove(os.path.join(directory, filename))
+    except OSError:
+        logger.warning('Could not fold exited metrics snapshots into %s', exited_path, exc_info=True)
+
+
+def _collect() -> Dict[str, dict]:
+    """Merged values per metric name: this process, or all processes' snapshots"""
+    directory = _multiproc_dir()
+    if directory is None:
+        return _merge([_snapshot()])
+    flush()
+    with open(os.path.join(directory, LOCK_FILENAME), 'a') as lock:
+        retire = bool(_exited_snapshots(directory))
+        fcntl.flock(lock, fcntl.LOCK_EX if retire else fcntl.LOCK_SH)
+        try:
+            if retire:
+                _retire_exited(directory)
+            filenames = [name for name in os.listdir(directory) if name.endswith('.json')]
+            snapshots = [_read(os.path.join(directory, name)) for name in filenames]
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+    return _merge(snapshot for snapshot in snapshots if snapshot is not None)
+
+
+# ---------------------------------------------------------------------------
+# Exposition
+# ---------------------------------------------------------------------------
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', r'\\').replace('\n', r'\n').replace('"', r'\"')
+
+
+def _labels(names: Tuple[str, ...], values: Tuple[str, ...]) -> str:
+    if not names:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + '}'
+
+
+def _number(value) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+def _outbox_depth() -> List[str]:
+    statuses = (EmailOutbox.STATUS_PENDING, EmailOutbox.STATUS_SENDING, EmailOutbox.STATUS_DEAD)
+    counts = dict.fromkeys(statuses, 0)
+    try:
+        rows = (
+            EmailOutbox.objects.filter(status__in=statuses)
+            .values_list('status')
+            .annotate(total=Count('id'))
+            .order_by()
+        )
+        counts.update(dict(rows))
+    except Exception:
+        # A scrape must not fail because the database is unavailable
+        logger.warning('Could not read the email outbox depth', exc_info=True)
+        return []
+    lines = [
+        '# HELP dispatch_email_outbox_messages Email outbox messages not yet sent, by status.',
+        '# TYPE dispatch_email_outbox_messages gauge',
+    ]
+    lines += [f'dispatch_email_outbox_messages{{status="{status}"}} {count}' for status, count in counts.items()]
+    return lines
+
+
+def render() -> str:
+    """All metrics in the Prometheus text format"""
+    merged = _collect()
+    lines = []
+    for metric in METRICS:
+        lines.append(f'# HELP {metric.name} {metric.documentation}')
+        lines.append(f'# TYPE {metric.name} {metric.kind}')
+        lines.extend(metric.samples(merged[metric.name]))
+    lines.extend(_outbox_depth())
+    return '\n'.join(lines) + '\n'
+
+
+# ---------------------------------------------------------------------------
+# Request instrumentation
+# ---------------------------------------------------------------------------
+
+def _error_type(response) -> str:
+    """error_type from the view's error payload (DRF Response data or a JSON body), else ''"""
+    data = getattr(response, 'data', None)
+    if data is None and not response.streaming and response.get('Content-Type', '').startswith('application/json'):
+        try:
+            data = json.loads(response.content)
+        except ValueError:
+            data = None
+    if isinstance(data, dict):
+        return str(data.get('error_type', ''))
+    return ''
+
+
+def record_request(request, response, seconds: float, timer: timing.RequestTimer):
+    match = request.resolver_match
+    view = match.view_name if match else 'unmatched'
+    status = str(response.status_code)
+    HTTP_REQUESTS.inc((view, request.method, status))
+    HTTP_REQUEST_DURATION.observe((view, request.method), seconds)
+    if response.status_code >= 400:
+        HTTP_ERRORS.inc((view, status, _error_type(response)))
+    DB_QUERIES.inc((view,), timer.queries)
+    DB_QUERY_SECONDS.inc((view,), timer.phases.get('db', 0.0))
+    DB_QUERIES_PER_REQUEST.observe((view,), timer.queries)
+
+
+def record_email_send(kind: str, sent: bool, seconds: float):
+    if not is_enabled():
+        return
+    ensure_flusher()
+    EMAIL_SEND_DURATION.observe((kind, 'sent' if sent else 'failed'), seconds)
+
+
+class MetricsMiddleware:
+    """
+    Records request metrics (see module docstring)
+
+    Place it right after ServerTimingMiddleware; it shares that request's
+    timer, or starts its own for the query counts when timing is off.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not is_enabled():
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        ensure_flusher()
+        timer, token = timing.begin()
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            timing.end(token)
+        record_request(request, response, time.perf_counter() - started, timer)
+        return response
+
+    async def __acall__(self, request):
+        ensure_flusher()
+        timer, token = await timing.abegin()
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            timing.end(token)
+        record_request(request, response, time.perf_counter() - started, timer)
+        return response
@@ -0,0 +1,39 @@
+# Generated by Django 6.0.1 on 2026-10-18 12:41
+
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dispatch', '0008_add_career_application'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EmailOutbox',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, help_text='Unique identifier for the outbox message', primary_key=True, serialize=False)),
+                ('kind', models.CharField(choices=[('contact_notification', 'Contact Notification'), ('contact_confirmation', 'Contact Confirmation'), ('career_application_notification', 'Career Application Notification'), ('career_application_confirmation', 'Career Application Confirmation')], help_text='Type of email notification to deliver', max_length=50)),
+                ('payload', models.JSONField(help_text='Serialized submission data used to render the email')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('sending', 'Sending'), ('sent', 'Sent'), ('dead', 'Dead Letter')], default='pending', max_length=20)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('max_attempts', models.PositiveIntegerField(default=8)),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('locked_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Email Outbox Message',
+                'verbose_name_plural': 'Email Outbox Messages',
+                'db_table': 'email_outbox',
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='email_outbo_status_c5a6aa_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,74 @@
+# Generated by Django 6.0.1 on 2026-10-18 13:02
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+# Duplicate groups listed in the error before it is truncated
+MAX_REPORTED_DUPLICATES = 50
+
+
+def normalize_signup_emails(apps, schema_editor):
+    """Lowercase stored emails so they match what the submission service writes"""
+    Signup = apps.get_model('dispatch', 'Signup')
+    for field in ('email', 'company_email', 'owner_email'):
+        Signup.objects.exclude(**{field: None}).exclude(**{field: Lower(field)}).update(**{field: Lower(field)})
+
+
+def check_duplicate_signup_emails(apps, schema_editor):
+    """
+    Stop before adding the constraints if (lowercased) emails are already shared
+
+    Which signup to keep is a business decision, so duplicates are not
+    merged or cleared here; the error lists them (oldest first) so they can
+    be resolved in the admin or the shell before running migrate again.
+    Nothing is changed: the migration's transaction rolls back.
+    """
+    Signup = apps.get_model('dispatch', 'Signup')
+    duplicates = []
+    for field in ('email', 'company_email', 'owner_email'):
+        shared = (
+            Signup.objects.exclude(**{field: None}).values(field)
+            .annotate(rows=Count('id')).filter(rows__gt=1).order_by(field)
+            .values_list(field, flat=True)
+        )
+        for value in shared:
+            rows = Signup.objects.filter(**{field: value}).order_by('created_at').values_list('id', 'created_at')
+            signups = ', '.join(f'{pk} ({created_at:%Y-%m-%d})' for pk, created_at in rows)
+            duplicates.append(f'  {field}={value}: {signups}')
+    if not duplicates:
+        return
+
+    listed = duplicates[:MAX_REPORTED_DUPLICATES]
+    if len(duplicates) > len(listed):
+        listed.append(f'  ... and {len(duplicates) - len(listed)} more')
+    raise RuntimeError(
+        f'Cannot add the case-insensitive unique email constraints: {len(duplicates)} email(s) are shared '
+        f'by several signups. Merge or delete the extra signups (or clear their company_email/owner_email), '
+        f'then run migrate again.\n' + '\n'.join(listed)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dispatch', '0009_email_outbox'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_signup_emails, migrations.RunPython.noop),
+        migrations.RunPython(check_duplicate_signup_emails, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='signup',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), name='signups_email_lower_uniq', violation_error_message='A signup with this email already exists.'),
+        ),
+        migrations.AddConstraint(
+            model_name='signup',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('company_email'), name='signups_company_email_lower_uniq', violation_error_message='A signup with this company email already exists.'),
+        ),
+        migrations.AddConstraint(
+            model_name='signup',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('owner_email'), name='signups_owner_email_lower_uniq', violation_error_message='A signup with this owner email already exists.'),
+        ),
+    ]
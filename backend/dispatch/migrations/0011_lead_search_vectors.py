@@ -0,0 +1,113 @@
+# Generated by Django 6.0.1 on 2026-10-18 13:20
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+# Columns folded into each table's search document, by rank weight.
+# 'A' holds names and identifiers, 'B' free text. Uses the 'english' config,
+# which must match FULL_TEXT_SEARCH_CONFIG in dispatch.models.
+SEARCH_DOCUMENTS = {
+    'contacts': {
+        'A': ['first_name', 'last_name', 'email', 'phone'],
+        'B': ['message'],
+    },
+    'signups': {
+        'A': ['company_name', 'owner_name', 'first_name', 'last_name', 'email',
+              'company_email', 'owner_email', 'motor_carrier_no'],
+        'B': ['truck_type', 'operation_area'],
+    },
+    'claims': {
+        'A': ['full_name', 'email', 'phone', 'company_name'],
+        'B': ['preferred_route'],
+    },
+    'career_applications': {
+        'A': ['full_name', 'email', 'phone'],
+        'B': ['city_state', 'job_title', 'cover_note', 'notes'],
+    },
+}
+
+
+def _document_sql(weights):
+    parts = []
+    for weight, columns in weights.items():
+        text = " || ' ' || ".join(f"coalesce(NEW.{column}, '')" for column in columns)
+        parts.append(f"setweight(to_tsvector('english', {text}), '{weight}')")
+    return ' || '.join(parts)
+
+
+def search_trigger_sql(table, weights):
+    columns = ', '.join(column for group in weights.values() for column in group)
+    first_column = next(iter(weights.values()))[0]
+    return f"""
+        CREATE OR REPLACE FUNCTION {table}_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := {_document_sql(weights)};
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql;
+
+        CREATE TRIGGER {table}_search_vector_trigger
+            BEFORE INSERT OR UPDATE OF {columns} ON {table}
+            FOR EACH ROW EXECUTE FUNCTION {table}_search_vector_update();
+
+        -- Backfill existing rows through the trigger
+        UPDATE {table} SET {first_column} = {first_column};
+    """
+
+
+def drop_search_trigger_sql(table):
+    return f"""
+        DROP TRIGGER IF EXISTS {table}_search_vector_trigger ON {table};
+        DROP FUNCTION IF EXISTS {table}_search_vector_update();
+    """
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dispatch', '0010_signup_email_unique_constraints'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='careerapplication',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, help_text='Full-text search document, maintained by a database trigger', null=True),
+        ),
+        migrations.AddField(
+            model_name='claim',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, help_text='Full-text search document, maintained by a database trigger', null=True),
+        ),
+        migrations.AddField(
+            model_name='contact',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, help_text='Full-text search document, maintained by a database trigger', null=True),
+        ),
+        migrations.AddField(
+            model_name='signup',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, help_text='Full-text search document, maintained by a database trigger', null=True),
+        ),
+        *[
+            migrations.RunSQL(search_trigger_sql(table, weights), drop_search_trigger_sql(table))
+            for table, weights in SEARCH_DOCUMENTS.items()
+        ],
+        migrations.AddIndex(
+            model_name='careerapplication',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='career_apps_search_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='claim',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='claims_search_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='contacts_search_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='signup',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='signups_search_gin'),
+        ),
+    ]
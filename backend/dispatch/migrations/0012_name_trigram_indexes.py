@@ -0,0 +1,32 @@
+# Generated by Django 6.0.1 on 2026-10-18 13:41
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dispatch', '0011_lead_search_vectors'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='claim',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['company_name'], name='claims_company_name_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='claim',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['full_name'], name='claims_full_name_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='signup',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['company_name'], name='signups_company_name_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='signup',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['owner_name'], name='signups_owner_name_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
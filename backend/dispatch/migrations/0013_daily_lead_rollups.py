@@ -0,0 +1,32 @@
+# Generated by Django 6.0.1 on 2026-10-18 14:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dispatch', '0012_name_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyLeadRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('lead_type', models.CharField(choices=[('contact', 'Contact'), ('claim', 'Claim'), ('signup', 'Signup'), ('career_application', 'Career Application')], max_length=30)),
+                ('signup_type', models.CharField(blank=True, default='', max_length=20)),
+                ('status', models.CharField(blank=True, default='', max_length=50)),
+                ('position_type', models.CharField(blank=True, default='', max_length=20)),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Daily Lead Rollup',
+                'verbose_name_plural': 'Daily Lead Rollups',
+                'db_table': 'daily_lead_rollups',
+                'ordering': ['-day', 'lead_type'],
+                'constraints': [models.UniqueConstraint(fields=('day', 'lead_type', 'signup_type', 'status', 'position_type'), name='daily_lead_rollups_bucket_uniq')],
+            },
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 6.0.1 on 2026-10-18 12:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dispatch', '0013_daily_lead_rollups'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='careerapplication',
+            index=models.Index(condition=models.Q(('is_archived', False)), fields=['-created_at'], name='career_apps_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='careerapplication',
+            index=models.Index(condition=models.Q(('is_archived', False), ('is_read', False)), fields=['-created_at'], name='career_apps_unread_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='careerapplication',
+            index=models.Index(condition=models.Q(('is_archived', False), ('status', 'pending')), fields=['-created_at'], name='career_apps_pending_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='claim',
+            index=models.Index(condition=models.Q(('is_archived', False)), fields=['-created_at'], name='claims_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='claim',
+            index=models.Index(condition=models.Q(('is_archived', False), ('is_read', False)), fields=['-created_at'], name='claims_unread_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(condition=models.Q(('is_archived', False)), fields=['-created_at'], name='contacts_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(condition=models.Q(('is_archived', False), ('is_read', False)), fields=['-created_at'], name='contacts_unread_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='signup',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-created_at'], name='signups_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='signup',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_approved', False)), fields=['-created_at'], name='signups_unapproved_idx'),
+        ),
+    ]
@@ -0,0 +1,156 @@
+# Generated by Django 6.0.1 on 2026-10-18 13:10
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dispatch', '0014_partial_active_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='careerapplication',
+            name='career_appl_positio_fe999e_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='careerapplication',
+            name='career_appl_status_bd587b_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='careerapplication',
+            name='career_appl_is_read_899764_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='claim',
+            name='claims_company_83bb8a_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='claim',
+            name='claims_is_read_209dcc_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='contact',
+            name='contacts_is_read_85f7de_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='signup',
+            name='signups_signup__085705_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='signup',
+            name='signups_is_appr_1eccf2_idx',
+        ),
+        migrations.AlterField(
+            model_name='careerapplication',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AlterField(
+            model_name='careerapplication',
+            name='email',
+            field=models.EmailField(max_length=255, validators=[django.core.validators.EmailValidator()]),
+        ),
+        migrations.AlterField(
+            model_name='careerapplication',
+            name='full_name',
+            field=models.CharField(max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='careerapplication',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending Review'), ('reviewing', 'Under Review'), ('interviewing', 'Interviewing'), ('accepted', 'Accepted'), ('rejected', 'Rejected')], default='pending', max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='claim',
+            name='company_name',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.AlterField(
+            model_name='claim',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AlterField(
+            model_name='claim',
+            name='email',
+            field=models.EmailField(max_length=255, validators=[django.core.validators.EmailValidator()]),
+        ),
+        migrations.AlterField(
+            model_name='claim',
+            name='full_name',
+            field=models.CharField(max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='contact',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AlterField(
+            model_name='contact',
+            name='email',
+            field=models.EmailField(max_length=255, validators=[django.core.validators.EmailValidator()]),
+        ),
+        migrations.AlterField(
+            model_name='contact',
+            name='first_name',
+            field=models.CharField(max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='contact',
+            name='last_name',
+            field=models.CharField(max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='signup',
+            name='company_email',
+            field=models.EmailField(blank=True, max_length=255, null=True, validators=[django.core.validators.EmailValidator()]),
+        ),
+        migrations.AlterField(
+            model_name='signup',
+            name='company_name',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.AlterField(
+            model_name='signup',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AlterField(
+            model_name='signup',
+            name='email',
+            field=models.EmailField(max_length=255, validators=[django.core.validators.EmailValidator()]),
+        ),
+        migrations.AlterField(
+            model_name='signup',
+            name='first_name',
+            field=models.CharField(blank=True, default='', max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='signup',
+            name='last_name',
+            field=models.CharField(blank=True, default='', max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='signup',
+            name='motor_carrier_no',
+            field=models.CharField(blank=True, max_length=50, null=True),
+        ),
+        migrations.AlterField(
+            model_name='signup',
+            name='owner_email',
+            field=models.EmailField(blank=True, max_length=255, null=True, validators=[django.core.validators.EmailValidator()]),
+        ),
+        migrations.AlterField(
+            model_name='signup',
+            name='owner_name',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.AlterField(
+            model_name='signup',
+            name='signup_type',
+            field=models.CharField(choices=[('company', 'Company'), ('owner-operator', 'Owner Operator')], max_length=20),
+        ),
+    ]
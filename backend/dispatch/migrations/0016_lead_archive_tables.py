@@ -0,0 +1,61 @@
+# Generated by Django 6.0.1 on 2026-10-18 13:40
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dispatch', '0015_drop_redundant_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedClaim',
+            fields=[
+                ('id', models.UUIDField(primary_key=True, serialize=False)),
+                ('full_name', models.CharField(max_length=255)),
+                ('email', models.EmailField(max_length=255)),
+                ('phone', models.CharField(blank=True, max_length=20, null=True)),
+                ('company_name', models.CharField(blank=True, max_length=255, null=True)),
+                ('preferred_route', models.CharField(blank=True, max_length=255, null=True)),
+                ('age_of_mc_authority', models.IntegerField()),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('is_read', models.BooleanField(default=False)),
+                ('is_archived', models.BooleanField(default=True)),
+                ('archived_at', models.DateTimeField(default=django.utils.timezone.now, help_text='When the row was moved out of the hot table')),
+            ],
+            options={
+                'verbose_name': 'Archived Claim Submission',
+                'verbose_name_plural': 'Archived Claim Submissions',
+                'db_table': 'claims_archive',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['-created_at'], name='claims_arch_created_e9e739_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedContact',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('first_name', models.CharField(max_length=100)),
+                ('last_name', models.CharField(max_length=100)),
+                ('email', models.EmailField(max_length=255)),
+                ('phone', models.CharField(blank=True, max_length=20, null=True)),
+                ('message', models.TextField()),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('is_read', models.BooleanField(default=False)),
+                ('is_archived', models.BooleanField(default=True)),
+                ('archived_at', models.DateTimeField(default=django.utils.timezone.now, help_text='When the row was moved out of the hot table')),
+            ],
+            options={
+                'verbose_name': 'Archived Contact Submission',
+                'verbose_name_plural': 'Archived Contact Submissions',
+                'db_table': 'contacts_archive',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['-created_at'], name='contacts_ar_created_ae83b0_idx')],
+            },
+        ),
+    ]
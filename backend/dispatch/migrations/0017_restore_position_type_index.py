@@ -0,0 +1,19 @@
+# Generated by Django 6.0.1 on 2026-10-18 13:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dispatch', '0016_lead_archive_tables'),
+    ]
+
+    # 0015 dropped this as covered by (status, position_type), but position_type
+    # is not a left prefix of that index, so filters on it alone need this one
+    operations = [
+        migrations.AddIndex(
+            model_name='careerapplication',
+            index=models.Index(fields=['position_type'], name='career_appl_positio_fe999e_idx'),
+        ),
+    ]
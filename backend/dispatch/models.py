@@ -1,6 +1,130 @@
-from django.db import models
+from datetime import timedelta
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, transaction
 from django.core.validators import EmailValidator
+from django.db.models import Case, Value, When
+from django.db.models.functions import Coalesce, Concat, Lower, NullIf, Trim
+from django.utils import timezone
 import uuid
+from .signals import career_applications_status_changed, lead_rows_updated
+
+# Text search configuration used by the search_vector triggers (migration 0011)
+FULL_TEXT_SEARCH_CONFIG = 'english'
+
+
+class TransitionQuerySet(models.QuerySet):
+    """
+    QuerySet: Bulk state transitions
+    Each transition selects the ids that actually change, then writes them
+    with a single UPDATE ... WHERE id IN (...), instead of one save() per row.
+    Transitions return the number of rows updated.
+    """
+
+    def _transition(self, pending_filter: dict, **changes) -> int:
+        """Apply `changes` to the rows matching `pending_filter`; announce the changed ids"""
+        pks = list(self.filter(**pending_filter).values_list('pk', flat=True))
+        if not pks:
+            return 0
+        changes['updated_at'] = timezone.now()
+        updated = self.model._default_manager.filter(pk__in=pks).update(**changes)
+        lead_rows_updated.send(sender=self.model, pks=pks, fields=list(changes))
+        return updated
+
+
+class LeadQuerySet(TransitionQuerySet):
+    """QuerySet: Bulk state transitions for contacts, claims and career applications"""
+
+    def mark_as_read(self) -> int:
+        """Bulk domain method: Mark unread rows as read"""
+        return self._transition({'is_read': False}, is_read=True)
+
+    def archive(self) -> int:
+        """Bulk domain method: Archive rows that are not archived yet"""
+        return self._transition({'is_archived': False}, is_archived=True)
+
+
+class SignupQuerySet(TransitionQuerySet):
+    """QuerySet: Bulk state transitions for signups"""
+
+    def approve(self) -> int:
+        """Bulk domain method: Approve signups that are not approved yet"""
+        return self._transition({'is_approved': False}, is_approved=True)
+
+    def deactivate(self) -> int:
+        """Bulk domain method: Deactivate active signups"""
+        return self._transition({'is_active': True}, is_active=False)
+
+
+class CareerApplicationQuerySet(LeadQuerySet):
+    """QuerySet: Bulk state transitions for career applications"""
+
+    def update_status(self, new_status: str, reviewed_by: str = None) -> int:
+        """
+        Bulk domain method: Set the status of every row (same rules as update_status)
+
+        reviewed_by/reviewed_at are stamped when a reviewer is given. Rows
+        whose status actually changed are announced through
+        career_applications_status_changed with their old status.
+        """
+        now = timezone.now()
+        changes = {'status': new_status, 'updated_at': now}
+        if reviewed_by:
+            changes.update(reviewed_by=reviewed_by, reviewed_at=now)
+
+        with transaction.atomic(using=self.db):
+            # Lock the rows so the old statuses stay accurate until the UPDATE
+            rows = list(
+                self.select_for_update()
+                .only('pk', 'status', 'created_at', 'position_type')
+                .order_by('pk')
+            )
+            if not rows:
+                return 0
+            pks = [row.pk for row in rows]
+            updated = self.model._default_manager.filter(pk__in=pks).update(**changes)
+            lead_rows_updated.send(sender=self.model, pks=pks, fields=list(changes))
+            changed = [row for row in rows if row.status != new_status]
+            if changed:
+                career_applications_status_changed.send(
+                    sender=self.model, instances=changed, new_status=new_status
+                )
+        return updated
+
+
+class ActiveManager(models.Manager):
+    """Manager: Unarchived rows (served by the model's partial "active" index)"""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(is_archived=False)
+
+
+class UnreadManager(models.Manager):
+    """Manager: Unarchived rows nobody has read yet (partial "unread" index)"""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(is_archived=False, is_read=False)
+
+
+class PendingManager(models.Manager):
+    """Manager: Unarchived rows still awaiting review (partial "pending" index)"""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(is_archived=False, status='pending')
+
+
+class ActiveSignupManager(models.Manager):
+    """Manager: Signups that have not been deactivated (partial "active" index)"""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(is_active=True)
+
+
+class AwaitingApprovalManager(models.Manager):
+    """Manager: Active signups not yet approved (partial "unapproved" index)"""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(is_active=True, is_approved=False)
 
 
 class Contact(models.Model):
@@ -8,19 +132,28 @@ class Contact(models.Model):
     Domain Entity: Contact Submission
     Represents a contact form submission from a user.
     """
-    first_name = models.CharField(max_length=100, db_index=True)
-    last_name = models.CharField(max_length=100, db_index=True)
+    first_name = models.CharField(max_length=100)
+    last_name = models.CharField(max_length=100)
     email = models.EmailField(
         max_length=255,
-        validators=[EmailValidator()],
-        db_index=True
+        validators=[EmailValidator()]
     )
     phone = models.CharField(max_length=20, blank=True, null=True)
     message = models.TextField()
-    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     is_read = models.BooleanField(default=False)
     is_archived = models.BooleanField(default=False)
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text="Full-text search document, maintained by a database trigger"
+    )
+
+    # `objects` stays first so it remains the default manager (admin, relations)
+    objects = LeadQuerySet.as_manager()
+    active = ActiveManager.from_queryset(LeadQuerySet)()
+    unread = UnreadManager.from_queryset(LeadQuerySet)()
 
     class Meta:
         db_table = 'contacts'
@@ -28,7 +161,12 @@ class Contact(models.Model):
         indexes = [
             models.Index(fields=['-created_at']),
             models.Index(fields=['email']),
-            models.Index(fields=['is_read', 'is_archived']),
+            GinIndex(fields=['search_vector'], name='contacts_search_gin'),
+            # Partial indexes sized to the live working set, not to archived history
+            models.Index(fields=['-created_at'], name='contacts_active_idx',
+                         condition=models.Q(is_archived=False)),
+            models.Index(fields=['-created_at'], name='contacts_unread_idx',
+                         condition=models.Q(is_archived=False, is_read=False)),
         ]
         verbose_name = 'Contact Submission'
         verbose_name_plural = 'Contact Submissions'
@@ -41,6 +179,11 @@ class Contact(models.Model):
         """Domain method: Get full name"""
         return f"{self.first_name} {self.last_name}".strip()
 
+    @staticmethod
+    def full_name_expression():
+        """Query expression: full_name computed in SQL (for annotate/order_by)"""
+        return Trim(Concat('first_name', Value(' '), 'last_name', output_field=models.CharField()))
+
     def mark_as_read(self):
         """Domain method: Mark contact as read"""
         self.is_read = True
@@ -69,66 +212,101 @@ class Signup(models.Model):
         ('owner-operator', 'Owner Operator'),
     ]
 
+    # Email columns that must be unique (case-insensitively), with the
+    # validation message reported when a submission collides with one
+    UNIQUE_EMAIL_FIELDS = {
+        'email': 'A signup with this email already exists.',
+        'company_email': 'A signup with this company email already exists.',
+        'owner_email': 'A signup with this owner email already exists.',
+    }
+
     signup_type = models.CharField(
         max_length=20,
-        choices=SIGNUP_TYPE_CHOICES,
-        db_index=True
+        choices=SIGNUP_TYPE_CHOICES
     )
     
     # Company/Owner fields (depending on signup_type)
-    company_name = models.CharField(max_length=255, blank=True, null=True, db_index=True)
-    owner_name = models.CharField(max_length=255, blank=True, null=True, db_index=True)
+    company_name = models.CharField(max_length=255, blank=True, null=True)
+    owner_name = models.CharField(max_length=255, blank=True, null=True)
     company_email = models.EmailField(
         max_length=255,
         blank=True,
         null=True,
-        validators=[EmailValidator()],
-        db_index=True
+        validators=[EmailValidator()]
     )
     owner_email = models.EmailField(
         max_length=255,
         blank=True,
         null=True,
-        validators=[EmailValidator()],
-        db_index=True
+        validators=[EmailValidator()]
     )
     company_contact_number = models.CharField(max_length=20, blank=True, null=True)
     owner_contact_number = models.CharField(max_length=20, blank=True, null=True)
     
     # Common fields
-    motor_carrier_no = models.CharField(max_length=50, blank=True, null=True, db_index=True)
+    motor_carrier_no = models.CharField(max_length=50, blank=True, null=True)
     authority_age = models.IntegerField(blank=True, null=True)
     number_of_trucks = models.CharField(max_length=50)
     truck_type = models.CharField(max_length=100)
     operation_area = models.CharField(max_length=100, blank=True, default='')
     
     # Contact Person Details (simplified form - some fields optional)
-    first_name = models.CharField(max_length=100, blank=True, default='', db_index=True)
-    last_name = models.CharField(max_length=100, blank=True, default='', db_index=True)
+    first_name = models.CharField(max_length=100, blank=True, default='')
+    last_name = models.CharField(max_length=100, blank=True, default='')
     contact_number = models.CharField(max_length=20, blank=True, default='')
     communication_method = models.CharField(max_length=50)
     email = models.EmailField(
         max_length=255,
-        validators=[EmailValidator()],
-        db_index=True
+        validators=[EmailValidator()]
     )
     
     # Metadata
-    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     is_approved = models.BooleanField(default=False)
     is_active = models.BooleanField(default=True)
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text="Full-text search document, maintained by a database trigger"
+    )
+
+    objects = SignupQuerySet.as_manager()
+    active = ActiveSignupManager.from_queryset(SignupQuerySet)()
+    awaiting_approval = AwaitingApprovalManager.from_queryset(SignupQuerySet)()
 
     class Meta:
         db_table = 'signups'
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['-created_at']),
-            models.Index(fields=['signup_type']),
             models.Index(fields=['email']),
             models.Index(fields=['company_email']),
             models.Index(fields=['owner_email']),
-            models.Index(fields=['is_approved', 'is_active']),
+            GinIndex(fields=['search_vector'], name='signups_search_gin'),
+            GinIndex(fields=['company_name'], opclasses=['gin_trgm_ops'], name='signups_company_name_trgm'),
+            GinIndex(fields=['owner_name'], opclasses=['gin_trgm_ops'], name='signups_owner_name_trgm'),
+            models.Index(fields=['-created_at'], name='signups_active_idx',
+                         condition=models.Q(is_active=True)),
+            models.Index(fields=['-created_at'], name='signups_unapproved_idx',
+                         condition=models.Q(is_active=True, is_approved=False)),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                Lower('email'),
+                name='signups_email_lower_uniq',
+                violation_error_message='A signup with this email already exists.',
+            ),
+            models.UniqueConstraint(
+                Lower('company_email'),
+                name='signups_company_email_lower_uniq',
+                violation_error_message='A signup with this company email already exists.',
+            ),
+            models.UniqueConstraint(
+                Lower('owner_email'),
+                name='signups_owner_email_lower_uniq',
+                violation_error_message='A signup with this owner email already exists.',
+            ),
         ]
         verbose_name = 'Signup Registration'
         verbose_name_plural = 'Signup Registrations'
@@ -140,6 +318,11 @@ class Signup(models.Model):
             return f"{self.owner_name} - {self.email}"
         return f"{self.first_name} {self.last_name} - {self.email}"
 
+    @staticmethod
+    def unique_email_constraint_name(field: str) -> str:
+        """Name of the unique constraint guarding the given email field"""
+        return f'signups_{field}_lower_uniq'
+
     @property
     def full_name(self):
         """Domain method: Get full name of contact person"""
@@ -161,6 +344,24 @@ class Signup(models.Model):
         else:
             return self.owner_name or ''
 
+    @staticmethod
+    def primary_email_expression():
+        """Query expression: primary_email computed in SQL (for annotate/order_by)"""
+        return Case(
+            When(signup_type='company', then=Coalesce(NullIf('company_email', Value('')), 'email')),
+            default=Coalesce(NullIf('owner_email', Value('')), 'email'),
+            output_field=models.EmailField(),
+        )
+
+    @staticmethod
+    def primary_name_expression():
+        """Query expression: primary_name computed in SQL (for annotate/order_by)"""
+        return Case(
+            When(signup_type='company', then=Coalesce('company_name', Value(''))),
+            default=Coalesce('owner_name', Value('')),
+            output_field=models.CharField(),
+        )
+
     @property
     def primary_contact_number(self):
         """Domain method: Get primary contact number based on signup type"""
@@ -192,22 +393,30 @@ class Claim(models.Model):
         help_text="Unique identifier for the claim"
     )
     
-    full_name = models.CharField(max_length=255, db_index=True)
+    full_name = models.CharField(max_length=255)
     email = models.EmailField(
         max_length=255,
-        validators=[EmailValidator()],
-        db_index=True
+        validators=[EmailValidator()]
     )
     phone = models.CharField(max_length=20, blank=True, null=True)
-    company_name = models.CharField(max_length=255, blank=True, null=True, db_index=True)
+    company_name = models.CharField(max_length=255, blank=True, null=True)
     preferred_route = models.CharField(max_length=255, blank=True, null=True)
     age_of_mc_authority = models.IntegerField()
     
     # Metadata
-    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     is_read = models.BooleanField(default=False)
     is_archived = models.BooleanField(default=False)
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text="Full-text search document, maintained by a database trigger"
+    )
+
+    objects = LeadQuerySet.as_manager()
+    active = ActiveManager.from_queryset(LeadQuerySet)()
+    unread = UnreadManager.from_queryset(LeadQuerySet)()
 
     class Meta:
         db_table = 'claims'
@@ -215,8 +424,13 @@ class Claim(models.Model):
         indexes = [
             models.Index(fields=['-created_at']),
             models.Index(fields=['email']),
-            models.Index(fields=['company_name']),
-            models.Index(fields=['is_read', 'is_archived']),
+            GinIndex(fields=['search_vector'], name='claims_search_gin'),
+            GinIndex(fields=['company_name'], opclasses=['gin_trgm_ops'], name='claims_company_name_trgm'),
+            GinIndex(fields=['full_name'], opclasses=['gin_trgm_ops'], name='claims_full_name_trgm'),
+            models.Index(fields=['-created_at'], name='claims_active_idx',
+                         condition=models.Q(is_archived=False)),
+            models.Index(fields=['-created_at'], name='claims_unread_idx',
+                         condition=models.Q(is_archived=False, is_read=False)),
         ]
         verbose_name = 'Claim Submission'
         verbose_name_plural = 'Claim Submissions'
@@ -253,11 +467,10 @@ class CareerApplication(models.Model):
     )
     
     # Applicant Information
-    full_name = models.CharField(max_length=255, db_index=True)
+    full_name = models.CharField(max_length=255)
     email = models.EmailField(
         max_length=255,
-        validators=[EmailValidator()],
-        db_index=True
+        validators=[EmailValidator()]
     )
     phone = models.CharField(max_length=20)
     city_state = models.CharField(max_length=255, blank=True, null=True)
@@ -293,18 +506,27 @@ class CareerApplication(models.Model):
             ('interviewing', 'Interviewing'),
             ('accepted', 'Accepted'),
             ('rejected', 'Rejected'),
-        ],
-        db_index=True
+        ]
     )
     
     # Metadata
-    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     is_read = models.BooleanField(default=False)
     is_archived = models.BooleanField(default=False)
     reviewed_by = models.CharField(max_length=255, blank=True, null=True)
     reviewed_at = models.DateTimeField(blank=True, null=True)
     notes = models.TextField(blank=True, null=True, help_text="Internal notes for HR team")
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text="Full-text search document, maintained by a database trigger"
+    )
+
+    objects = CareerApplicationQuerySet.as_manager()
+    active = ActiveManager.from_queryset(CareerApplicationQuerySet)()
+    unread = UnreadManager.from_queryset(CareerApplicationQuerySet)()
+    pending = PendingManager.from_queryset(CareerApplicationQuerySet)()
 
     class Meta:
         db_table = 'career_applications'
@@ -312,10 +534,17 @@ class CareerApplication(models.Model):
         indexes = [
             models.Index(fields=['-created_at']),
             models.Index(fields=['email']),
-            models.Index(fields=['position_type']),
-            models.Index(fields=['status']),
-            models.Index(fields=['is_read', 'is_archived']),
+            # status filters use the composite; position_type alone (admin
+            # list_filter, the list endpoint) needs its own index
             models.Index(fields=['status', 'position_type']),
+            models.Index(fields=['position_type']),
+            GinIndex(fields=['search_vector'], name='career_apps_search_gin'),
+            models.Index(fields=['-created_at'], name='career_apps_active_idx',
+                         condition=models.Q(is_archived=False)),
+            models.Index(fields=['-created_at'], name='career_apps_unread_idx',
+                         condition=models.Q(is_archived=False, is_read=False)),
+            models.Index(fields=['-created_at'], name='career_apps_pending_idx',
+                         condition=models.Q(is_archived=False, status='pending')),
         ]
         verbose_name = 'Career Application'
         verbose_name_plural = 'Career Applications'
@@ -355,3 +584,205 @@ class CareerApplication(models.Model):
     def is_active(self) -> bool:
         """Domain method: Check if application is active (not archived)"""
         return not self.is_archived
+
+
+class ArchivedContact(models.Model):
+    """
+    Domain Entity: Archived Contact Submission
+    Cold copy of an archived contact, moved out of `contacts` by the
+    archive_leads command. Same columns, without the search vector.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    first_name = models.CharField(max_length=100)
+    last_name = models.CharField(max_length=100)
+    email = models.EmailField(max_length=255)
+    phone = models.CharField(max_length=20, blank=True, null=True)
+    message = models.TextField()
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    is_read = models.BooleanField(default=False)
+    is_archived = models.BooleanField(default=True)
+    archived_at = models.DateTimeField(default=timezone.now, help_text="When the row was moved out of the hot table")
+
+    class Meta:
+        db_table = 'contacts_archive'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at']),
+        ]
+        verbose_name = 'Archived Contact Submission'
+        verbose_name_plural = 'Archived Contact Submissions'
+
+    def __str__(self):
+        return f"{self.first_name} {self.last_name} - {self.email}"
+
+    @property
+    def full_name(self):
+        """Domain method: Get full name"""
+        return f"{self.first_name} {self.last_name}".strip()
+
+
+class ArchivedClaim(models.Model):
+    """
+    Domain Entity: Archived Claim Submission
+    Cold copy of an archived claim, moved out of `claims` by the
+    archive_leads command. Same columns, without the search vector.
+    """
+    id = models.UUIDField(primary_key=True)
+    full_name = models.CharField(max_length=255)
+    email = models.EmailField(max_length=255)
+    phone = models.CharField(max_length=20, blank=True, null=True)
+    company_name = models.CharField(max_length=255, blank=True, null=True)
+    preferred_route = models.CharField(max_length=255, blank=True, null=True)
+    age_of_mc_authority = models.IntegerField()
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    is_read = models.BooleanField(default=False)
+    is_archived = models.BooleanField(default=True)
+    archived_at = models.DateTimeField(default=timezone.now, help_text="When the row was moved out of the hot table")
+
+    class Meta:
+        db_table = 'claims_archive'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at']),
+        ]
+        verbose_name = 'Archived Claim Submission'
+        verbose_name_plural = 'Archived Claim Submissions'
+
+    def __str__(self):
+        return f"{self.full_name} - {self.email}"
+
+
+class EmailOutbox(models.Model):
+    """
+    Domain Entity: Email Outbox Message
+    Represents a queued email notification written in the same transaction
+    as the submission that triggered it, delivered later by the outbox worker.
+    """
+    STATUS_PENDING = 'pending'
+    STATUS_SENDING = 'sending'
+    STATUS_SENT = 'sent'
+    STATUS_DEAD = 'dead'
+
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_SENDING, 'Sending'),
+        (STATUS_SENT, 'Sent'),
+        (STATUS_DEAD, 'Dead Letter'),
+    ]
+
+    KIND_CHOICES = [
+        ('contact_notification', 'Contact Notification'),
+        ('contact_confirmation', 'Contact Confirmation'),
+        ('career_application_notification', 'Career Application Notification'),
+        ('career_application_confirmation', 'Career Application Confirmation'),
+    ]
+
+    # last_error keeps '<ExceptionClass>: <message>' up to this many characters
+    LAST_ERROR_MAX_LENGTH = 2000
+
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False,
+        help_text="Unique identifier for the outbox message"
+    )
+    kind = models.CharField(
+        max_length=50,
+        choices=KIND_CHOICES,
+        help_text="Type of email notification to deliver"
+    )
+    payload = models.JSONField(help_text="Serialized submission data used to render the email")
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=8)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True, default='')
+
+    # Metadata
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    sent_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        db_table = 'email_outbox'
+        ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+        ]
+        verbose_name = 'Email Outbox Message'
+        verbose_name_plural = 'Email Outbox Messages'
+
+    def __str__(self):
+        return f"{self.get_kind_display()} ({self.get_status_display()}) - {self.id}"
+
+    def mark_sent(self):
+        """Domain method: Mark message as delivered"""
+        self.status = self.STATUS_SENT
+        self.sent_at = timezone.now()
+        self.locked_at = None
+        self.last_error = ''
+        self.save(update_fields=['status', 'sent_at', 'locked_at', 'last_error', 'updated_at'])
+
+    def mark_failed(self, error: str, retry_delay: timedelta):
+        """Domain method: Record a failed attempt, rescheduling or dead-lettering the message"""
+        self.last_error = error[:self.LAST_ERROR_MAX_LENGTH]
+        self.locked_at = None
+        if self.attempts >= self.max_attempts:
+            self.status = self.STATUS_DEAD
+        else:
+            self.status = self.STATUS_PENDING
+            self.next_attempt_at = timezone.now() + retry_delay
+        self.save(update_fields=['status', 'next_attempt_at', 'locked_at', 'last_error', 'updated_at'])
+
+    def requeue(self):
+        """Domain method: Return a dead-lettered message to the delivery queue"""
+        self.status = self.STATUS_PENDING
+        self.attempts = 0
+        self.next_attempt_at = timezone.now()
+        self.locked_at = None
+        self.save(update_fields=['status', 'attempts', 'next_attempt_at', 'locked_at', 'updated_at'])
+
+
+class DailyLeadRollup(models.Model):
+    """
+    Domain Entity: Daily Lead Rollup
+    Pre-aggregated count of leads created per day, lead type and segment.
+    Kept current incrementally on insert and status change so dashboards
+    read O(days) rows instead of scanning the lead tables.
+    """
+    LEAD_TYPE_CHOICES = [
+        ('contact', 'Contact'),
+        ('claim', 'Claim'),
+        ('signup', 'Signup'),
+        ('career_application', 'Career Application'),
+    ]
+
+    day = models.DateField()
+    lead_type = models.CharField(max_length=30, choices=LEAD_TYPE_CHOICES)
+    # Segment columns; blank when they do not apply to the lead type
+    signup_type = models.CharField(max_length=20, blank=True, default='')
+    status = models.CharField(max_length=50, blank=True, default='')
+    position_type = models.CharField(max_length=20, blank=True, default='')
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'daily_lead_rollups'
+        ordering = ['-day', 'lead_type']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['day', 'lead_type', 'signup_type', 'status', 'position_type'],
+                name='daily_lead_rollups_bucket_uniq',
+            ),
+        ]
+        verbose_name = 'Daily Lead Rollup'
+        verbose_name_plural = 'Daily Lead Rollups'
+
+    def __str__(self):
+        return f"{self.day} {self.lead_type}: {self.count}"
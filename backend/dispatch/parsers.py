@@ -0,0 +1,62 @@
+"""
+Presentation Layer: Request Parsers
+Additional DRF parsers for bulk submission payloads, and an orjson-backed
+JSON parser (orjson is optional; without it the stdlib json is used).
+"""
+import json
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, JSONParser
+
+from . import timing
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses ValueError, like json.JSONDecodeError
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+class FastJSONParser(JSONParser):
+    """
+    Drop-in JSONParser that decodes with orjson when it is installed.
+    Bodies in an encoding other than UTF-8 fall back to JSONParser.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        with timing.phase('parse'):
+            if orjson is None or encoding.lower().replace('-', '') != 'utf8':
+                return super().parse(stream, media_type, parser_context)
+            try:
+                return orjson.loads(stream.read())
+            except ValueError as exc:
+                raise ParseError(f'JSON parse error - {exc}')
+
+
+class NDJSONParser(BaseParser):
+    """
+    Parses newline-delimited JSON (one object per line) into a list.
+    Blank lines are ignored.
+    """
+    media_type = 'application/x-ndjson'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+
+        items = []
+        with timing.phase('parse'):
+            for line_number, raw_line in enumerate(stream, start=1):
+                line = raw_line.decode(encoding).strip()
+                if not line:
+                    continue
+                try:
+                    items.append(_loads(line))
+                except ValueError as exc:
+                    raise ParseError(f'NDJSON parse error on line {line_number} - {exc}')
+        return items
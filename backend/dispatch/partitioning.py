@@ -0,0 +1,297 @@
+"""
+Infrastructure Layer: Monthly Range Partitioning (PostgreSQL)
+Optional declarative partitioning of the lead tables on created_at, driven
+by `python manage.py partition_leads`.
+
+Online conversion of an existing table:
+  1. prepare (no long locks): a unique (id, created_at) index is built
+     CONCURRENTLY, and a range CHECK (created_at < cutover) is added NOT
+     VALID and then validated, which only blocks schema changes, not writes.
+  2. swap (one short transaction under lock_timeout): the table is renamed
+     to <table>_legacy, a partitioned <table> with the same columns, indexes
+     and triggers takes its place, and the legacy table is attached as the
+     partition for everything before the cutover. The validated CHECK lets
+     ATTACH skip its scan, and the legacy indexes are matched and attached
+     instead of rebuilt. Monthly partitions from the cutover on and a
+     DEFAULT partition (a safety net) are created empty.
+The legacy partition keeps taking writes until the cutover, then ages out
+and can be dropped like any monthly partition.
+
+Django keeps treating `id` as the primary key; in the database the key is
+(id, created_at), since PostgreSQL requires the partition key in every
+unique index. Table privileges are not copied; re-grant them after a swap.
+"""
+import re
+from datetime import date, datetime, timezone as dt_timezone
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+
+# Tables that may be partitioned, with the model label for their primary key
+PARTITIONED_TABLES = {
+    'contacts': 'dispatch.Contact',
+    'claims': 'dispatch.Claim',
+    'career_applications': 'dispatch.CareerApplication',
+}
+
+PARTITION_KEY = 'created_at'
+AUTO_PK_TYPES = ('AutoField', 'BigAutoField', 'SmallAutoField')
+
+_UPPER_BOUND = re.compile(r"TO \('([^']+)'\)")
+
+
+def month_start(value: date) -> date:
+    return value.replace(day=1)
+
+
+def add_months(value: date, months: int) -> date:
+    month = value.month - 1 + months
+    return date(value.year + month // 12, month % 12 + 1, 1)
+
+
+def bound(value: date) -> str:
+    """Partition bound literal: midnight UTC on the given day"""
+    return datetime(value.year, value.month, value.day, tzinfo=dt_timezone.utc).isoformat(sep=' ')
+
+
+def partition_name(table: str, start: date) -> str:
+    return f'{table}_p{start:%Y_%m}'
+
+
+def default_cutover(today: date) -> date:
+    """First day of next month, or of the month after when next month is under two days away"""
+    cutover = add_months(month_start(today), 1)
+    if (cutover - today).days < 2:
+        cutover = add_months(cutover, 1)
+    return cutover
+
+
+def lock_timeout_sql() -> str:
+    timeout = getattr(settings, 'LEAD_PARTITION_LOCK_TIMEOUT_MS', 3000)
+    return f"SET LOCAL lock_timeout = '{int(timeout)}ms'"
+
+
+# ---------------------------------------------------------------------------
+# Introspection
+# ---------------------------------------------------------------------------
+
+def is_partitioned(cursor, table: str) -> bool:
+    cursor.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", [table])
+    row = cursor.fetchone()
+    return bool(row) and row[0] == 'p'
+
+
+def list_partitions(cursor, table: str) -> List[Tuple[str, str, Optional[datetime]]]:
+    """(name, bound expression, upper bound or None) for each partition, oldest first"""
+    cursor.execute(
+        """
+        SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = to_regclass(%s)
+        """,
+        [table],
+    )
+    partitions = []
+    for name, expression in cursor.fetchall():
+        match = _UPPER_BOUND.search(expression)
+        upper = datetime.fromisoformat(match.group(1)) if match else None
+        partitions.append((name, expression, upper))
+    return sorted(partitions, key=lambda partition: (partition[2] is None, partition[2] or datetime.min))
+
+
+def partition_row_estimates(cursor, table: str) -> Dict[str, int]:
+    cursor.execute(
+        """
+        SELECT c.relname, c.reltuples::bigint
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = to_regclass(%s)
+        """,
+        [table],
+    )
+    return dict(cursor.fetchall())
+
+
+# ---------------------------------------------------------------------------
+# Future partitions and retention
+# ---------------------------------------------------------------------------
+
+def ensure_partitions(cursor, table: str, today: date, months_ahead: int) -> List[str]:
+    """
+    Create monthly partitions from the current month through `months_ahead`
+    months ahead, skipping ranges already covered. Returns the names created.
+    """
+    partitions = list_partitions(cursor, table)
+    covered_until = max((upper for _, _, upper in partitions if upper), default=None)
+    start = month_start(today)
+    if covered_until is not None and covered_until.date() > start:
+        start = covered_until.date()
+
+    created = []
+    last = add_months(month_start(today), months_ahead + 1)
+    while start < last:
+        end = add_months(start, 1)
+        name = partition_name(table, start)
+        cursor.execute(
+            f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{table}" '
+            f"FOR VALUES FROM ('{bound(start)}') TO ('{bound(end)}')"
+        )
+        created.append(name)
+        start = end
+    return created
+
+
+def droppable_partitions(cursor, table: str, before: date) -> List[str]:
+    """Range partitions whose rows are all older than `before` (never the DEFAULT partition)"""
+    limit = datetime(before.year, before.month, before.day, tzinfo=dt_timezone.utc)
+    return [name for name, _, upper in list_partitions(cursor, table) if upper and upper <= limit]
+
+
+def drop_partition(cursor, table: str, name: str):
+    """Detach and drop one partition: a catalog change, no row-by-row DELETE"""
+    cursor.execute(lock_timeout_sql())
+    cursor.execute(f'ALTER TABLE "{table}" DETACH PARTITION "{name}"')
+    cursor.execute(f'DROP TABLE "{name}"')
+
+
+# ---------------------------------------------------------------------------
+# Online conversion
+# ---------------------------------------------------------------------------
+
+def _names(table: str) -> Dict[str, str]:
+    return {
+        'legacy': f'{table}_legacy',
+        'key_index': f'{table}_id_created_at_key',
+        'range_check': f'{table}_legacy_range_check',
+        'sequence': f'{table}_partitioned_id_seq',
+        'default': f'{table}_pdefault',
+    }
+
+
+def prepare(cursor, table: str, cutover: date, auto_pk: bool) -> List[str]:
+    """
+    Preparation before the swap. Needs autocommit (CREATE INDEX CONCURRENTLY
+    cannot run in a transaction) and is safe to repeat.
+    Returns the statements executed.
+    """
+    names = _names(table)
+    executed = []
+
+    def run(sql):
+        cursor.execute(sql)
+        executed.append(sql)
+
+    # A failed concurrent build leaves an INVALID index behind; rebuild it
+    cursor.execute(
+        "SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(%s)", [names['key_index']]
+    )
+    row = cursor.fetchone()
+    if row and not row[0]:
+        run(f'DROP INDEX CONCURRENTLY "{names["key_index"]}"')
+    run(f'CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS "{names["key_index"]}" ON "{table}" (id, {PARTITION_KEY})')
+
+    run(f'ALTER TABLE "{table}" DROP CONSTRAINT IF EXISTS "{names["range_check"]}"')
+    run(
+        f'ALTER TABLE "{table}" ADD CONSTRAINT "{names["range_check"]}" '
+        f"CHECK ({PARTITION_KEY} < '{bound(cutover)}') NOT VALID"
+    )
+    # Validation scans the table but only blocks schema changes, not reads or writes
+    run(f'ALTER TABLE "{table}" VALIDATE CONSTRAINT "{names["range_check"]}"')
+    if auto_pk:
+        run(f'CREATE SEQUENCE IF NOT EXISTS "{names["sequence"]}" AS bigint')
+    return executed
+
+
+def _index_definitions(cursor, table: str) -> List[Tuple[str, str]]:
+    """(name, definition) of the table's secondary indexes, to recreate on the partitioned parent"""
+    cursor.execute(
+        """
+        SELECT ic.relname, pg_get_indexdef(i.indexrelid)
+        FROM pg_index i
+        JOIN pg_class ic ON ic.oid = i.indexrelid
+        WHERE i.indrelid = to_regclass(%s) AND NOT i.indisprimary AND NOT i.indisunique
+        ORDER BY ic.relname
+        """,
+        [table],
+    )
+    return cursor.fetchall()
+
+
+def _trigger_definitions(cursor, table: str) -> List[Tuple[str, str]]:
+    cursor.execute(
+        """
+        SELECT tgname, pg_get_triggerdef(oid)
+        FROM pg_trigger
+        WHERE tgrelid = to_regclass(%s) AND NOT tgisinternal
+        ORDER BY tgname
+        """,
+        [table],
+    )
+    return cursor.fetchall()
+
+
+def swap(cursor, table: str, cutover: date, auto_pk: bool, months_ahead: int, today: date) -> List[str]:
+    """
+    Replace `table` with a partitioned table, attaching the old one as the
+    partition for rows before `cutover`. Must run inside one transaction,
+    after prepare() with the same cutover.
+    Returns the statements executed (for the command's log).
+    """
+    names = _names(table)
+    legacy = names['legacy']
+    executed = []
+
+    def run(sql, params=None):
+        cursor.execute(sql, params)
+        executed.append(sql)
+
+    run(lock_timeout_sql())
+    run(f'LOCK TABLE "{table}" IN ACCESS EXCLUSIVE MODE')
+
+    indexes = _index_definitions(cursor, table)
+    triggers = _trigger_definitions(cursor, table)
+    cursor.execute(
+        "SELECT conname FROM pg_constraint WHERE conrelid = to_regclass(%s) AND contype = 'p'", [table]
+    )
+    primary_key = cursor.fetchone()[0]
+
+    # 1. Move the old table, its index names and its triggers out of the way.
+    # Its key becomes the prebuilt (id, created_at) index so ATTACH can match the parent's key.
+    run(f'ALTER TABLE "{table}" RENAME TO "{legacy}"')
+    run(f'ALTER TABLE "{legacy}" DROP CONSTRAINT "{primary_key}"')
+    run(f'ALTER TABLE "{legacy}" ADD CONSTRAINT "{legacy}_pkey" PRIMARY KEY USING INDEX "{names["key_index"]}"')
+    for name, _ in indexes:
+        run(f'ALTER INDEX "{name}" RENAME TO "{name[:56]}_legacy"')
+    for name, _ in triggers:
+        run(f'DROP TRIGGER "{name}" ON "{legacy}"')
+    if auto_pk:
+        # The identity sequence belongs to the old table; continue numbering in a new one
+        run(
+            f"SELECT setval('\"{names['sequence']}\"', "
+            f'(SELECT COALESCE(MAX(id), 0) + 1 FROM "{legacy}"), false)'
+        )
+        run(f'ALTER TABLE "{legacy}" ALTER COLUMN id DROP IDENTITY IF EXISTS')
+        run(f'ALTER TABLE "{legacy}" ALTER COLUMN id DROP DEFAULT')
+
+    # 2. Partitioned parent with the same columns, key, indexes and triggers
+    run(f'CREATE TABLE "{table}" (LIKE "{legacy}" INCLUDING DEFAULTS) PARTITION BY RANGE ({PARTITION_KEY})')
+    run(f'ALTER TABLE "{table}" ADD CONSTRAINT "{primary_key}" PRIMARY KEY (id, {PARTITION_KEY})')
+    if auto_pk:
+        run(f'''ALTER TABLE "{table}" ALTER COLUMN id SET DEFAULT nextval('"{names['sequence']}"')''')
+        run(f'ALTER SEQUENCE "{names["sequence"]}" OWNED BY "{table}".id')
+    for _, definition in indexes:
+        run(definition)
+    for _, definition in triggers:
+        run(definition)
+
+    # 3. Attach the old table (the validated CHECK makes this scan-free) and add new partitions
+    run(
+        f'ALTER TABLE "{table}" ATTACH PARTITION "{legacy}" '
+        f"FOR VALUES FROM (MINVALUE) TO ('{bound(cutover)}')"
+    )
+    run(f'ALTER TABLE "{legacy}" DROP CONSTRAINT "{names["range_check"]}"')
+    for name in ensure_partitions(cursor, table, today, months_ahead):
+        executed.append(f'-- created partition {name}')
+    run(f'CREATE TABLE "{names["default"]}" PARTITION OF "{table}" DEFAULT')
+    return executed
@@ -0,0 +1,237 @@
+"""
+Infrastructure Layer: Read-Through Query Cache
+Caches the single-row and list lookups of the *QueryService classes in the
+QUERY_CACHE_ALIAS cache (locmem by default, Redis when configured).
+
+- Rows are cached by primary key and invalidated precisely when that row is
+  saved or deleted (receivers.py), including through the domain methods
+  (mark_as_read, archive, update_status, ...), which all go through save().
+- Lookups by another field (e.g. email) cache only the matching primary key;
+  the row itself always comes from the by-id entry, so a field change can
+  never serve a stale row.
+- List results are keyed by a per-model generation that any write to that
+  model replaces, dropping every cached list for it at once.
+- Writes that bypass save() (queryset.update, bulk_create) are reported by
+  the lead_rows_updated / lead_rows_created signals instead.
+Hit/miss counts are kept per namespace for this process (see stats()).
+"""
+import logging
+import threading
+import uuid
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+# Stored for lookups that found nothing, so misses are cached too
+NOT_FOUND = '__query_cache_not_found__'
+
+# Fields that get_instance_by() may be called with; their keys are dropped on write
+LOOKUP_FIELDS = ('email',)
+
+_stats_lock = threading.Lock()
+_stats = defaultdict(lambda: {'hits': 0, 'misses': 0})
+
+
+def _cache():
+    return caches[getattr(settings, 'QUERY_CACHE_ALIAS', 'default')]
+
+
+def is_enabled() -> bool:
+    return getattr(settings, 'QUERY_CACHE_ENABLED', True)
+
+
+def _ttl(kind: str) -> int:
+    """Per-key timeout in seconds for 'row' or 'list' entries"""
+    if kind == 'list':
+        return getattr(settings, 'QUERY_CACHE_LIST_TTL', 60)
+    return getattr(settings, 'QUERY_CACHE_TTL', 300)
+
+
+def _key(model, *parts) -> str:
+    return ':'.join(['qc', model._meta.label_lower, *[str(part) for part in parts]])
+
+
+def _record(namespace: str, hit: bool):
+    with _stats_lock:
+        _stats[namespace]['hits' if hit else 'misses'] += 1
+
+
+def stats() -> Dict[str, Dict[str, Any]]:
+    """Hit/miss counters and hit ratio per namespace for this process"""
+    with _stats_lock:
+        snapshot = {namespace: dict(counts) for namespace, counts in _stats.items()}
+    for counts in snapshot.values():
+        total = counts['hits'] + counts['misses']
+        counts['hit_ratio'] = round(counts['hits'] / total, 4) if total else None
+    return snapshot
+
+
+def reset_stats():
+    with _stats_lock:
+        _stats.clear()
+
+
+def _load(model, **lookup):
+    try:
+        return model._default_manager.get(**lookup)
+    except model.DoesNotExist:
+        return None
+
+
+def get_instance(model, pk) -> Optional[Any]:
+    """
+    Read-through lookup of one row by primary key
+
+    Raises:
+        django.core.exceptions.ValidationError: If pk is not a valid key (same as .get())
+    """
+    if not is_enabled():
+        return _load(model, pk=pk)
+
+    # Canonical form, so e.g. upper- and lower-case UUIDs share one entry
+    pk = model._meta.pk.to_python(pk)
+    namespace = f'{model._meta.model_name}.by_id'
+    key = _key(model, 'id', pk)
+    cache = _cache()
+
+    cached = cache.get(key)
+    if cached is not None:
+        _record(namespace, hit=True)
+        return None if cached == NOT_FOUND else cached
+
+    _record(namespace, hit=False)
+    instance = _load(model, pk=pk)
+    cache.set(key, NOT_FOUND if instance is None else instance, timeout=_ttl('row'))
+    return instance
+
+
+def get_instance_by(model, field: str, value) -> Optional[Any]:
+    """
+    Read-through lookup of one row by an exact field match (see LOOKUP_FIELDS)
+
+    Raises:
+        MultipleObjectsReturned: If the field matches several rows (never cached)
+    """
+    if not is_enabled():
+        return _load(model, **{field: value})
+
+    namespace = f'{model._meta.model_name}.by_{field}'
+    key = _key(model, field, value)
+    cache = _cache()
+
+    cached_pk = cache.get(key)
+    if cached_pk == NOT_FOUND:
+        _record(namespace, hit=True)
+        return None
+    if cached_pk is not None:
+        instance = get_instance(model, cached_pk)
+        if instance is not None and getattr(instance, field) == value:
+            _record(namespace, hit=True)
+            return instance
+
+    _record(namespace, hit=False)
+    instance = _load(model, **{field: value})
+    cache.set(key, NOT_FOUND if instance is None else instance.pk, timeout=_ttl('row'))
+    return instance
+
+
+def _generation(model) -> str:
+    """Current list generation for a model, starting a new one if it was evicted"""
+    cache = _cache()
+    key = _key(model, 'generation')
+    generation = cache.get(key)
+    if generation is None:
+        generation = uuid.uuid4().hex
+        if not cache.add(key, generation, timeout=None):
+            generation = cache.get(key) or generation
+    return generation
+
+
+def get_list(model, name: str, loader: Callable[[], list], *args) -> list:
+    """
+    Read-through cache for a list query
+
+    Args:
+        model: Model the list is built from (its writes invalidate the entry)
+        name: Query name, used for the key and the hit/miss namespace
+        loader: Callable that runs the query and returns a list
+        *args: Query arguments that distinguish cache entries
+    """
+    if not is_enabled():
+        return loader()
+
+    namespace = f'{model._meta.model_name}.{name}'
+    key = _key(model, 'list', _generation(model), name, *args)
+    cache = _cache()
+
+    cached = cache.get(key)
+    if cached is not None:
+        _record(namespace, hit=True)
+        return cached
+
+    _record(namespace, hit=False)
+    rows = loader()
+    cache.set(key, rows, timeout=_ttl('list'))
+    return rows
+
+
+def _invalidate(model, pks: Iterable[Any], lookups: Iterable[tuple]):
+    cache = _cache()
+    keys = [_key(model, 'id', pk) for pk in pks]
+    keys += [_key(model, field, value) for field, value in lookups]
+    if keys:
+        cache.delete_many(keys)
+    cache.set(_key(model, 'generation'), uuid.uuid4().hex, timeout=None)
+
+
+def _invalidate_now_and_on_commit(model, pks: list, lookups: list):
+    _invalidate(model, pks, lookups)
+    # Drop again once the write is visible, in case a reader re-cached the old row meanwhile
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: _invalidate(model, pks, lookups))
+
+
+def invalidate_instance(instance):
+    """Drop the cached row, its field lookups and the model's cached lists"""
+    if not is_enabled():
+        return
+    model = type(instance)
+    lookups = [
+        (field, getattr(instance, field)) for field in LOOKUP_FIELDS
+        if hasattr(instance, field)
+    ]
+    _invalidate_now_and_on_commit(model, [instance.pk], lookups)
+
+
+def invalidate_rows(model, pks: Iterable[Any]):
+    """
+    Invalidate rows changed without save() (queryset.update, bulk_update)
+
+    Field lookup keys are left alone: they only hold primary keys and are
+    re-checked against the (now dropped) by-id entry.
+    """
+    if not is_enabled():
+        return
+    _invalidate_now_and_on_commit(model, list(pks), [])
+
+
+def invalidate_created(model, instances: Iterable[Any]):
+    """
+    Invalidate for rows inserted without save() (bulk_create)
+
+    Their field lookups may have cached NOT_FOUND before the insert, so
+    those keys are dropped along with the model's cached lists.
+    """
+    if not is_enabled():
+        return
+    instances = list(instances)
+    lookups = [
+        (field, getattr(instance, field)) for instance in instances for field in LOOKUP_FIELDS
+        if hasattr(instance, field)
+    ]
+    _invalidate_now_and_on_commit(model, [instance.pk for instance in instances], lookups)
@@ -0,0 +1,78 @@
+"""
+Signal Receivers
+Keeps derived data (daily rollups, the query cache) in step with lead
+inserts, updates and status changes. Connected in DispatchConfig.ready().
+"""
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from . import query_cache
+from .models import Contact, Signup, Claim, CareerApplication
+from .services import LeadStatsService
+from .signals import career_applications_status_changed, lead_rows_created, lead_rows_updated
+
+
+@receiver(post_save, sender=Contact)
+@receiver(post_save, sender=Signup)
+@receiver(post_save, sender=Claim)
+@receiver(post_save, sender=CareerApplication)
+def count_created_lead(sender, instance, created, raw=False, **kwargs):
+    """Add a newly inserted lead to its daily rollup bucket (bulk_create is counted by the caller)"""
+    if created and not raw:
+        LeadStatsService.record_created([instance])
+
+
+@receiver(pre_save, sender=Signup)
+@receiver(pre_save, sender=CareerApplication)
+def remember_stored_bucket(sender, instance, raw=False, update_fields=None, **kwargs):
+    """
+    Note the rollup bucket of a lead about to be updated (update_status, the
+    admin change form or any other save()), read from the stored row
+    """
+    if raw or instance._state.adding:
+        return
+    segments = LeadStatsService.ROLLUP_SOURCES[sender][1]
+    if update_fields is not None and not set(segments).intersection(update_fields):
+        # e.g. mark_as_read: no segment column is written
+        return
+    instance._stored_rollup_bucket = LeadStatsService.stored_bucket(instance)
+
+
+@receiver(post_save, sender=Signup)
+@receiver(post_save, sender=CareerApplication)
+def move_changed_bucket(sender, instance, created, raw=False, **kwargs):
+    """Move an updated lead to its new status/signup_type/position_type bucket on its creation day"""
+    old_bucket = instance.__dict__.pop('_stored_rollup_bucket', None)
+    if old_bucket is not None and not created and not raw:
+        LeadStatsService.record_bucket_change(instance, old_bucket)
+
+
+@receiver(career_applications_status_changed, sender=CareerApplication)
+def move_status_buckets(sender, instances, new_status, **kwargs):
+    """Move bulk-updated applications between status buckets"""
+    LeadStatsService.record_status_changes(instances, new_status)
+
+
+@receiver(post_save, sender=Contact)
+@receiver(post_save, sender=Signup)
+@receiver(post_save, sender=Claim)
+@receiver(post_save, sender=CareerApplication)
+@receiver(post_delete, sender=Contact)
+@receiver(post_delete, sender=Signup)
+@receiver(post_delete, sender=Claim)
+@receiver(post_delete, sender=CareerApplication)
+def invalidate_query_cache(sender, instance, **kwargs):
+    """Drop cached lookups for a lead that was written or deleted"""
+    query_cache.invalidate_instance(instance)
+
+
+@receiver(lead_rows_updated)
+def invalidate_updated_rows(sender, pks, **kwargs):
+    """Drop cached lookups for rows changed by a bulk transition"""
+    query_cache.invalidate_rows(sender, pks)
+
+
+@receiver(lead_rows_created)
+def invalidate_created_rows(sender, instances, **kwargs):
+    """Drop cached lookups and lists made stale by a bulk insert"""
+    query_cache.invalidate_created(sender, instances)
@@ -0,0 +1,43 @@
+"""
+Presentation Layer: Response Renderers
+orjson-backed JSON renderer for the REST API. orjson is optional: without
+it (or for indented output) rendering falls back to DRF's JSONRenderer.
+"""
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from . import timing
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# U+2028/U+2029 are valid JSON but not valid JavaScript; escaped like JSONRenderer does
+_LINE_SEPARATOR = '\u2028'.encode()
+_PARAGRAPH_SEPARATOR = '\u2029'.encode()
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    Renders compact UTF-8 JSON with orjson, which serializes UUIDs, datetimes
+    and dates natively (UTC as 'Z', like DRF's encoder). Anything else orjson
+    does not know (Decimal, lazy strings, timedelta, ...) goes through DRF's
+    JSONEncoder, so the output matches the stock renderer.
+    """
+    _default = staticmethod(JSONEncoder().default)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        with timing.phase('render'):
+            return self._render(data, accepted_media_type, renderer_context)
+
+    def _render(self, data, accepted_media_type, renderer_context):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=self._default, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+        if _LINE_SEPARATOR in ret or _PARAGRAPH_SEPARATOR in ret:
+            ret = ret.replace(_LINE_SEPARATOR, b'\\u2028').replace(_PARAGRAPH_SEPARATOR, b'\\u2029')
+        return ret
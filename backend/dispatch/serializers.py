@@ -1,5 +1,10 @@
+from functools import lru_cache
+from operator import attrgetter, methodcaller
+
+from django.conf import settings
 from rest_framework import serializers
-from .models import Contact, Signup, Claim, CareerApplication
+from rest_framework.fields import get_attribute
+from .models import Contact, Signup, Claim, CareerApplication, ArchivedContact, ArchivedClaim
 
 
 class ContactCreateSerializer(serializers.ModelSerializer):
@@ -430,6 +435,46 @@ class ClaimResponseSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at']
 
 
+class ArchivedContactResponseSerializer(serializers.ModelSerializer):
+    """
+    Application Layer: Serializer for archived contact response
+    Used by the list endpoints when reading the archive table.
+    """
+    full_name = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ArchivedContact
+        fields = ['id', 'first_name', 'last_name', 'full_name', 'email',
+                  'phone', 'message', 'is_read', 'created_at', 'archived_at']
+        read_only_fields = fields
+
+    def get_full_name(self, obj):
+        """Get full name from model property"""
+        return obj.full_name
+
+
+class ArchivedClaimResponseSerializer(serializers.ModelSerializer):
+    """
+    Application Layer: Serializer for archived claim response
+    Used by the list endpoints when reading the archive table.
+    """
+    class Meta:
+        model = ArchivedClaim
+        fields = [
+            'id',
+            'full_name',
+            'email',
+            'phone',
+            'company_name',
+            'preferred_route',
+            'age_of_mc_authority',
+            'is_read',
+            'created_at',
+            'archived_at'
+        ]
+        read_only_fields = fields
+
+
 class CareerApplicationCreateSerializer(serializers.Serializer):
     """
     Application Layer: Serializer for creating career applications
@@ -573,3 +618,94 @@ class CareerApplicationResponseSerializer(serializers.ModelSerializer):
             'created_at',
             'updated_at'
         ]
+
+
+class CompiledResponseSerializer:
+    """
+    Application Layer: Precompiled response serializer
+    Builds the same dicts as `serializer_class(instance).data` from a field
+    plan resolved once per serializer class. A ModelSerializer otherwise
+    rebuilds its fields from model introspection on every instantiation.
+    Obtain instances through compiled_serializer().
+    """
+
+    # Exact DRF field types whose to_representation is a plain conversion
+    _CONVERTERS = {
+        serializers.CharField: str,
+        serializers.EmailField: str,
+        serializers.URLField: str,
+        serializers.IntegerField: int,
+        serializers.BooleanField: bool,
+    }
+
+    def __init__(self, serializer_class):
+        self.serializer_class = serializer_class
+        serializer = serializer_class()
+        self._model = serializer.Meta.model
+        self._concrete = {field.name for field in self._model._meta.concrete_fields}
+        self._plan = [
+            self._compile(serializer, name, field)
+            for name, field in serializer.fields.items()
+            if not field.write_only
+        ]
+
+    def _compile(self, serializer, name, field):
+        """(output key, getter, representation or None) for one field"""
+        if isinstance(field, serializers.SerializerMethodField):
+            return name, getattr(serializer, field.method_name), None
+
+        source_attrs = field.source_attrs
+        source = getattr(self._model, source_attrs[0], None) if len(source_attrs) == 1 else None
+        if len(source_attrs) == 1 and (source_attrs[0] in self._concrete or isinstance(source, property)):
+            getter = attrgetter(source_attrs[0])
+        elif len(source_attrs) == 1 and callable(source):
+            # Methods such as get_status_display: DRF calls them without arguments
+            getter = methodcaller(source_attrs[0])
+        else:
+            def getter(instance, attrs=source_attrs):
+                return get_attribute(instance, attrs)
+
+        represent = self._CONVERTERS.get(type(field))
+        if represent is None and type(field) is serializers.UUIDField and field.uuid_format == 'hex_verbose':
+            represent = str
+        return name, getter, represent or field.to_representation
+
+    def serialize(self, instance) -> dict:
+        data = {}
+        for name, getter, represent in self._plan:
+            value = getter(instance)
+            data[name] = value if represent is None or value is None else represent(value)
+        return data
+
+    def serialize_many(self, instances) -> list:
+        return [self.serialize(instance) for instance in instances]
+
+
+@lru_cache(maxsize=None)
+def _compile(serializer_class) -> CompiledResponseSerializer:
+    return CompiledResponseSerializer(serializer_class)
+
+
+def compiled_serializer(serializer_class):
+    """
+    Compiled form of a response serializer, built on first use
+
+    With COMPILED_RESPONSE_SERIALIZERS = False the DRF serializer is used
+    as-is (for comparison benchmarks).
+    """
+    if not getattr(settings, 'COMPILED_RESPONSE_SERIALIZERS', True):
+        return _DRFResponseSerializer(serializer_class)
+    return _compile(serializer_class)
+
+
+class _DRFResponseSerializer:
+    """Same interface as CompiledResponseSerializer, going through DRF each call"""
+
+    def __init__(self, serializer_class):
+        self.serializer_class = serializer_class
+
+    def serialize(self, instance) -> dict:
+        return self.serializer_class(instance).data
+
+    def serialize_many(self, instances) -> list:
+        return self.serializer_class(instances, many=True).data
@@ -2,21 +2,168 @@
 Domain Services Layer
 Contains business logic and use cases for contact management and signup.
 """
+import logging
+import random
+from collections import Counter
+from datetime import date, datetime, time, timedelta
+from time import perf_counter
 from typing import Dict, Any, Optional
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramWordSimilarity
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, connection, transaction
+from django.db.models import BooleanField, CharField, Count, Exists, F, OuterRef, Q, Sum, Value
+from django.db.models.functions import Cast, Coalesce, Concat, NullIf, TruncDate
+from django.utils import timezone
 from rest_framework import serializers
-from .models import Contact, Signup, Claim, CareerApplication
+from .models import (
+    Contact,
+    Signup,
+    Claim,
+    CareerApplication,
+    EmailOutbox,
+    DailyLeadRollup,
+    ArchivedContact,
+    ArchivedClaim,
+    FULL_TEXT_SEARCH_CONFIG
+)
 from .serializers import (
-    ContactCreateSerializer,
     ContactResponseSerializer,
-    SignupCreateSerializer,
     SignupResponseSerializer,
-    ClaimCreateSerializer,
     ClaimResponseSerializer,
-    CareerApplicationCreateSerializer,
-    CareerApplicationResponseSerializer
+    CareerApplicationResponseSerializer,
+    ArchivedContactResponseSerializer,
+    ArchivedClaimResponseSerializer,
+    compiled_serializer
 )
 from .email_service import ContactEmailService, CareerApplicationEmailService
+from .validation import validate_submission
+from . import query_cache
+from . import metrics
+from . import timing
+from .pagination import paginate_keyset, page_payload, encode_cursor, decode_cursor
+from .signals import lead_rows_created
+
+logger = logging.getLogger(__name__)
+
+
+class EmailOutboxService:
+    """
+    Domain Service: Handles the transactional email outbox
+    Queues notifications alongside submissions and delivers them out of band.
+    """
+
+    # Maps outbox message kinds to the infrastructure senders that deliver them
+    HANDLERS = {
+        'contact_notification': ContactEmailService.send_contact_notification,
+        'contact_confirmation': ContactEmailService.send_confirmation_email,
+        'career_application_notification': CareerApplicationEmailService.send_application_notification,
+        'career_application_confirmation': CareerApplicationEmailService.send_confirmation_email,
+    }
+
+    @staticmethod
+    def enqueue(kind: str, payload: Dict[str, Any]) -> EmailOutbox:
+        """
+        Use Case: Queue an email notification for background delivery
+
+        Must be called inside the transaction that writes the submission so
+        the message is only visible to the worker once the submission commits.
+
+        Args:
+            kind: Outbox message kind (see EmailOutbox.KIND_CHOICES)
+            payload: Serialized submission data passed to the email sender
+
+        Returns:
+            The created outbox message
+        """
+        with timing.phase('email'):
+            return EmailOutbox.objects.create(
+                kind=kind,
+                payload=dict(payload),
+                max_attempts=getattr(settings, 'EMAIL_OUTBOX_MAX_ATTEMPTS', 8),
+            )
+
+    @staticmethod
+    def claim_batch(limit: int) -> list:
+        """
+        Lease up to `limit` due messages for delivery
+
+        Rows are locked with SKIP LOCKED so several workers can drain the
+        outbox concurrently without picking the same message. Messages stuck
+        in 'sending' past the lease timeout (crashed worker) are reclaimed.
+        """
+        now = timezone.now()
+        lease_timeout = getattr(settings, 'EMAIL_OUTBOX_LEASE_TIMEOUT', 300)
+        lease_expired = now - timedelta(seconds=lease_timeout)
+
+        with transaction.atomic():
+            messages = list(
+                EmailOutbox.objects.select_for_update(skip_locked=True)
+                .filter(
+                    Q(status=EmailOutbox.STATUS_PENDING, next_attempt_at__lte=now)
+                    | Q(status=EmailOutbox.STATUS_SENDING, locked_at__lt=lease_expired)
+                )
+                .order_by('next_attempt_at')[:limit]
+            )
+            if not messages:
+                return []
+            EmailOutbox.objects.filter(id__in=[message.id for message in messages]).update(
+                status=EmailOutbox.STATUS_SENDING,
+                locked_at=now,
+                attempts=F('attempts') + 1,
+                updated_at=now,
+            )
+
+        for message in messages:
+            message.status = EmailOutbox.STATUS_SENDING
+            message.locked_at = now
+            message.attempts += 1
+        return messages
+
+    @staticmethod
+    def retry_delay(attempts: int) -> timedelta:
+        """Exponential backoff with jitter for the given attempt number"""
+        base = getattr(settings, 'EMAIL_OUTBOX_BACKOFF_BASE', 30)
+        cap = getattr(settings, 'EMAIL_OUTBOX_BACKOFF_MAX', 3600)
+        delay = min(base * (2 ** max(attempts - 1, 0)), cap)
+        return timedelta(seconds=delay + random.uniform(0, delay * 0.1))
+
+    @staticmethod
+    def deliver(message: EmailOutbox) -> bool:
+        """
+        Use Case: Deliver a leased outbox message
+
+        Returns:
+            True if the email was sent, False if it was rescheduled or dead-lettered
+        """
+        handler = EmailOutboxService.HANDLERS.get(message.kind)
+        if handler is None:
+            # No sender will ever accept this message; dead-letter it right away
+            message.attempts = message.max_attempts
+            message.mark_failed(f"Unknown outbox message kind: {message.kind}", timedelta())
+            return False
+
+        started = perf_counter()
+        try:
+            # Send errors are raised, so last_error records the real cause
+            sent = handler(message.payload, fail_silently=False)
+            error = '' if sent else 'Email not sent: no recipient (ADMIN_EMAIL or the payload email is missing)'
+        except Exception as e:
+            sent = False
+            error = f"{type(e).__name__}: {e}"
+        metrics.record_email_send(message.kind, sent, perf_counter() - started)
+
+        if sent:
+            message.mark_sent()
+            return True
+
+        message.mark_failed(error, EmailOutboxService.retry_delay(message.attempts))
+        if message.status == EmailOutbox.STATUS_DEAD:
+            logger.error("Outbox message %s dead-lettered after %s attempts: %s", message.id, message.attempts, error)
+        else:
+            logger.warning("Outbox message %s attempt %s failed: %s", message.id, message.attempts, error)
+        return False
 
 
 class ContactSubmissionService:
@@ -39,29 +186,29 @@ class ContactSubmissionService:
         Raises:
             serializers.ValidationError: If validation fails
         """
-        # Validate input data using serializer (application layer)
-        serializer = ContactCreateSerializer(data=data)
+        # Validate input data and build the model fields (application layer)
+        validated_data = validate_submission('contact', data)
         
-        if not serializer.is_valid():
-            raise serializers.ValidationError(serializer.errors)
+        contact_data = ContactSubmissionService._save_contact(validated_data)
         
-        # Create contact entity (domain layer)
-        validated_data = serializer.validated_data
-        contact = Contact.objects.create(**validated_data)
+        return {
+            'success': True,
+            'message': 'Contact submission received successfully.',
+            'data': contact_data
+        }
+
+    @staticmethod
+    async def acreate_contact_submission(data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Use Case: Create a new contact submission (async)
         
-        # Return response using response serializer
-        response_serializer = ContactResponseSerializer(contact)
-        contact_data = response_serializer.data
+        Same contract as create_contact_submission. The insert and the outbox
+        row share one transaction, which the async ORM cannot open, so that
+        single unit of work runs in one thread hop.
+        """
+        validated_data = validate_submission('contact', data)
         
-        # Send email notification to admin (infrastructure layer)
-        # This is done asynchronously to not block the response
-        try:
-            ContactEmailService.send_contact_notification(contact_data)
-        except Exception as e:
-            # Log error but don't fail the submission
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.error(f"Failed to send email notification: {str(e)}", exc_info=True)
+        contact_data = await sync_to_async(ContactSubmissionService._save_contact)(validated_data)
         
         return {
             'success': True,
@@ -69,6 +216,22 @@ class ContactSubmissionService:
             'data': contact_data
         }
 
+    @staticmethod
+    def _save_contact(validated_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Insert the contact and queue its notification atomically; returns response data"""
+        with transaction.atomic():
+            # Create contact entity (domain layer)
+            contact = Contact.objects.create(**validated_data)
+            
+            # Return response using response serializer
+            contact_data = compiled_serializer(ContactResponseSerializer).serialize(contact)
+            
+            # Queue email notification to admin in the same transaction;
+            # the outbox worker delivers it so SMTP never blocks the response
+            EmailOutboxService.enqueue('contact_notification', contact_data)
+        
+        return contact_data
+
     @staticmethod
     def validate_contact_data(data: Dict[str, Any]) -> bool:
         """
@@ -80,8 +243,8 @@ class ContactSubmissionService:
         Returns:
             True if valid, raises ValidationError otherwise
         """
-        serializer = ContactCreateSerializer(data=data)
-        return serializer.is_valid(raise_exception=True)
+        validate_submission('contact', data)
+        return True
 
 
 class ContactQueryService:
@@ -92,11 +255,8 @@ class ContactQueryService:
     
     @staticmethod
     def get_contact_by_id(contact_id: int) -> Optional[Contact]:
-        """Get contact by ID"""
-        try:
-            return Contact.objects.get(id=contact_id)
-        except Contact.DoesNotExist:
-            return None
+        """Get contact by ID (read through the query cache)"""
+        return query_cache.get_instance(Contact, contact_id)
 
 
 class SignupSubmissionService:
@@ -119,35 +279,109 @@ class SignupSubmissionService:
         Raises:
             serializers.ValidationError: If validation fails
         """
-        # Validate input data using serializer (application layer)
-        serializer = SignupCreateSerializer(data=data)
+        # Validate input data and build the model fields (application layer)
+        signup_data = validate_submission('signup', data, SignupSubmissionService.build_signup_data)
         
-        if not serializer.is_valid():
-            raise serializers.ValidationError(serializer.errors)
+        # Check if signup with this email (or company/owner email) already exists
+        # in a single query; the unique constraints close the race with concurrent signups
+        candidates = SignupSubmissionService._email_candidates(signup_data)
+        with timing.phase('duplicate_check'):
+            conflicts = SignupSubmissionService._conflict_queryset(candidates)
+            SignupSubmissionService._raise_on_conflict(candidates, list(conflicts))
         
-        validated_data = serializer.validated_data
+        # Create signup entity (domain layer)
+        try:
+            signup = Signup.objects.create(**signup_data)
+        except IntegrityError as e:
+            SignupSubmissionService._raise_for_integrity_error(e)
         
-        # Check if signup with this email already exists
-        email = validated_data.get('email', '').strip().lower()
-        if Signup.objects.filter(email=email).exists():
-            raise serializers.ValidationError({
-                'email': ['A signup with this email already exists.']
-            })
+        # Note: User account creation can be handled separately if needed for authentication
+        # For now, we just store the signup information
         
-        # Check if company/owner email already exists (if provided)
-        signup_type = validated_data.get('signup_type')
-        if signup_type == 'company':
-            company_email = validated_data.get('company_email', '').strip().lower()
-            if company_email and Signup.objects.filter(company_email=company_email).exists():
-                raise serializers.ValidationError({
-                    'company_email': ['A signup with this company email already exists.']
-                })
-        elif signup_type == 'owner-operator':
-            owner_email = validated_data.get('owner_email', '').strip().lower()
-            if owner_email and Signup.objects.filter(owner_email=owner_email).exists():
+        # Return response using response serializer
+        signup_data = compiled_serializer(SignupResponseSerializer).serialize(signup)
+        
+        return {
+            'success': True,
+            'message': 'Your account has been created successfully!',
+            'data': signup_data
+        }
+
+    @staticmethod
+    async def acreate_signup_submission(data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Use Case: Create a new signup submission (async)
+        
+        Same contract as create_signup_submission, using the async ORM.
+        """
+        signup_data = validate_submission('signup', data, SignupSubmissionService.build_signup_data)
+        
+        candidates = SignupSubmissionService._email_candidates(signup_data)
+        with timing.phase('duplicate_check'):
+            conflicts = SignupSubmissionService._conflict_queryset(candidates)
+            SignupSubmissionService._raise_on_conflict(candidates, [row async for row in conflicts])
+        
+        try:
+            signup = await Signup.objects.acreate(**signup_data)
+        except IntegrityError as e:
+            SignupSubmissionService._raise_for_integrity_error(e)
+        
+        return {
+            'success': True,
+            'message': 'Your account has been created successfully!',
+            'data': compiled_serializer(SignupResponseSerializer).serialize(signup)
+        }
+
+    @staticmethod
+    def _email_candidates(signup_data: Dict[str, Any]) -> Dict[str, str]:
+        """Normalized values of the unique email fields present on this signup"""
+        return {
+            field: signup_data[field]
+            for field in Signup.UNIQUE_EMAIL_FIELDS
+            if signup_data.get(field)
+        }
+
+    @staticmethod
+    def _conflict_queryset(candidates: Dict[str, str]):
+        """One query returning the email columns of every row that collides with a candidate"""
+        matches = Q()
+        for field, value in candidates.items():
+            matches |= Q(**{field: value})
+        fields = list(Signup.UNIQUE_EMAIL_FIELDS)
+        # Each column is unique, so at most one row can collide per candidate
+        return Signup.objects.filter(matches).values_list(*fields)[:len(fields)]
+
+    @staticmethod
+    def _raise_on_conflict(candidates: Dict[str, str], rows: list):
+        """Raise a ValidationError naming the first conflicting field, in form order"""
+        for position, field in enumerate(Signup.UNIQUE_EMAIL_FIELDS):
+            value = candidates.get(field)
+            if value and any((row[position] or '').lower() == value for row in rows):
                 raise serializers.ValidationError({
-                    'owner_email': ['A signup with this owner email already exists.']
+                    field: [Signup.UNIQUE_EMAIL_FIELDS[field]]
                 })
+
+    @staticmethod
+    def _raise_for_integrity_error(error: IntegrityError):
+        """Map a unique constraint violation to the same validation response as the pre-check"""
+        message = str(error)
+        for field, error_message in Signup.UNIQUE_EMAIL_FIELDS.items():
+            if Signup.unique_email_constraint_name(field) in message:
+                raise serializers.ValidationError({field: [error_message]})
+        raise error
+
+    @staticmethod
+    def build_signup_data(validated_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Domain Service Method: Normalize validated signup data into model fields
+        
+        Args:
+            validated_data: Validated data from SignupCreateSerializer
+            
+        Returns:
+            Dictionary of Signup model field values
+        """
+        signup_type = validated_data.get('signup_type')
         
         # Prepare signup data (simplified form - optional fields have defaults)
         signup_data = {
@@ -156,7 +390,7 @@ class SignupSubmissionService:
             'last_name': validated_data.get('last_name', '').strip() or '',
             'contact_number': validated_data.get('contact_number', '').strip() or '',
             'communication_method': validated_data.get('communication_method'),
-            'email': email,
+            'email': validated_data.get('email', '').strip().lower(),
             'motor_carrier_no': validated_data.get('motor_carrier_no', '').strip() or None,
             'authority_age': validated_data.get('authority_age'),
             'number_of_trucks': validated_data.get('number_of_trucks'),
@@ -178,21 +412,7 @@ class SignupSubmissionService:
                 'owner_contact_number': validated_data.get('owner_contact_number', '').strip() or None,
             })
         
-        # Create signup entity (domain layer)
-        signup = Signup.objects.create(**signup_data)
-        
-        # Note: User account creation can be handled separately if needed for authentication
-        # For now, we just store the signup information
-        
-        # Return response using response serializer
-        response_serializer = SignupResponseSerializer(signup)
-        signup_data = response_serializer.data
-        
-        return {
-            'success': True,
-            'message': 'Your account has been created successfully!',
-            'data': signup_data
-        }
+        return signup_data
 
     @staticmethod
     def validate_signup_data(data: Dict[str, Any]) -> bool:
@@ -205,8 +425,8 @@ class SignupSubmissionService:
         Returns:
             True if valid, raises ValidationError otherwise
         """
-        serializer = SignupCreateSerializer(data=data)
-        return serializer.is_valid(raise_exception=True)
+        validate_submission('signup', data)
+        return True
 
 
 class SignupQueryService:
@@ -217,19 +437,13 @@ class SignupQueryService:
     
     @staticmethod
     def get_signup_by_id(signup_id: str) -> Optional[Signup]:
-        """Get signup by ID (UUID)"""
-        try:
-            return Signup.objects.get(id=signup_id)
-        except Signup.DoesNotExist:
-            return None
+        """Get signup by ID (UUID), read through the query cache"""
+        return query_cache.get_instance(Signup, signup_id)
     
     @staticmethod
     def get_signup_by_email(email: str) -> Optional[Signup]:
-        """Get signup by email"""
-        try:
-            return Signup.objects.get(email=email)
-        except Signup.DoesNotExist:
-            return None
+        """Get signup by email, read through the query cache"""
+        return query_cache.get_instance_by(Signup, 'email', email)
 
 
 class ClaimSubmissionService:
@@ -252,19 +466,14 @@ class ClaimSubmissionService:
         Raises:
             serializers.ValidationError: If validation fails
         """
-        # Validate input data using serializer (application layer)
-        serializer = ClaimCreateSerializer(data=data)
-        
-        if not serializer.is_valid():
-            raise serializers.ValidationError(serializer.errors)
+        # Validate input data and build the model fields (application layer)
+        validated_data = validate_submission('claim', data)
         
         # Create claim entity (domain layer)
-        validated_data = serializer.validated_data
         claim = Claim.objects.create(**validated_data)
         
         # Return response using response serializer
-        response_serializer = ClaimResponseSerializer(claim)
-        claim_data = response_serializer.data
+        claim_data = compiled_serializer(ClaimResponseSerializer).serialize(claim)
         
         return {
             'success': True,
@@ -272,6 +481,21 @@ class ClaimSubmissionService:
             'data': claim_data
         }
 
+    @staticmethod
+    async def acreate_claim_submission(data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Use Case: Create a new claim submission (async)
+        
+        Same contract as create_claim_submission, using the async ORM.
+        """
+        claim = await Claim.objects.acreate(**validate_submission('claim', data))
+        
+        return {
+            'success': True,
+            'message': 'Your claim request has been submitted successfully!',
+            'data': compiled_serializer(ClaimResponseSerializer).serialize(claim)
+        }
+
     @staticmethod
     def validate_claim_data(data: Dict[str, Any]) -> bool:
         """
@@ -283,8 +507,8 @@ class ClaimSubmissionService:
         Returns:
             True if valid, raises ValidationError otherwise
         """
-        serializer = ClaimCreateSerializer(data=data)
-        return serializer.is_valid(raise_exception=True)
+        validate_submission('claim', data)
+        return True
 
 
 class ClaimQueryService:
@@ -295,19 +519,13 @@ class ClaimQueryService:
     
     @staticmethod
     def get_claim_by_id(claim_id: str) -> Optional[Claim]:
-        """Get claim by ID (UUID)"""
-        try:
-            return Claim.objects.get(id=claim_id)
-        except Claim.DoesNotExist:
-            return None
+        """Get claim by ID (UUID), read through the query cache"""
+        return query_cache.get_instance(Claim, claim_id)
     
     @staticmethod
     def get_claim_by_email(email: str) -> Optional[Claim]:
-        """Get claim by email"""
-        try:
-            return Claim.objects.get(email=email)
-        except Claim.DoesNotExist:
-            return None
+        """Get claim by email, read through the query cache"""
+        return query_cache.get_instance_by(Claim, 'email', email)
 
 
 class CareerApplicationSubmissionService:
@@ -330,35 +548,16 @@ class CareerApplicationSubmissionService:
         Raises:
             serializers.ValidationError: If validation fails
         """
-        # Validate input data using serializer (application layer)
-        serializer = CareerApplicationCreateSerializer(data=data)
-        
-        if not serializer.is_valid():
-            raise serializers.ValidationError(serializer.errors)
-        
-        # Create career application entity (domain layer)
-        validated_data = serializer.validated_data
-        
-        # Prepare data for model creation
-        application_data = {
-            'full_name': validated_data.get('full_name', '').strip(),
-            'email': validated_data.get('email', '').strip().lower(),
-            'phone': validated_data.get('phone', '').strip(),
-            'city_state': validated_data.get('city_state', '').strip() or None,
-            'linkedin_url': validated_data.get('linkedin_url', '').strip() or None,
-            'years_of_experience': validated_data.get('years_of_experience', '').strip() or None,
-            'position_type': validated_data.get('position_type'),
-            'job_title': validated_data.get('job_title', 'Truck Dispatching Sales Executive').strip(),
-            'cover_note': validated_data.get('cover_note', '').strip() or None,
-            'status': 'pending',  # Default status
-        }
+        # Validate input data and prepare the model fields (application layer)
+        application_data = validate_submission(
+            'career_application', data, CareerApplicationSubmissionService.build_application_data
+        )
         
         # Create career application entity
         application = CareerApplication.objects.create(**application_data)
         
         # Return response using response serializer
-        response_serializer = CareerApplicationResponseSerializer(application)
-        application_data = response_serializer.data
+        application_data = compiled_serializer(CareerApplicationResponseSerializer).serialize(application)
         
         # Email notifications are temporarily disabled - just storing records in DB
         # TODO: Re-enable email notifications when email service is configured
@@ -386,6 +585,47 @@ class CareerApplicationSubmissionService:
             'data': application_data
         }
 
+    @staticmethod
+    async def acreate_career_application(data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Use Case: Create a new career application submission (async)
+        
+        Same contract as create_career_application, using the async ORM.
+        """
+        application = await CareerApplication.objects.acreate(**validate_submission(
+            'career_application', data, CareerApplicationSubmissionService.build_application_data
+        ))
+        
+        return {
+            'success': True,
+            'message': 'Your application has been submitted successfully! Our hiring team will review it within 3-5 business days.',
+            'data': compiled_serializer(CareerApplicationResponseSerializer).serialize(application)
+        }
+
+    @staticmethod
+    def build_application_data(validated_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Domain Service Method: Normalize validated application data into model fields
+        
+        Args:
+            validated_data: Validated data from CareerApplicationCreateSerializer
+            
+        Returns:
+            Dictionary of CareerApplication model field values
+        """
+        return {
+            'full_name': validated_data.get('full_name', '').strip(),
+            'email': validated_data.get('email', '').strip().lower(),
+            'phone': validated_data.get('phone', '').strip(),
+            'city_state': (validated_data.get('city_state') or '').strip() or None,
+            'linkedin_url': (validated_data.get('linkedin_url') or '').strip() or None,
+            'years_of_experience': (validated_data.get('years_of_experience') or '').strip() or None,
+            'position_type': validated_data.get('position_type'),
+            'job_title': validated_data.get('job_title', 'Truck Dispatching Sales Executive').strip(),
+            'cover_note': (validated_data.get('cover_note') or '').strip() or None,
+            'status': 'pending',  # Default status
+        }
+
     @staticmethod
     def validate_career_application_data(data: Dict[str, Any]) -> bool:
         """
@@ -397,8 +637,8 @@ class CareerApplicationSubmissionService:
         Returns:
             True if valid, raises ValidationError otherwise
         """
-        serializer = CareerApplicationCreateSerializer(data=data)
-        return serializer.is_valid(raise_exception=True)
+        validate_submission('career_application', data)
+        return True
 
 
 class CareerApplicationQueryService:
@@ -409,23 +649,903 @@ class CareerApplicationQueryService:
     
     @staticmethod
     def get_application_by_id(application_id: str) -> Optional[CareerApplication]:
-        """Get career application by ID (UUID)"""
-        try:
-            return CareerApplication.objects.get(id=application_id)
-        except CareerApplication.DoesNotExist:
-            return None
+        """Get career application by ID (UUID), read through the query cache"""
+        return query_cache.get_instance(CareerApplication, application_id)
     
     @staticmethod
     def get_applications_by_email(email: str) -> list:
         """Get all career applications by email"""
-        return list(CareerApplication.objects.filter(email=email.lower()).order_by('-created_at'))
+        email = email.lower()
+        return query_cache.get_list(
+            CareerApplication, 'by_email',
+            lambda: list(CareerApplication.objects.filter(email=email).order_by('-created_at')),
+            email,
+        )
     
     @staticmethod
     def get_pending_applications() -> list:
         """Get all pending career applications"""
-        return list(CareerApplication.objects.filter(status='pending', is_archived=False).order_by('-created_at'))
+        return query_cache.get_list(
+            CareerApplication, 'pending',
+            lambda: list(CareerApplication.pending.order_by('-created_at')),
+        )
     
     @staticmethod
     def get_applications_by_position_type(position_type: str) -> list:
         """Get career applications by position type"""
-        return list(CareerApplication.objects.filter(position_type=position_type, is_archived=False).order_by('-created_at'))
+        return query_cache.get_list(
+            CareerApplication, 'by_position_type',
+            lambda: list(CareerApplication.active.filter(position_type=position_type).order_by('-created_at')),
+            position_type,
+        )
+
+
+class BatchSubmissionService:
+    """
+    Domain Service: Handles bulk submission of contacts, claims and signups
+    Validates every item with the compiled form validators (validation.py)
+    and inserts the valid rows with bulk_create in chunks.
+    """
+
+    SUPPORTED_KINDS = ('contact', 'claim', 'signup')
+
+    @staticmethod
+    def create_batch(kind: str, items: list, notify: bool = False) -> Dict[str, Any]:
+        """
+        Use Case: Create many submissions of one kind in a single request
+        
+        Args:
+            kind: One of 'contact', 'claim' or 'signup'
+            items: List of form payloads, one per submission
+            notify: Queue admin notification emails for created contacts
+            
+        Returns:
+            Dictionary with created/failed counts and per-item results in input order
+            
+        Raises:
+            serializers.ValidationError: If the batch itself is malformed
+        """
+        if kind not in BatchSubmissionService.SUPPORTED_KINDS:
+            raise serializers.ValidationError({'kind': [f'Unsupported batch kind "{kind}".']})
+        if not isinstance(items, list):
+            raise serializers.ValidationError({'items': ['Expected a JSON array or NDJSON body.']})
+        max_items = getattr(settings, 'BATCH_SUBMISSION_MAX_ITEMS', 50000)
+        if len(items) > max_items:
+            raise serializers.ValidationError({'items': [f'A batch may contain at most {max_items} items.']})
+
+        chunk_size = getattr(settings, 'BATCH_SUBMISSION_CHUNK_SIZE', 1000)
+        results = [None] * len(items)
+
+        for start in range(0, len(items), chunk_size):
+            chunk = items[start:start + chunk_size]
+            if kind == 'contact':
+                BatchSubmissionService._create_contacts(chunk, start, results, notify)
+            elif kind == 'claim':
+                BatchSubmissionService._create_claims(chunk, start, results)
+            else:
+                BatchSubmissionService._create_signups(chunk, start, results)
+
+        created = sum(1 for result in results if result['success'])
+        return {
+            'created': created,
+            'failed': len(results) - created,
+            'results': results,
+        }
+
+    @staticmethod
+    def _validate_chunk(kind: str, chunk: list, offset: int, results: list, build=None) -> list:
+        """Validate each item, recording failures; returns (index, model fields) pairs"""
+        valid = []
+        for position, item in enumerate(chunk):
+            index = offset + position
+            try:
+                valid.append((index, validate_submission(kind, item, build)))
+            except serializers.ValidationError as e:
+                results[index] = {'index': index, 'success': False, 'errors': e.detail}
+        return valid
+
+    @staticmethod
+    def _record_created(indexed_instances: list, results: list):
+        for index, instance in indexed_instances:
+            results[index] = {'index': index, 'success': True, 'id': str(instance.pk)}
+
+    @staticmethod
+    def _create_contacts(chunk: list, offset: int, results: list, notify: bool):
+        valid = BatchSubmissionService._validate_chunk('contact', chunk, offset, results)
+        if not valid:
+            return
+        contacts = [Contact(**validated_data) for _, validated_data in valid]
+        with transaction.atomic():
+            Contact.objects.bulk_create(contacts)
+            LeadStatsService.record_created(contacts)
+            lead_rows_created.send(sender=Contact, instances=contacts)
+            if notify:
+                max_attempts = getattr(settings, 'EMAIL_OUTBOX_MAX_ATTEMPTS', 8)
+                with timing.phase('email'):
+                    EmailOutbox.objects.bulk_create([
+                        EmailOutbox(kind='contact_notification', payload=dict(contact_data), max_attempts=max_attempts)
+                        for contact_data in compiled_serializer(ContactResponseSerializer).serialize_many(contacts)
+                    ])
+        BatchSubmissionService._record_created(
+            [(index, contact) for (index, _), contact in zip(valid, contacts)], results
+        )
+
+    @staticmethod
+    def _create_claims(chunk: list, offset: int, results: list):
+        valid = BatchSubmissionService._validate_chunk('claim', chunk, offset, results)
+        if not valid:
+            return
+        claims = [Claim(**validated_data) for _, validated_data in valid]
+        with transaction.atomic():
+            Claim.objects.bulk_create(claims)
+            LeadStatsService.record_created(claims)
+            lead_rows_created.send(sender=Claim, instances=claims)
+        BatchSubmissionService._record_created(
+            [(index, claim) for (index, _), claim in zip(valid, claims)], results
+        )
+
+    @staticmethod
+    def _create_signups(chunk: list, offset: int, results: list):
+        prepared = BatchSubmissionService._validate_chunk(
+            'signup', chunk, offset, results, SignupSubmissionService.build_signup_data
+        )
+        if not prepared:
+            return
+
+        # One lookup per email column for the whole chunk instead of per item
+        with timing.phase('duplicate_check'):
+            taken = {
+                field: set(
+                    Signup.objects.filter(**{f'{field}__in': [data[field] for _, data in prepared if data.get(field)]})
+                    .values_list(field, flat=True)
+                )
+                for field in Signup.UNIQUE_EMAIL_FIELDS
+            }
+
+        to_create = []
+        for index, data in prepared:
+            conflict = next((field for field in taken if data.get(field) and data[field] in taken[field]), None)
+            if conflict:
+                results[index] = {
+                    'index': index,
+                    'success': False,
+                    'errors': {conflict: [Signup.UNIQUE_EMAIL_FIELDS[conflict]]}
+                }
+                continue
+            # Later items in the same batch may not reuse an email either
+            for field in taken:
+                if data.get(field):
+                    taken[field].add(data[field])
+            to_create.append((index, Signup(**data)))
+
+        try:
+            with transaction.atomic():
+                signups = Signup.objects.bulk_create([signup for _, signup in to_create])
+                LeadStatsService.record_created(signups)
+                lead_rows_created.send(sender=Signup, instances=signups)
+        except IntegrityError:
+            # A concurrent signup took one of these emails after the pre-check;
+            # fall back to row-by-row inserts so only the colliding items fail
+            # (save() fires post_save, which counts them in the rollups)
+            created = []
+            for index, signup in to_create:
+                try:
+                    with transaction.atomic():
+                        signup.save(force_insert=True)
+                    created.append((index, signup))
+                except IntegrityError as e:
+                    try:
+                        SignupSubmissionService._raise_for_integrity_error(e)
+                    except serializers.ValidationError as validation_error:
+                        results[index] = {'index': index, 'success': False, 'errors': validation_error.detail}
+            to_create = created
+        BatchSubmissionService._record_created(to_create, results)
+
+
+class LeadBulkActionService:
+    """
+    Domain Service: Handles bulk state transitions on leads
+    Applies mark_as_read / archive / approve / deactivate / update_status to
+    many rows with one UPDATE ... WHERE id IN (...) per call.
+    """
+
+    # Lead kind -> model and the transitions it supports
+    ACTIONS = {
+        'contact': (Contact, ('mark_as_read', 'archive')),
+        'signup': (Signup, ('approve', 'deactivate')),
+        'claim': (Claim, ('mark_as_read', 'archive')),
+        'career_application': (CareerApplication, ('mark_as_read', 'archive', 'update_status')),
+    }
+
+    @staticmethod
+    def apply(kind: str, data: Dict[str, Any], reviewed_by: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Use Case: Apply one state transition to a list of leads
+        
+        Args:
+            kind: Lead kind (see ACTIONS)
+            data: Request body with 'action', 'ids' and, for update_status, 'status'
+                  (optional 'reviewed_by', defaulting to `reviewed_by`)
+            reviewed_by: Reviewer recorded by update_status when the body has none
+            
+        Returns:
+            Dictionary with the action, requested id count and affected row count
+            
+        Raises:
+            serializers.ValidationError: If the kind, action, ids or status are invalid
+        """
+        if kind not in LeadBulkActionService.ACTIONS:
+            raise serializers.ValidationError({'kind': [f'Unknown lead kind "{kind}".']})
+        model, actions = LeadBulkActionService.ACTIONS[kind]
+
+        action = data.get('action')
+        if action not in actions:
+            raise serializers.ValidationError({'action': [f'Must be one of: {", ".join(actions)}.']})
+
+        ids = data.get('ids')
+        max_ids = getattr(settings, 'BULK_ACTION_MAX_IDS', 10000)
+        if not isinstance(ids, list) or not ids:
+            raise serializers.ValidationError({'ids': ['Expected a non-empty list of ids.']})
+        if len(ids) > max_ids:
+            raise serializers.ValidationError({'ids': [f'At most {max_ids} ids per request.']})
+        try:
+            pks = {model._meta.pk.to_python(value) for value in ids}
+        except ValidationError:
+            raise serializers.ValidationError({'ids': ['Contains an invalid id.']})
+
+        queryset = model.objects.filter(pk__in=pks)
+        if action == 'update_status':
+            choices = [value for value, _ in model._meta.get_field('status').choices]
+            new_status = data.get('status')
+            if new_status not in choices:
+                raise serializers.ValidationError({'status': [f'Must be one of: {", ".join(choices)}.']})
+            affected = queryset.update_status(new_status, reviewed_by=data.get('reviewed_by') or reviewed_by)
+        else:
+            affected = getattr(queryset, action)()
+
+        return {
+            'kind': kind,
+            'action': action,
+            'requested': len(pks),
+            'affected': affected,
+        }
+
+
+class LeadListService:
+    """
+    Domain Service: Handles paginated listing of leads
+    Serves newest-first keyset pages of contacts, signups, claims and
+    career applications with optional status filters.
+    """
+
+    BOOLEAN_VALUES = {'true': True, '1': True, 'false': False, '0': False}
+
+    # Lead kind -> model, response serializer and the filters it accepts.
+    # A filter maps to None for booleans or to the allowed values for choices.
+    KINDS = {
+        'contact': {
+            'model': Contact,
+            'serializer': ContactResponseSerializer,
+            'filters': {'is_read': None, 'is_archived': None},
+            'archive': (ArchivedContact, ArchivedContactResponseSerializer),
+        },
+        'signup': {
+            'model': Signup,
+            'serializer': SignupResponseSerializer,
+            'filters': {
+                'signup_type': [value for value, _ in Signup.SIGNUP_TYPE_CHOICES],
+                'is_approved': None,
+                'is_active': None,
+            },
+        },
+        'claim': {
+            'model': Claim,
+            'serializer': ClaimResponseSerializer,
+            'filters': {'is_read': None, 'is_archived': None},
+            'archive': (ArchivedClaim, ArchivedClaimResponseSerializer),
+        },
+        'career_application': {
+            'model': CareerApplication,
+            'serializer': CareerApplicationResponseSerializer,
+            'filters': {
+                'is_read': None,
+                'is_archived': None,
+                'status': [value for value, _ in CareerApplication._meta.get_field('status').choices],
+                'position_type': [value for value, _ in CareerApplication.POSITION_TYPE_CHOICES],
+            },
+        },
+    }
+
+    @staticmethod
+    def parse_filters(kind: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Domain Service Method: Turn query parameters into ORM filters for a lead kind
+        
+        Raises:
+            serializers.ValidationError: If a filter value is not allowed
+        """
+        allowed = LeadListService.KINDS[kind]['filters']
+        filters = {}
+        errors = {}
+        for name, choices in allowed.items():
+            value = params.get(name)
+            if value in (None, ''):
+                continue
+            if choices is None:
+                parsed = LeadListService.BOOLEAN_VALUES.get(value.lower())
+                if parsed is None:
+                    errors[name] = ['Must be true or false.']
+                    continue
+                filters[name] = parsed
+            elif value in choices:
+                filters[name] = value
+            else:
+                errors[name] = [f'Must be one of: {", ".join(choices)}.']
+        if errors:
+            raise serializers.ValidationError(errors)
+        return filters
+
+    @staticmethod
+    def page_size(params: Dict[str, Any]) -> int:
+        """Requested page size, clamped to LEAD_LIST_MAX_PAGE_SIZE"""
+        default = getattr(settings, 'LEAD_LIST_PAGE_SIZE', 50)
+        maximum = getattr(settings, 'LEAD_LIST_MAX_PAGE_SIZE', 200)
+        try:
+            limit = int(params.get('limit', default))
+        except (TypeError, ValueError):
+            raise serializers.ValidationError({'limit': ['Must be an integer.']})
+        return max(1, min(limit, maximum))
+
+    @staticmethod
+    def source(kind: str, params: Dict[str, Any]) -> tuple:
+        """
+        Domain Service Method: (model, serializer) to read for a lead kind
+        
+        ?source=archive reads the cold archive table instead of the hot one.
+        
+        Raises:
+            serializers.ValidationError: If the source is unknown or the kind has no archive
+        """
+        config = LeadListService.KINDS[kind]
+        source = params.get('source') or 'live'
+        if source == 'live':
+            return config['model'], config['serializer']
+        if source == 'archive' and 'archive' in config:
+            return config['archive']
+        allowed = 'live, archive' if 'archive' in config else 'live'
+        raise serializers.ValidationError({'source': [f'Must be one of: {allowed}.']})
+
+    @staticmethod
+    def list_leads(kind: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Use Case: List one page of leads of the given kind, newest first
+        
+        Args:
+            kind: Lead kind (see KINDS)
+            params: Query parameters (filters, source, cursor, limit)
+            
+        Returns:
+            Dictionary with 'results' and 'next_cursor'
+            
+        Raises:
+            serializers.ValidationError: If filters, source, cursor or limit are invalid
+        """
+        model, serializer = LeadListService.source(kind, params)
+        queryset = model.objects.filter(**LeadListService.parse_filters(kind, params))
+        rows, next_cursor = paginate_keyset(queryset, params.get('cursor'), LeadListService.page_size(params))
+        return page_payload(compiled_serializer(serializer).serialize_many(rows), next_cursor)
+
+
+class LeadSearchService:
+    """
+    Domain Service: Handles ranked full-text search over leads
+    Queries the GIN-indexed search_vector columns instead of ILIKE scans.
+    """
+
+    @staticmethod
+    def build_query(term: str) -> SearchQuery:
+        """Parse user input with web-search syntax (quotes, OR, -exclusion)"""
+        return SearchQuery(term, search_type='websearch', config=FULL_TEXT_SEARCH_CONFIG)
+
+    @staticmethod
+    def search_queryset(model, term: str):
+        """Queryset of matching rows annotated with `rank`, best match first"""
+        query = LeadSearchService.build_query(term)
+        return (
+            model.objects.filter(search_vector=query)
+            .defer('search_vector')
+            .annotate(rank=SearchRank(F('search_vector'), query))
+            .order_by('-rank', '-created_at')
+        )
+
+    @staticmethod
+    def search(term: str, kind: Optional[str] = None, limit: int = 20) -> list:
+        """
+        Use Case: Ranked search across one or all lead kinds
+        
+        Args:
+            term: Search text
+            kind: Restrict to one lead kind (see LeadListService.KINDS)
+            limit: Maximum number of results
+            
+        Returns:
+            List of {'type', 'rank', 'data'} dicts, best match first
+            
+        Raises:
+            serializers.ValidationError: If the term or kind is invalid
+        """
+        term = (term or '').strip()
+        if not term:
+            raise serializers.ValidationError({'q': ['A search term is required.']})
+        if kind and kind not in LeadListService.KINDS:
+            raise serializers.ValidationError({'type': [f'Must be one of: {", ".join(LeadListService.KINDS)}.']})
+
+        kinds = [kind] if kind else list(LeadListService.KINDS)
+        matches = []
+        for lead_kind in kinds:
+            config = LeadListService.KINDS[lead_kind]
+            rows = list(LeadSearchService.search_queryset(config['model'], term)[:limit])
+            matches.extend(
+                {'type': lead_kind, 'rank': row.rank, 'data': data}
+                for row, data in zip(rows, compiled_serializer(config['serializer']).serialize_many(rows))
+            )
+
+        matches.sort(key=lambda match: match['rank'], reverse=True)
+        return matches[:limit]
+
+
+class FuzzyNameLookupService:
+    """
+    Domain Service: Handles fuzzy lookup of carrier and claimant names
+    Uses pg_trgm word similarity backed by the *_trgm GIN indexes, so
+    partial or misspelled names still find their matches.
+    """
+
+    # (lead kind, name field) pairs covered by a trigram index
+    NAME_FIELDS = [
+        ('signup', 'company_name'),
+        ('signup', 'owner_name'),
+        ('claim', 'company_name'),
+        ('claim', 'full_name'),
+    ]
+
+    MIN_TERM_LENGTH = 3
+
+    @staticmethod
+    def lookup(term: str, kind: Optional[str] = None, limit: int = 10,
+               min_score: Optional[float] = None) -> list:
+        """
+        Use Case: Find the names most similar to a search term
+        
+        Args:
+            term: Partial or misspelled name
+            kind: Restrict to 'signup' or 'claim'
+            limit: Maximum number of matches
+            min_score: Word-similarity threshold between 0 and 1 (default pg_trgm's 0.6)
+            
+        Returns:
+            List of {'type', 'id', 'field', 'name', 'score'} dicts, best match first
+            
+        Raises:
+            serializers.ValidationError: If the term, kind or score is invalid
+        """
+        term = (term or '').strip()
+        if len(term) < FuzzyNameLookupService.MIN_TERM_LENGTH:
+            raise serializers.ValidationError({
+                'q': [f'Enter at least {FuzzyNameLookupService.MIN_TERM_LENGTH} characters.']
+            })
+        sources = [source for source in FuzzyNameLookupService.NAME_FIELDS if kind in (None, source[0])]
+        if not sources:
+            raise serializers.ValidationError({'type': ['Must be one of: signup, claim.']})
+        if min_score is not None and not 0 < min_score <= 1:
+            raise serializers.ValidationError({'min_score': ['Must be between 0 and 1.']})
+
+        matches = []
+        with transaction.atomic():
+            if min_score is not None:
+                # The <% operator (and so the index scan) uses this threshold
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT set_config('pg_trgm.word_similarity_threshold', %s, true)",
+                        [str(min_score)]
+                    )
+            for lead_kind, field in sources:
+                model = LeadListService.KINDS[lead_kind]['model']
+                rows = (
+                    model.objects.filter(**{f'{field}__trigram_word_similar': term})
+                    .annotate(score=TrigramWordSimilarity(term, field))
+                    .order_by('-score')
+                    .values_list('pk', field, 'score')[:limit]
+                )
+                matches.extend(
+                    {'type': lead_kind, 'id': str(pk), 'field': field, 'name': name, 'score': round(score, 4)}
+                    for pk, name, score in rows
+                )
+
+        matches.sort(key=lambda match: match['score'], reverse=True)
+        return matches[:limit]
+
+
+class LeadStatsService:
+    """
+    Domain Service: Handles daily lead rollups
+    Maintains DailyLeadRollup incrementally and serves dashboard statistics
+    from it without touching the lead tables.
+    """
+
+    # Model -> (lead type, segment fields copied into the rollup bucket)
+    ROLLUP_SOURCES = {
+        Contact: ('contact', ()),
+        Claim: ('claim', ()),
+        Signup: ('signup', ('signup_type',)),
+        CareerApplication: ('career_application', ('status', 'position_type')),
+    }
+
+    # Archive tables hold leads moved out of the hot tables; they still count
+    ARCHIVE_ROLLUP_SOURCES = {
+        ArchivedContact: ('contact', ()),
+        ArchivedClaim: ('claim', ()),
+    }
+
+    SEGMENT_FIELDS = ('signup_type', 'status', 'position_type')
+
+    @staticmethod
+    def _bucket(instance, **overrides) -> tuple:
+        """Rollup key (day, lead_type, signup_type, status, position_type) for a lead"""
+        lead_type, segments = LeadStatsService.ROLLUP_SOURCES[type(instance)]
+        values = {field: '' for field in LeadStatsService.SEGMENT_FIELDS}
+        values.update({field: getattr(instance, field) or '' for field in segments})
+        values.update(overrides)
+        return (
+            timezone.localdate(instance.created_at),
+            lead_type,
+            values['signup_type'],
+            values['status'],
+            values['position_type'],
+        )
+
+    @staticmethod
+    def increment(bucket: tuple, delta: int):
+        """Atomically add `delta` to one rollup bucket, creating it if needed"""
+        day, lead_type, signup_type, status, position_type = bucket
+        lookup = {
+            'day': day,
+            'lead_type': lead_type,
+            'signup_type': signup_type,
+            'status': status,
+            'position_type': position_type,
+        }
+        if DailyLeadRollup.objects.filter(**lookup).update(count=F('count') + delta):
+            return
+        try:
+            with transaction.atomic():
+                DailyLeadRollup.objects.create(count=delta, **lookup)
+        except IntegrityError:
+            # Another request created the bucket first
+            DailyLeadRollup.objects.filter(**lookup).update(count=F('count') + delta)
+
+    @staticmethod
+    def record_created(instances: list):
+        """Count newly created leads, one UPDATE per distinct bucket"""
+        for bucket, delta in Counter(LeadStatsService._bucket(instance) for instance in instances).items():
+            LeadStatsService.increment(bucket, delta)
+
+    @staticmethod
+    def stored_bucket(instance) -> Optional[tuple]:
+        """Rollup bucket of a lead as currently stored in the database (None if the row is gone)"""
+        segments = LeadStatsService.ROLLUP_SOURCES[type(instance)][1]
+        stored = type(instance)._default_manager.filter(pk=instance.pk).values(*segments).first()
+        if stored is None:
+            return None
+        return LeadStatsService._bucket(instance, **{field: stored[field] or '' for field in segments})
+
+    @staticmethod
+    def record_bucket_change(instance, old_bucket: tuple):
+        """Move one saved lead from `old_bucket` to the bucket of its current values"""
+        new_bucket = LeadStatsService._bucket(instance)
+        if new_bucket != old_bucket:
+            LeadStatsService.increment(old_bucket, -1)
+            LeadStatsService.increment(new_bucket, 1)
+
+    @staticmethod
+    def record_status_changes(applications: list, new_status: str):
+        """Move many applications (carrying their old status) to `new_status`, one UPDATE per bucket"""
+        deltas = Counter()
+        for application in applications:
+            deltas[LeadStatsService._bucket(application)] -= 1
+            deltas[LeadStatsService._bucket(application, status=new_status)] += 1
+        for bucket, delta in deltas.items():
+            if delta:
+                LeadStatsService.increment(bucket, delta)
+
+    @staticmethod
+    def _day_start(day: date):
+        """Midnight at the start of `day` in the current time zone (index-friendly bound)"""
+        return timezone.make_aware(datetime.combine(day, time.min))
+
+    @staticmethod
+    def backfill(start: Optional[date] = None, end: Optional[date] = None) -> int:
+        """
+        Use Case: Rebuild rollups from the lead tables for a date range
+        
+        Existing buckets in the range are replaced. Runs one GROUP BY per
+        lead table for the range.
+        
+        Returns:
+            Number of rollup rows written
+        """
+        totals = Counter()
+        sources = {**LeadStatsService.ROLLUP_SOURCES, **LeadStatsService.ARCHIVE_ROLLUP_SOURCES}
+        for model, (lead_type, segments) in sources.items():
+            queryset = model.objects.all()
+            if start:
+                queryset = queryset.filter(created_at__gte=LeadStatsService._day_start(start))
+            if end:
+                queryset = queryset.filter(created_at__lt=LeadStatsService._day_start(end + timedelta(days=1)))
+            grouped = (
+                queryset.order_by()
+                .annotate(day=TruncDate('created_at'))
+                .values('day', *segments)
+                .annotate(total=Count('pk'))
+            )
+            for group in grouped:
+                segment_values = tuple(group.get(field) or '' for field in LeadStatsService.SEGMENT_FIELDS)
+                totals[(group['day'], lead_type) + segment_values] += group['total']
+        rows = [
+            DailyLeadRollup(
+                day=day,
+                lead_type=lead_type,
+                count=count,
+                **dict(zip(LeadStatsService.SEGMENT_FIELDS, segment_values)),
+            )
+            for (day, lead_type, *segment_values), count in totals.items()
+        ]
+
+        with transaction.atomic():
+            existing = DailyLeadRollup.objects.all()
+            if start:
+                existing = existing.filter(day__gte=start)
+            if end:
+                existing = existing.filter(day__lte=end)
+            existing.delete()
+            DailyLeadRollup.objects.bulk_create(rows, batch_size=1000)
+        return len(rows)
+
+    @staticmethod
+    def get_stats(start: date, end: date, lead_type: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Use Case: Daily lead counts for a dashboard, read from rollups only
+        
+        Returns:
+            {'totals': {lead_type: count}, 'days': [bucket rows ordered by day]}
+        """
+        queryset = DailyLeadRollup.objects.filter(day__gte=start, day__lte=end, count__gt=0)
+        if lead_type:
+            queryset = queryset.filter(lead_type=lead_type)
+
+        days = list(
+            queryset.order_by('day', 'lead_type', 'signup_type', 'status', 'position_type')
+            .values('day', 'lead_type', 'signup_type', 'status', 'position_type', 'count')
+        )
+        totals = {
+            row['lead_type']: row['total']
+            for row in queryset.order_by().values('lead_type').annotate(total=Sum('count'))
+        }
+        return {'totals': totals, 'days': days}
+
+
+class LeadInboxService:
+    """
+    Domain Service: Handles the unified lead inbox
+    Merges contacts, signups, claims and career applications into one
+    newest-first stream with a single UNION ALL query and keyset paging.
+    """
+
+    FIELDS = ['lead_type', 'lead_id', 'name', 'email', 'phone', 'created_at', 'is_read']
+
+    @staticmethod
+    def _projections() -> Dict[str, Any]:
+        """Per-table querysets projected onto the common inbox columns"""
+        text = CharField()
+        return {
+            'contact': Contact.active.annotate(
+                name=Concat('first_name', Value(' '), 'last_name', output_field=text),
+                lead_phone=Coalesce('phone', Value(''), output_field=text),
+                read=F('is_read'),
+            ),
+            'signup': Signup.active.annotate(
+                name=Coalesce(
+                    NullIf('company_name', Value('')),
+                    NullIf('owner_name', Value('')),
+                    Concat('first_name', Value(' '), 'last_name', output_field=text),
+                    output_field=text,
+                ),
+                lead_phone=Coalesce(
+                    NullIf('company_contact_number', Value('')),
+                    NullIf('owner_contact_number', Value('')),
+                    'contact_number',
+                    output_field=text,
+                ),
+                # Signups have no read flag; approval is when ops has handled one
+                read=F('is_approved'),
+            ),
+            'claim': Claim.active.annotate(
+                name=Cast('full_name', text),
+                lead_phone=Coalesce('phone', Value(''), output_field=text),
+                read=F('is_read'),
+            ),
+            'career_application': CareerApplication.active.annotate(
+                name=Cast('full_name', text),
+                lead_phone=Coalesce('phone', Value(''), output_field=text),
+                read=F('is_read'),
+            ),
+        }
+
+    @staticmethod
+    def _branch(lead_type: str, queryset, cursor: Optional[tuple], unread_only: bool, limit: int):
+        """One UNION branch: projected, filtered to rows after the cursor, ordered and limited"""
+        queryset = queryset.annotate(
+            lead_type=Value(lead_type, output_field=CharField()),
+            lead_id=Cast('pk', CharField()),
+            lead_email=Cast('email', CharField()),
+            is_lead_read=Cast('read', BooleanField()),
+        )
+        if unread_only:
+            queryset = queryset.filter(read=False)
+        if cursor:
+            created_at, cursor_type, cursor_id = cursor
+            # Order is (created_at, lead_type, lead_id) descending; lead_type is constant per branch
+            if lead_type < cursor_type:
+                queryset = queryset.filter(created_at__lte=created_at)
+            elif lead_type > cursor_type:
+                queryset = queryset.filter(created_at__lt=created_at)
+            else:
+                queryset = queryset.filter(
+                    Q(created_at__lt=created_at) | Q(created_at=created_at, lead_id__lt=cursor_id)
+                )
+        queryset = queryset.values(
+            'lead_type', 'lead_id', 'name', 'lead_email', 'lead_phone', 'created_at', 'is_lead_read'
+        ).order_by()
+        if connection.features.supports_slicing_ordering_in_compound:
+            # Each branch stops after `limit` rows of its own created_at index
+            queryset = queryset.order_by('-created_at', '-lead_id')[:limit]
+        return queryset
+
+    @staticmethod
+    def list_inbox(params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Use Case: One page of the unified lead inbox, newest first
+        
+        Args:
+            params: Query parameters (cursor, limit, unread, type)
+            
+        Returns:
+            Dictionary with 'results' (compact lead rows) and 'next_cursor'
+            
+        Raises:
+            serializers.ValidationError: If the cursor, limit or type is invalid
+        """
+        limit = LeadListService.page_size(params)
+        cursor = decode_cursor(params['cursor'], key_count=2) if params.get('cursor') else None
+        unread_only = str(params.get('unread', '')).lower() in ('1', 'true', 'yes')
+
+        projections = LeadInboxService._projections()
+        types = params.get('type')
+        if types:
+            types = [lead_type.strip() for lead_type in types.split(',')]
+            unknown = [lead_type for lead_type in types if lead_type not in projections]
+            if unknown:
+                raise serializers.ValidationError({'type': [f'Unknown lead type(s): {", ".join(unknown)}.']})
+            projections = {lead_type: projections[lead_type] for lead_type in types}
+
+        branches = [
+            LeadInboxService._branch(lead_type, queryset, cursor, unread_only, limit + 1)
+            for lead_type, queryset in projections.items()
+        ]
+        query = branches[0].union(*branches[1:], all=True) if len(branches) > 1 else branches[0]
+        rows = list(query.order_by('-created_at', '-lead_type', '-lead_id')[:limit + 1])
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(last['created_at'], last['lead_type'], last['lead_id'])
+
+        results = [
+            {
+                'type': row['lead_type'],
+                'id': row['lead_id'],
+                'name': (row['name'] or '').strip(),
+                'email': row['lead_email'],
+                'phone': row['lead_phone'] or None,
+                'created_at': row['created_at'],
+                'is_read': row['is_lead_read'],
+            }
+            for row in rows
+        ]
+        return page_payload(results, next_cursor)
+
+
+class LeadArchiveService:
+    """
+    Domain Service: Handles retention of old archived leads
+    Moves archived contacts and claims past the retention age from the hot
+    tables into their archive tables, one short transaction per batch.
+    """
+
+    # Lead kind -> (hot model, archive model)
+    SOURCES = {
+        'contact': (Contact, ArchivedContact),
+        'claim': (Claim, ArchivedClaim),
+    }
+
+    @staticmethod
+    def cutoff(older_than_days: Optional[int] = None) -> datetime:
+        """Rows created before this moment are old enough to move"""
+        if older_than_days is None:
+            older_than_days = getattr(settings, 'LEAD_ARCHIVE_AFTER_DAYS', 365)
+        return timezone.now() - timedelta(days=older_than_days)
+
+    @staticmethod
+    def eligible(kind: str, cutoff: datetime):
+        """Queryset of hot rows that are archived and older than the cutoff"""
+        model, _ = LeadArchiveService.SOURCES[kind]
+        return model.objects.filter(is_archived=True, created_at__lt=cutoff)
+
+    @staticmethod
+    def _in_archive(kind: str):
+        _, archive_model = LeadArchiveService.SOURCES[kind]
+        return Exists(archive_model.objects.filter(pk=OuterRef('pk')))
+
+    @staticmethod
+    def movable(kind: str, cutoff: datetime):
+        """Eligible rows whose id is not taken in the archive table yet"""
+        return LeadArchiveService.eligible(kind, cutoff).exclude(LeadArchiveService._in_archive(kind))
+
+    @staticmethod
+    def conflicting(kind: str, cutoff: datetime):
+        """Eligible rows that cannot move because the archive table already has their id"""
+        return LeadArchiveService.eligible(kind, cutoff).filter(LeadArchiveService._in_archive(kind))
+
+    @staticmethod
+    def archive_batch(kind: str, cutoff: datetime, batch_size: int) -> int:
+        """
+        Use Case: Move one batch of eligible rows into the archive table
+        
+        The copy and the delete commit together, so an interrupted run leaves
+        every row in exactly one table and the next run continues from there.
+        Rows locked by other transactions are skipped rather than waited on.
+        Rows whose id is already in the archive table stay where they are
+        (see conflicting()); a conflict that appears mid-batch raises
+        IntegrityError and rolls the batch back, so nothing is deleted
+        without its copy.
+        
+        Returns:
+            Number of rows moved (0 when nothing is left)
+        """
+        model, archive_model = LeadArchiveService.SOURCES[kind]
+        fields = [field.attname for field in archive_model._meta.concrete_fields if field.name != 'archived_at']
+
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                # Bound how long a batch may wait for table locks (e.g. a running migration)
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT set_config('lock_timeout', %s, true)",
+                        [f"{getattr(settings, 'LEAD_ARCHIVE_LOCK_TIMEOUT_MS', 2000)}ms"],
+                    )
+            rows = list(
+                LeadArchiveService.movable(kind, cutoff)
+                .select_for_update(skip_locked=True)
+                .order_by('created_at', 'pk')
+                .values(*fields)[:batch_size]
+            )
+            if not rows:
+                return 0
+            archived_at = timezone.now()
+            archive_model.objects.bulk_create(
+                [archive_model(archived_at=archived_at, **row) for row in rows]
+            )
+            # post_delete receivers drop the moved rows from the query cache
+            model.objects.filter(pk__in=[row['id'] for row in rows]).delete()
+        return len(rows)
@@ -0,0 +1,18 @@
+"""
+Domain Events
+Custom signals raised by domain methods. Receivers live in receivers.py.
+"""
+from django.dispatch import Signal
+
+# Sent by the bulk QuerySet transitions (LeadQuerySet and subclasses) after
+# their UPDATE, since queryset.update() does not send post_save.
+# Arguments: pks, fields
+lead_rows_updated = Signal()
+
+# Sent by BatchSubmissionService after its bulk_create, which does not send
+# post_save either. Arguments: instances
+lead_rows_created = Signal()
+
+# Sent by CareerApplicationQuerySet.update_status for the rows whose status
+# changed. Arguments: instances (carrying their old status), new_status
+career_applications_status_changed = Signal()
@@ -0,0 +1,201 @@
+"""
+Infrastructure Layer: SMTP Connection Pool
+Keeps authenticated SMTP connections alive between sends so bursts of
+notifications do not pay a TCP + TLS handshake and AUTH per message.
+"""
+import atexit
+import logging
+import queue
+import smtplib
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.core.mail.backends.smtp import EmailBackend as SMTPEmailBackend
+
+from . import timing
+
+logger = logging.getLogger(__name__)
+
+
+class PoolExhausted(Exception):
+    """Raised when no connection becomes available within the checkout timeout."""
+
+
+class _PooledConnection:
+    """A mail backend plus the bookkeeping the pool needs to judge staleness."""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.opened_at = time.monotonic()
+        self.last_used = self.opened_at
+
+
+class SMTPConnectionPool:
+    """
+    Infrastructure Service: Thread-safe pool of open mail backend connections
+
+    Connections are checked out for the duration of a send and returned
+    afterwards. A connection that has sat idle longer than `max_idle` is
+    probed with NOOP before reuse, and any connection older than `max_age`
+    is recycled, so stale sessions the relay has dropped are replaced
+    transparently.
+    """
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        max_idle: Optional[float] = None,
+        max_age: Optional[float] = None,
+        checkout_timeout: Optional[float] = None,
+        backend: Optional[str] = None,
+        **backend_kwargs: Any
+    ):
+        self.size = size or getattr(settings, 'EMAIL_POOL_SIZE', 4)
+        self.max_idle = max_idle if max_idle is not None else getattr(settings, 'EMAIL_POOL_MAX_IDLE', 30)
+        self.max_age = max_age if max_age is not None else getattr(settings, 'EMAIL_POOL_MAX_AGE', 600)
+        self.checkout_timeout = (
+            checkout_timeout if checkout_timeout is not None
+            else getattr(settings, 'EMAIL_POOL_CHECKOUT_TIMEOUT', 30)
+        )
+        self.backend = backend
+        self.backend_kwargs = backend_kwargs
+
+        self._idle: "queue.LifoQueue[_PooledConnection]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.size)
+
+    def _open(self) -> _PooledConnection:
+        backend = get_connection(backend=self.backend, fail_silently=False, **self.backend_kwargs)
+        backend.open()
+        return _PooledConnection(backend)
+
+    def _discard(self, entry: _PooledConnection):
+        try:
+            entry.backend.close()
+        except Exception:
+            # The session is already unusable; nothing left to clean up
+            pass
+
+    def _is_stale(self, entry: _PooledConnection) -> bool:
+        now = time.monotonic()
+        if now - entry.opened_at > self.max_age:
+            return True
+        if not isinstance(entry.backend, SMTPEmailBackend):
+            return False
+        if entry.backend.connection is None:
+            return True
+        if now - entry.last_used > self.max_idle:
+            try:
+                return entry.backend.connection.noop()[0] != 250
+            except (smtplib.SMTPException, OSError):
+                return True
+        return False
+
+    def _checkout(self) -> _PooledConnection:
+        if not self._slots.acquire(timeout=self.checkout_timeout):
+            raise PoolExhausted(f"No SMTP connection available after {self.checkout_timeout}s")
+        try:
+            while True:
+                try:
+                    entry = self._idle.get_nowait()
+                except queue.Empty:
+                    return self._open()
+                if not self._is_stale(entry):
+                    return entry
+                self._discard(entry)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def _checkin(self, entry: _PooledConnection, broken: bool = False):
+        try:
+            if broken:
+                self._discard(entry)
+            else:
+                entry.last_used = time.monotonic()
+                self._idle.put(entry)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        """Check out an open mail backend; it is returned to the pool on exit."""
+        entry = self._checkout()
+        broken = False
+        try:
+            yield entry.backend
+        except (smtplib.SMTPServerDisconnected, OSError):
+            broken = True
+            raise
+        finally:
+            self._checkin(entry, broken)
+
+    def send_messages(self, messages: List[EmailMessage]) -> int:
+        """
+        Send a batch of messages over a single pooled connection
+
+        A connection dropped by the relay between the staleness check and the
+        send is replaced and the batch retried once.
+
+        Returns:
+            Number of messages sent
+        """
+        if not messages:
+            return 0
+        try:
+            with self.connection() as backend:
+                return backend.send_messages(messages)
+        except smtplib.SMTPServerDisconnected:
+            logger.info("Pooled SMTP connection dropped; reconnecting and retrying batch")
+            with self.connection() as backend:
+                return backend.send_messages(messages)
+
+    def close_all(self):
+        """Close every idle connection held by the pool."""
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
+
+_pool: Optional[SMTPConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> SMTPConnectionPool:
+    """Return the process-wide pool, creating it from settings on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = SMTPConnectionPool()
+                atexit.register(_pool.close_all)
+    return _pool
+
+
+def send_pooled_mail(
+    subject: str,
+    message: str,
+    from_email: Optional[str],
+    recipient_list: List[str],
+    fail_silently: bool = False,
+    headers: Optional[Dict[str, str]] = None
+) -> int:
+    """
+    Drop-in replacement for django.core.mail.send_mail that sends through the pool
+
+    Returns:
+        Number of messages sent (0 or 1)
+    """
+    email = EmailMessage(subject, message, from_email, recipient_list, headers=headers)
+    try:
+        with timing.phase('email'):
+            return get_pool().send_messages([email])
+    except Exception:
+        if fail_silently:
+            return 0
+        raise
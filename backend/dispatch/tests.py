@@ -1,3 +1,628 @@
-from django.test import TestCase
+"""
+Tests for the dispatch app
 
-# Create your tests here.
+They use only portable ORM features, so they also run against SQLite with
+migrations disabled (MIGRATION_MODULES = {'dispatch': None}); the Postgres
+only parts (search triggers, trigram indexes, partitions) are not covered.
+"""
+import hashlib
+import json
+import logging
+import os
+import random
+import smtplib
+import subprocess
+import sys
+import tempfile
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.cache import caches
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import serializers
+
+from . import log_pipeline, metrics, query_cache, timing
+from .models import ArchivedContact, CareerApplication, Contact, DailyLeadRollup, EmailOutbox, Signup
+from .serializers import CareerApplicationResponseSerializer, ContactResponseSerializer, compiled_serializer
+from .services import (
+    BatchSubmissionService,
+    CareerApplicationQueryService,
+    CareerApplicationSubmissionService,
+    EmailOutboxService,
+    LeadArchiveService,
+    LeadStatsService,
+    SignupQueryService,
+    SignupSubmissionService,
+)
+from .validation import FORM_SERIALIZERS, FORM_VALIDATORS
+
+
+def _contact_payload(n=1, **changes):
+    payload = {
+        'first_name': 'Jane',
+        'last_name': 'Driver',
+        'email': f'jane{n}@example.com',
+        'phone': '5551234567',
+        'message': 'Looking for a dispatcher for two trucks.',
+    }
+    payload.update(changes)
+    return payload
+
+
+@override_settings(ADMIN_EMAIL='admin@example.com', EMAIL_OUTBOX_BACKOFF_BASE=30, EMAIL_OUTBOX_BACKOFF_MAX=3600)
+class EmailOutboxDeliveryTests(TestCase):
+
+    def _queue(self, max_attempts=3):
+        message = EmailOutbox.objects.create(
+            kind='contact_notification', payload=_contact_payload(), max_attempts=max_attempts
+        )
+        [leased] = EmailOutboxService.claim_batch(10)
+        self.assertEqual(leased.id, message.id)
+        return leased
+
+    def test_delivers_leased_message(self):
+        message = self._queue()
+
+        self.assertTrue(EmailOutboxService.deliver(message))
+
+        message.refresh_from_db()
+        self.assertEqual(message.status, EmailOutbox.STATUS_SENT)
+        self.assertEqual(message.attempts, 1)
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_failed_send_is_rescheduled_with_the_error(self):
+        message = self._queue()
+        error = smtplib.SMTPServerDisconnected('Connection unexpectedly closed')
+
+        with mock.patch('dispatch.email_service.send_pooled_mail', side_effect=error):
+            self.assertFalse(EmailOutboxService.deliver(message))
+
+        message.refresh_from_db()
+        self.assertEqual(message.status, EmailOutbox.STATUS_PENDING)
+        self.assertEqual(message.last_error, 'SMTPServerDisconnected: Connection unexpectedly closed')
+        self.assertGreaterEqual(message.next_attempt_at, timezone.now() + timedelta(seconds=29))
+        # Not due yet, so no worker picks it up again
+        self.assertEqual(EmailOutboxService.claim_batch(10), [])
+
+    def test_retry_succeeds_once_due(self):
+        message = self._queue()
+        with mock.patch('dispatch.email_service.send_pooled_mail', side_effect=smtplib.SMTPException('busy')):
+            EmailOutboxService.deliver(message)
+        EmailOutbox.objects.filter(id=message.id).update(next_attempt_at=timezone.now())
+
+        [retry] = EmailOutboxService.claim_batch(10)
+        self.assertTrue(EmailOutboxService.deliver(retry))
+
+        retry.refresh_from_db()
+        self.assertEqual(retry.status, EmailOutbox.STATUS_SENT)
+        self.assertEqual(retry.attempts, 2)
+        self.assertEqual(retry.last_error, '')
+
+    def test_dead_letters_after_max_attempts(self):
+        message = self._queue(max_attempts=1)
+
+        with mock.patch('dispatch.email_service.send_pooled_mail', side_effect=smtplib.SMTPException('x' * 5000)):
+            self.assertFalse(EmailOutboxService.deliver(message))
+
+        message.refresh_from_db()
+        self.assertEqual(message.status, EmailOutbox.STATUS_DEAD)
+        self.assertEqual(len(message.last_error), EmailOutbox.LAST_ERROR_MAX_LENGTH)
+        self.assertTrue(message.last_error.startswith('SMTPException: xxx'))
+
+    def test_expired_lease_is_reclaimed(self):
+        message = self._queue()
+        EmailOutbox.objects.filter(id=message.id).update(locked_at=timezone.now() - timedelta(hours=1))
+
+        [reclaimed] = EmailOutboxService.claim_batch(10)
+
+        self.assertEqual(reclaimed.id, message.id)
+        self.assertEqual(reclaimed.attempts, 2)
+
+
+class IdempotentSubmitTests(TestCase):
+
+    def setUp(self):
+        caches['default'].clear()
+
+    def _post(self, url, payload, key=None, **extra):
+        if key is not None:
+            extra['HTTP_IDEMPOTENCY_KEY'] = key
+        return self.client.post(url, json.dumps(payload), content_type='application/json', **extra)
+
+    def test_retry_with_key_replays_the_response(self):
+        url = reverse('dispatch:submit_contact')
+        first = self._post(url, _contact_payload(), key='retry-1')
+        retry = self._post(url, _contact_payload(), key='retry-1')
+
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(retry.status_code, 201)
+        self.assertEqual(retry['Idempotent-Replayed'], 'true')
+        self.assertEqual(retry.json(), first.json())
+        self.assertEqual(Contact.objects.count(), 1)
+
+    def test_key_reused_with_another_body_is_rejected(self):
+        url = reverse('dispatch:submit_contact')
+        self._post(url, _contact_payload(1), key='reused')
+        response = self._post(url, _contact_payload(2), key='reused')
+
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(Contact.objects.count(), 1)
+
+    def test_retry_while_in_flight_is_rejected(self):
+        url = reverse('dispatch:submit_contact')
+        self._post(url, _contact_payload(), key='in-flight')
+        # What the original request holds while its view runs
+        cache_key = f'idempotency:contact:{hashlib.sha256(b"other").hexdigest()}'
+        caches['default'].add(f'{cache_key}:lock', True)
+
+        response = self._post(url, _contact_payload(), key='other')
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(Contact.objects.count(), 1)
+
+    def test_body_fingerprint_is_per_client(self):
+        url = reverse('dispatch:submit_contact')
+        payload = _contact_payload()
+        first = self._post(url, payload, REMOTE_ADDR='10.0.0.1')
+        retry = self._post(url, payload, REMOTE_ADDR='10.0.0.1')
+        other_client = self._post(url, payload, REMOTE_ADDR='10.0.0.2')
+
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(retry['Idempotent-Replayed'], 'true')
+        self.assertEqual(other_client.status_code, 201)
+        self.assertFalse(other_client.has_header('Idempotent-Replayed'))
+        self.assertEqual(Contact.objects.count(), 2)
+
+    def test_fingerprint_ignores_key_order_and_whitespace(self):
+        url = reverse('dispatch:submit_contact')
+        payload = _contact_payload()
+        self._post(url, payload)
+        reordered = json.dumps(dict(reversed(list(payload.items()))), indent=2)
+        retry = self.client.post(url, reordered, content_type='application/json')
+
+        self.assertEqual(retry['Idempotent-Replayed'], 'true')
+        self.assertEqual(Contact.objects.count(), 1)
+
+
+@override_settings(DATA_UPLOAD_MAX_MEMORY_SIZE=64 * 1024)
+class BatchSubmitTests(TestCase):
+
+    def setUp(self):
+        caches['default'].clear()
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'pw'))
+
+    def test_anonymous_batch_is_refused(self):
+        self.client.logout()
+        url = reverse('dispatch:submit_batch', kwargs={'kind': 'contact'})
+
+        response = self.client.post(url, json.dumps([_contact_payload()]), content_type='application/json')
+
+        self.assertIn(response.status_code, (401, 403))
+        self.assertEqual(Contact.objects.count(), 0)
+
+    def test_batch_above_the_upload_limit(self):
+        items = [_contact_payload(n) for n in range(1500)]
+        body = '\n'.join(json.dumps(item) for item in items)
+        self.assertGreater(len(body), 64 * 1024)
+        url = reverse('dispatch:submit_batch', kwargs={'kind': 'contact'})
+
+        response = self.client.post(url, body, content_type='application/x-ndjson', HTTP_IDEMPOTENCY_KEY='big')
+        retry = self.client.post(url, body, content_type='application/x-ndjson', HTTP_IDEMPOTENCY_KEY='big')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['data']['created'], 1500)
+        self.assertEqual(retry['Idempotent-Replayed'], 'true')
+        self.assertEqual(Contact.objects.count(), 1500)
+
+    def test_same_key_on_another_kind_is_not_replayed(self):
+        body = json.dumps([_contact_payload()])
+
+        first = self.client.post(
+            reverse('dispatch:submit_batch', kwargs={'kind': 'contact'}), body,
+            content_type='application/json', HTTP_IDEMPOTENCY_KEY='shared',
+        )
+        second = self.client.post(
+            reverse('dispatch:submit_batch', kwargs={'kind': 'claim'}), body,
+            content_type='application/json', HTTP_IDEMPOTENCY_KEY='shared',
+        )
+
+        self.assertEqual(first.status_code, 201)
+        self.assertNotIn('Idempotent-Replayed', second)
+        self.assertEqual(second.status_code, 400)
+        self.assertEqual(Contact.objects.count(), 1)
+
+    def test_partial_batch(self):
+        items = [_contact_payload(1), _contact_payload(2, email='not-an-email'), _contact_payload(3)]
+        url = reverse('dispatch:submit_batch', kwargs={'kind': 'contact'})
+
+        response = self.client.post(url, json.dumps(items), content_type='application/json')
+
+        self.assertEqual(response.status_code, 207)
+        results = response.json()['data']['results']
+        self.assertEqual([result['success'] for result in results], [True, False, True])
+        self.assertIn('email', results[1]['errors'])
+
+
+class RollupBucketTests(TestCase):
+
+    def _counts(self, lead_type):
+        return {
+            (row.signup_type, row.status, row.position_type): row.count
+            for row in DailyLeadRollup.objects.filter(lead_type=lead_type, count__gt=0)
+        }
+
+    def _application(self, **fields):
+        return CareerApplication.objects.create(
+            full_name='Sam Carrier', email='sam@example.com', phone='5551234567', position_type='remote', **fields
+        )
+
+    def test_update_status_moves_bucket(self):
+        application = self._application()
+
+        application.update_status('reviewing', reviewed_by='hr')
+
+        self.assertEqual(self._counts('career_application'), {('', 'reviewing', 'remote'): 1})
+
+    def test_admin_change_form_moves_bucket(self):
+        application = self._application()
+        admin_user = User.objects.create_superuser('admin', 'admin@example.com', 'pw')
+        self.client.force_login(admin_user)
+        form = {
+            'full_name': application.full_name, 'email': application.email, 'phone': application.phone,
+            'position_type': 'onsite', 'job_title': application.job_title, 'status': 'interviewing',
+        }
+
+        response = self.client.post(reverse('admin:dispatch_careerapplication_change', args=[application.pk]), form)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(self._counts('career_application'), {('', 'interviewing', 'onsite'): 1})
+
+    def test_save_without_segment_change_keeps_bucket(self):
+        application = self._application()
+        application.mark_as_read()
+        application.notes = 'Called back'
+        application.save()
+
+        self.assertEqual(self._counts('career_application'), {('', 'pending', 'remote'): 1})
+
+    def test_bulk_status_update_moves_buckets(self):
+        self._application()
+        self._application(status='reviewing')
+
+        CareerApplication.objects.all().update_status('rejected')
+
+        self.assertEqual(self._counts('career_application'), {('', 'rejected', 'remote'): 2})
+
+    def test_signup_type_edit_moves_bucket(self):
+        signup = Signup.objects.create(
+            signup_type='company', company_name='Acme', company_email='ops@acme.com', number_of_trucks='3',
+            truck_type='Dry Van', communication_method='email', email='ops@acme.com',
+        )
+        signup.signup_type = 'owner-operator'
+        signup.save()
+
+        self.assertEqual(self._counts('signup'), {('owner-operator', '', ''): 1})
+
+    def test_rollups_match_backfill(self):
+        application = self._application()
+        application.update_status('accepted')
+        application.position_type = 'onsite'
+        application.save()
+        incremental = self._counts('career_application')
+
+        LeadStatsService.backfill()
+
+        self.assertEqual(self._counts('career_application'), incremental)
+
+
+@override_settings(QUERY_CACHE_ENABLED=True)
+class QueryCacheInvalidationTests(TestCase):
+
+    def setUp(self):
+        caches['query'].clear()
+
+    def _signup_payload(self, n=1):
+        return {
+            'signup_type': 'company', 'company_name': f'Acme {n}', 'company_email': f'ops{n}@acme.com',
+            'company_contact_number': '5551234567', 'motor_carrier_no': f'MC-{n}', 'number_of_trucks': '3',
+            'truck_type': 'Dry Van', 'communication_method': 'email', 'email': f'owner{n}@acme.com',
+        }
+
+    def test_save_drops_cached_row(self):
+        application = CareerApplication.objects.create(
+            full_name='Sam Carrier', email='sam@example.com', phone='5551234567', position_type='remote'
+        )
+        self.assertEqual(CareerApplicationQueryService.get_application_by_id(application.pk).status, 'pending')
+
+        application.update_status('accepted')
+
+        self.assertEqual(CareerApplicationQueryService.get_application_by_id(application.pk).status, 'accepted')
+
+    def test_bulk_transition_drops_cached_lists(self):
+        CareerApplication.objects.create(
+            full_name='Sam Carrier', email='sam@example.com', phone='5551234567', position_type='remote'
+        )
+        self.assertEqual(len(CareerApplicationQueryService.get_pending_applications()), 1)
+
+        CareerApplication.objects.all().update_status('rejected')
+
+        self.assertEqual(CareerApplicationQueryService.get_pending_applications(), [])
+
+    def test_batch_insert_drops_cached_not_found_email(self):
+        self.assertIsNone(SignupQueryService.get_signup_by_email('owner1@acme.com'))
+
+        result = BatchSubmissionService.create_batch('signup', [self._signup_payload(1)])
+
+        self.assertEqual(result['created'], 1)
+        self.assertIsNotNone(SignupQueryService.get_signup_by_email('owner1@acme.com'))
+
+    def test_batch_insert_drops_cached_lists(self):
+        count_contacts = lambda: [Contact.objects.count()]  # noqa: E731
+        self.assertEqual(query_cache.get_list(Contact, 'count', count_contacts), [0])
+
+        BatchSubmissionService.create_batch('contact', [_contact_payload(1), _contact_payload(2)])
+
+        self.assertEqual(query_cache.get_list(Contact, 'count', count_contacts), [2])
+
+
+class LeadArchiveTests(TestCase):
+
+    def setUp(self):
+        self.old = timezone.now() - timedelta(days=400)
+        for n in range(7):
+            Contact.objects.create(**_contact_payload(n), is_archived=n < 5)
+        Contact.objects.update(created_at=self.old)
+        self.cutoff = LeadArchiveService.cutoff(365)
+
+    def test_archive_batches_conserve_rows(self):
+        before = {contact.pk: contact.email for contact in Contact.objects.all()}
+
+        moved = []
+        while count := LeadArchiveService.archive_batch('contact', self.cutoff, batch_size=2):
+            moved.append(count)
+
+        self.assertEqual(moved, [2, 2, 1])
+        hot = dict(Contact.objects.values_list('pk', 'email'))
+        cold = dict(ArchivedContact.objects.values_list('pk', 'email'))
+        self.assertEqual(len(hot), 2)
+        self.assertFalse(hot.keys() & cold.keys())
+        self.assertEqual({**hot, **cold}, before)
+        self.assertEqual(ArchivedContact.objects.get(pk=min(cold)).created_at, self.old)
+
+    def test_id_taken_in_archive_is_left_in_place(self):
+        taken = Contact.objects.filter(is_archived=True).order_by('pk').first()
+        ArchivedContact.objects.create(
+            id=taken.pk, first_name='Other', last_name='Lead', email='other@example.com', message='kept',
+            created_at=self.old, updated_at=self.old,
+        )
+
+        while LeadArchiveService.archive_batch('contact', self.cutoff, batch_size=10):
+            pass
+
+        self.assertTrue(Contact.objects.filter(pk=taken.pk, email=taken.email).exists())
+        self.assertEqual(ArchivedContact.objects.get(pk=taken.pk).email, 'other@example.com')
+        self.assertEqual(list(LeadArchiveService.conflicting('contact', self.cutoff)), [taken])
+        self.assertEqual(ArchivedContact.objects.count(), 5)
+        self.assertEqual(Contact.objects.count(), 3)
+
+
+class CompiledValidatorParityTests(SimpleTestCase):
+    """The compiled validators accept, build and reject exactly what the DRF serializers do"""
+
+    BUILDS = {
+        'signup': SignupSubmissionService.build_signup_data,
+        'career_application': CareerApplicationSubmissionService.build_application_data,
+    }
+    VALID = {
+        'contact': _contact_payload(),
+        'claim': {'full_name': 'Sam Carrier', 'email': 'sam@example.com', 'age_of_mc_authority': 2,
+                  'company_name': ' Carrier Co ', 'preferred_route': None},
+        'signup': {'signup_type': 'company', 'company_name': 'Acme', 'company_email': 'Ops@Acme.com',
+                   'company_contact_number': '5551234567', 'motor_carrier_no': 'MC-1', 'number_of_trucks': '2',
+                   'truck_type': 'Dry Van', 'communication_method': 'email', 'email': 'Owner@Acme.com'},
+        'career_application': {'full_name': 'Sam Carrier', 'email': 'Sam@Example.com', 'phone': '555-555-5555',
+                               'position_type': 'remote', 'city_state': None},
+    }
+    # Replacement values, valid or not, for the mutated fields
+    VALUES = [
+        None, '', ' ', '  x  ', 'John', 'a' * 101, 'a' * 256, 'a' * 5001, 'a long enough message',
+        'x@example.com', ' X@Example.COM ', 'bad@', 'https://linkedin.com/in/x', 'https://example.com',
+        'linkedin.com/in/x', '555-555-5555', '(555) 555.5555', '12345', 'company', 'owner-operator',
+        'remote', 'onsite', '3', '3.0', '-1', '1.5', 3, 0, -2, 2.0, True, [], {}, 'a\x00b', '\ud800',
+    ]
+
+    def _drf(self, kind, payload):
+        serializer = FORM_SERIALIZERS[kind](data=payload)
+        if not serializer.is_valid():
+            return None, {
+                field: [(str(message), message.code) for message in messages]
+                for field, messages in serializer.errors.items()
+            }
+        build = self.BUILDS.get(kind)
+        return (build(serializer.validated_data) if build else dict(serializer.validated_data)), {}
+
+    def _compiled(self, kind, payload):
+        kwargs, errors = FORM_VALIDATORS[kind].run(payload)
+        # As raised by validate(): plain messages become ErrorDetails
+        detail = serializers.ValidationError(errors).detail if errors else {}
+        return kwargs, {
+            field: [(str(message), message.code) for message in messages]
+            for field, messages in detail.items()
+        }
+
+    def _assert_parity(self, kind, payload):
+        drf_kwargs, drf_errors = self._drf(kind, payload)
+        kwargs, errors = self._compiled(kind, payload)
+        self.assertEqual(kwargs, drf_kwargs, payload)
+        if kind == 'signup':
+            # Cross-field errors are reported together with field errors; the
+            # serializer stops at the first, so its errors are a subset
+            self.assertEqual(bool(errors), bool(drf_errors), payload)
+            for field, messages in drf_errors.items():
+                self.assertEqual(errors.get(field), messages, payload)
+        else:
+            self.assertEqual(errors, drf_errors, payload)
+
+    def test_valid_payloads(self):
+        for kind, payload in self.VALID.items():
+            with self.subTest(kind=kind):
+                self.assertIsNotNone(self._compiled(kind, payload)[0])
+                self._assert_parity(kind, payload)
+
+    def test_mutated_payloads(self):
+        rnd = random.Random(22)
+        for kind, valid in self.VALID.items():
+            names = [field.name for field in FORM_VALIDATORS[kind].fields]
+            for _ in range(300):
+                payload = dict(valid)
+                for _ in range(rnd.randint(1, 3)):
+                    name = rnd.choice(names)
+                    if rnd.random() < 0.15:
+                        payload.pop(name, None)
+                    else:
+                        payload[name] = rnd.choice(self.VALUES)
+                with self.subTest(kind=kind, payload=payload):
+                    self._assert_parity(kind, payload)
+
+
+class CompiledResponseSerializerParityTests(TestCase):
+
+    def test_matches_drf_representation(self):
+        contact = Contact.objects.create(**_contact_payload(phone=None))
+        application = CareerApplication.objects.create(
+            full_name='Sam Carrier', email='sam@example.com', phone='5551234567', position_type='onsite'
+        )
+        cases = [(ContactResponseSerializer, contact), (CareerApplicationResponseSerializer, application)]
+        for serializer_class, instance in cases:
+            with self.subTest(serializer=serializer_class.__name__):
+                compiled = compiled_serializer(serializer_class)
+                self.assertEqual(compiled.serialize(instance), serializer_class(instance).data)
+                self.assertEqual(compiled.serialize_many([instance]), serializer_class([instance], many=True).data)
+
+
+@override_settings(SERVER_TIMING_ENABLED=True, SERVER_TIMING_HEADER=True, METRICS_ENABLED=False)
+class ServerTimingTests(TestCase):
+
+    def setUp(self):
+        caches['default'].clear()
+
+    def _post_contact(self, client):
+        return client.post(reverse('dispatch:submit_contact'), json.dumps(_contact_payload()), content_type='application/json')
+
+    def test_timed_request_counts_queries_and_removes_the_wrapper(self):
+        response = self._post_contact(self.client)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertRegex(response['Server-Timing'], r'db;dur=[0-9.]+;desc="[1-9][0-9]* queries"')
+        self.assertNotIn(timing._time_query, connection.execute_wrappers)
+
+    @override_settings(SERVER_TIMING_SAMPLE_RATE=0)
+    def test_unsampled_request_is_not_wrapped(self):
+        with mock.patch.object(timing, '_add_query_timer', wraps=timing._add_query_timer) as add_query_timer:
+            response = self._post_contact(self.client)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertNotIn('Server-Timing', response)
+        add_query_timer.assert_not_called()
+
+    async def test_async_view_queries_are_timed(self):
+        url = reverse('dispatch:submit_contact')
+        response = await self.async_client.post(url, _contact_payload(), content_type='application/json')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertRegex(response['Server-Timing'], r'db;dur=[0-9.]+;desc="[1-9][0-9]* queries"')
+
+
+@override_settings(METRICS_ENABLED=True, METRICS_TOKEN='')
+class MetricsEndpointTests(TestCase):
+
+    def test_disabled_by_default(self):
+        with self.settings(METRICS_ENABLED=False):
+            self.assertEqual(self.client.get(reverse('metrics')).status_code, 404)
+
+    def test_token_required_outside_debug(self):
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, 403)
+        with self.settings(DEBUG=True):
+            self.assertEqual(self.client.get(reverse('metrics')).status_code, 200)
+
+    @override_settings(METRICS_TOKEN='scrape-secret')
+    def test_bearer_token(self):
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, 401)
+        response = self.client.get(reverse('metrics'), HTTP_AUTHORIZATION='Bearer scrape-secret')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('# TYPE dispatch_http_requests_total counter', response.content.decode())
+
+
+class MetricsSnapshotTests(TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        override = self.settings(METRICS_MULTIPROC_DIR=self.directory)
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def _exited_pid(self) -> int:
+        process = subprocess.Popen([sys.executable, '-c', ''])
+        process.wait()
+        return process.pid
+
+    def _write_snapshot(self, filename: str, queries: float):
+        with open(os.path.join(self.directory, filename), 'w') as handle:
+            json.dump({metrics.DB_QUERIES.name: [[['snapshot-test'], queries]]}, handle)
+
+    def test_snapshot_file_is_named_by_pid_and_start_time(self):
+        metrics.flush()
+
+        self.assertEqual(os.listdir(self.directory), [f'{os.getpid()}-{metrics._started}.json'])
+
+    def test_exited_processes_are_folded_into_one_file(self):
+        self._write_snapshot(f'{self._exited_pid()}-1.json', 3)
+        self._write_snapshot(f'{self._exited_pid()}-2.json', 4)
+        line = 'dispatch_db_queries_total{view="snapshot-test"} 7'
+
+        self.assertIn(line, metrics.render())
+        self.assertEqual(
+            sorted(name for name in os.listdir(self.directory) if name.endswith('.json')),
+            sorted([metrics.EXITED_FILENAME, f'{os.getpid()}-{metrics._started}.json']),
+        )
+        # Folded counts stay in the totals on later scrapes
+        self._write_snapshot(f'{self._exited_pid()}-3.json', 5)
+        self.assertIn('dispatch_db_queries_total{view="snapshot-test"} 12', metrics.render())
+
+
+class QueueLogHandlerTests(SimpleTestCase):
+
+    def setUp(self):
+        self.handler = log_pipeline.QueueLogHandler(
+            sink='logging.handlers.BufferingHandler', sink_kwargs={'capacity': 100}
+        )
+        self.addCleanup(self.handler.close)
+        self.logger = logging.getLogger('dispatch.tests.log_pipeline')
+        self.logger.propagate = False
+        self.logger.addHandler(self.handler)
+        self.addCleanup(self.logger.removeHandler, self.handler)
+
+    def _records(self):
+        self.handler.stop()
+        return self.handler.sink.buffer
+
+    def test_mutable_args_keep_their_state_at_the_logging_call(self):
+        lead = {'status': 'pending'}
+        self.logger.warning('Lead %s', lead)
+        lead['status'] = 'approved'
+
+        self.assertEqual([record.getMessage() for record in self._records()], ["Lead {'status': 'pending'}"])
+
+    def test_immutable_args_are_left_to_the_listener(self):
+        self.logger.warning('Lead %s of %d', 'jane@example.com', 3)
+
+        (record,) = self._records()
+        self.assertEqual(record.args, ('jane@example.com', 3))
+        self.assertEqual(record.getMessage(), 'Lead jane@example.com of 3')
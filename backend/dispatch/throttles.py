@@ -0,0 +1,11 @@
+"""
+Presentation Layer: Request Throttles
+Rate limits for the bulk endpoints; rates are set in
+REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'].
+"""
+from rest_framework.throttling import UserRateThrottle
+
+
+class BatchRateThrottle(UserRateThrottle):
+    """Batch submissions per user (one request may create thousands of rows)"""
+    scope = 'batch'
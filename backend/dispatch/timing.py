@@ -0,0 +1,230 @@
+"""
+Infrastructure Layer: Per-Request Phase Timing
+ServerTimingMiddleware measures where a request's time goes and reports it
+as a Server-Timing response header and as structured fields on one log line
+per request (logger 'dispatch.timing').
+
+Phases:
+- db: every SQL query, with the query count (a database execute wrapper)
+- parse / render: the JSON parsers and renderer
+- validate / duplicate_check / email: hooks in the submission services
+Phases may overlap (a duplicate check is also db time); 'total' is the
+whole request as seen by the middleware.
+
+Hooks are `with timing.phase('name'):` blocks. Outside a timed request
+(middleware disabled, management commands, the outbox worker) phase()
+returns a shared no-op context manager after one ContextVar lookup.
+
+The database execute wrapper is only installed for requests whose timing is
+emitted: begin() adds it to the request's connections and end() removes it.
+With SERVER_TIMING_ENABLED=False, or with no header and the 'dispatch.timing'
+logger below INFO, the middleware removes itself at startup;
+SERVER_TIMING_SAMPLE_RATE times only that fraction of requests.
+"""
+import contextlib
+import contextvars
+import logging
+import random
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+# Header order; other phase names follow in the order they were first recorded
+PHASE_ORDER = ('parse', 'validate', 'duplicate_check', 'db', 'email', 'render')
+
+_current = contextvars.ContextVar('dispatch_request_timer', default=None)
+_NO_PHASE = contextlib.nullcontext()
+
+
+class RequestTimer:
+    """Phase durations (seconds) and query count for one request"""
+    __slots__ = ('started', 'phases', 'queries')
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases = {}
+        self.queries = 0
+
+    def add(self, name: str, seconds: float):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def header(self, total: float) -> str:
+        """Server-Timing header value, durations in milliseconds"""
+        names = [name for name in PHASE_ORDER if name in self.phases]
+        names += [name for name in self.phases if name not in PHASE_ORDER]
+        entries = []
+        for name in names:
+            entry = f'{name};dur={self.phases[name] * 1000:.2f}'
+            if name == 'db':
+                entry += f';desc="{self.queries} queries"'
+            entries.append(entry)
+        entries.append(f'total;dur={total * 1000:.2f}')
+        return ', '.join(entries)
+
+
+class _Phase:
+    __slots__ = ('timer', 'name', 'started')
+
+    def __init__(self, timer: RequestTimer, name: str):
+        self.timer = timer
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.timer.add(self.name, time.perf_counter() - self.started)
+        return False
+
+
+def current_timer():
+    """The RequestTimer of the request being handled, or None"""
+    return _current.get()
+
+
+def phase(name: str):
+    """Context manager adding the time spent in its block to the named phase"""
+    timer = _current.get()
+    if timer is None:
+        return _NO_PHASE
+    return _Phase(timer, name)
+
+
+def _time_query(execute, sql, params, many, context):
+    timer = _current.get()
+    if timer is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timer.add('db', time.perf_counter() - started)
+        timer.queries += 1
+
+
+def _add_query_timer():
+    """Add the query timer to this thread's connections; the ones it was added to"""
+    added = []
+    for connection in connections.all():
+        if _time_query not in connection.execute_wrappers:
+            connection.execute_wrappers.append(_time_query)
+            added.append(connection)
+    return added
+
+
+def begin():
+    """
+    (timer, token) for the request being handled in this context: the
+    timer an outer middleware started (token None), or a new one
+
+    A new timer also adds the query timer to this thread's connections
+    until end(token), so queries are only wrapped while a request is timed.
+    """
+    timer = _current.get()
+    if timer is not None:
+        return timer, None
+    timer = RequestTimer()
+    return timer, (_current.set(timer), _add_query_timer())
+
+
+async def abegin():
+    """
+    begin() for async middleware
+
+    Connections are per thread: the query timer is added on the thread
+    that runs this request's ORM calls (the request's thread-sensitive
+    sync_to_async thread, which also runs the sync views).
+    """
+    timer = _current.get()
+    if timer is not None:
+        return timer, None
+    timer = RequestTimer()
+    context_token = _current.set(timer)
+    return timer, (context_token, await sync_to_async(_add_query_timer)())
+
+
+def end(token):
+    """Stop timing in this context if begin() started the timer"""
+    if token is None:
+        return
+    context_token, connections_timed = token
+    for connection in connections_timed:
+        connection.execute_wrappers.remove(_time_query)
+    _current.reset(context_token)
+
+
+def _sampled() -> bool:
+    rate = getattr(settings, 'SERVER_TIMING_SAMPLE_RATE', 1.0)
+    return rate >= 1 or random.random() < rate
+
+
+class ServerTimingMiddleware:
+    """
+    Times each request and reports its phases (see module docstring)
+
+    Place it first in MIDDLEWARE so 'total' covers the other middleware.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'SERVER_TIMING_ENABLED', False):
+            raise MiddlewareNotUsed
+        if not getattr(settings, 'SERVER_TIMING_HEADER', True) and not logger.isEnabledFor(logging.INFO):
+            # Nothing would be emitted
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if not _sampled():
+            return self.get_response(request)
+        timer, token = begin()
+        try:
+            response = self.get_response(request)
+        finally:
+            end(token)
+        return self._report(request, response, timer)
+
+    async def __acall__(self, request):
+        if not _sampled():
+            return await self.get_response(request)
+        timer, token = await abegin()
+        try:
+            response = await self.get_response(request)
+        finally:
+            end(token)
+        return self._report(request, response, timer)
+
+    def _report(self, request, response, timer: RequestTimer):
+        total = timer.elapsed()
+        if getattr(settings, 'SERVER_TIMING_HEADER', True):
+            response['Server-Timing'] = timer.header(total)
+        match = request.resolver_match
+        logger.info(
+            '%s %s %s %.1fms (%d queries)',
+            request.method, request.path, response.status_code, total * 1000, timer.queries,
+            extra={
+                'method': request.method,
+                'path': request.path,
+                'view': match.view_name if match else None,
+                'status': response.status_code,
+                'duration_ms': round(total * 1000, 2),
+                'db_queries': timer.queries,
+                'phases_ms': {name: round(seconds * 1000, 2) for name, seconds in timer.phases.items()},
+            },
+        )
+        return response
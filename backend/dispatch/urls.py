@@ -1,12 +1,41 @@
+from django.conf import settings
 from django.urls import path
 from . import views
 
 app_name = 'dispatch'
 
+# Serve the submit endpoints with native async views under ASGI
+if getattr(settings, 'DISPATCH_ASYNC_VIEWS', False):
+    submit_views = {
+        'contact': views.asubmit_contact,
+        'signup': views.asubmit_signup,
+        'claim': views.asubmit_claim,
+        'career_application': views.asubmit_career_application,
+    }
+else:
+    submit_views = {
+        'contact': views.submit_contact,
+        'signup': views.submit_signup,
+        'claim': views.submit_claim,
+        'career_application': views.submit_career_application,
+    }
+
 urlpatterns = [
     path('', views.test_api, name='test_api'),
-    path('contact/', views.submit_contact, name='submit_contact'),
-    path('signup/', views.submit_signup, name='submit_signup'),
-    path('claim/', views.submit_claim, name='submit_claim'),
-    path('career-application/', views.submit_career_application, name='submit_career_application'),
+    path('contact/', submit_views['contact'], name='submit_contact'),
+    path('signup/', submit_views['signup'], name='submit_signup'),
+    path('claim/', submit_views['claim'], name='submit_claim'),
+    path('career-application/', submit_views['career_application'], name='submit_career_application'),
+    path('batch/<str:kind>/', views.submit_batch, name='submit_batch'),
+    path('contacts/', views.list_leads, {'kind': 'contact'}, name='list_contacts'),
+    path('signups/', views.list_leads, {'kind': 'signup'}, name='list_signups'),
+    path('claims/', views.list_leads, {'kind': 'claim'}, name='list_claims'),
+    path('career-applications/', views.list_leads, {'kind': 'career_application'}, name='list_career_applications'),
+    path('search/', views.search_leads, name='search_leads'),
+    path('names/', views.fuzzy_name_lookup, name='fuzzy_name_lookup'),
+    path('export/<str:kind>/', views.export_leads, name='export_leads'),
+    path('bulk/<str:kind>/', views.bulk_update_leads, name='bulk_update_leads'),
+    path('stats/', views.lead_stats, name='lead_stats'),
+    path('inbox/', views.lead_inbox, name='lead_inbox'),
+    path('cache/stats/', views.query_cache_stats, name='query_cache_stats'),
 ]
@@ -0,0 +1,432 @@
+"""
+Application Layer: Compiled Submission Validators
+Single-pass normalizer/validator for each submit form. A validator is built
+once at import and, per request, visits every field exactly once: it trims,
+checks and normalizes the value, collects every error instead of stopping at
+the first one, and returns the model kwargs directly (what a *CreateSerializer
+plus the service's build_*_data produced together).
+
+Error payloads use the same per-field messages as the DRF serializers, taken
+from the DRF field classes. The one difference is that cross-field errors
+(e.g. the signup type rules) are reported together with field errors,
+where the serializers only reported the first of them.
+
+Only plain JSON objects take this path; anything else (form-encoded bodies,
+non-objects) still goes through the DRF serializer.
+"""
+import re
+from typing import Any, Callable, Dict, Optional
+
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.validators import EmailValidator, ProhibitNullCharactersValidator, URLValidator
+from rest_framework import serializers
+from rest_framework.exceptions import ErrorDetail
+from rest_framework.utils.formatting import lazy_format
+from rest_framework.validators import ProhibitSurrogateCharactersValidator
+
+from . import timing
+from .serializers import (
+    ContactCreateSerializer,
+    SignupCreateSerializer,
+    ClaimCreateSerializer,
+    CareerApplicationCreateSerializer,
+)
+
+# Marks a key absent from the payload (None is a value: JSON null)
+MISSING = object()
+
+_CHAR_MESSAGES = serializers.CharField.default_error_messages
+_INT_MESSAGES = serializers.IntegerField.default_error_messages
+_REQUIRED = serializers.Field.default_error_messages['required']
+_NULL = serializers.Field.default_error_messages['null']
+
+# IntegerField accepts "3.0" / "3.00 " as 3
+_DECIMAL_SUFFIX = re.compile(r'\.0*\s*$')
+
+# Formatting characters ignored when checking a phone number
+_PHONE_FORMATTING = str.maketrans('', '', '- ().')
+
+_INVALID_TEXT = {
+    'char': _CHAR_MESSAGES['invalid'],
+    'email': serializers.EmailField.default_error_messages['invalid'],
+    'url': serializers.URLField.default_error_messages['invalid'],
+}
+
+_EMAIL_VALIDATOR = EmailValidator(message=_INVALID_TEXT['email'])
+_URL_VALIDATOR = URLValidator(message=_INVALID_TEXT['url'])
+
+
+class FieldInvalid(Exception):
+    """
+    Raised by a field or a check with the errors for that field
+
+    Messages become ErrorDetails with the same codes the DRF field would
+    use; bare messages get DRF's default code, 'invalid'.
+    """
+
+    def __init__(self, *messages, code: str = 'invalid'):
+        super().__init__(*messages)
+        self.messages = [
+            message if isinstance(message, ErrorDetail) else ErrorDetail(str(message), code)
+            for message in messages
+        ]
+
+
+class Field:
+    """
+    One compiled form field, mirroring the DRF field it replaces
+
+    kind is 'char', 'email', 'url', 'int' or 'choice'. `check` is the
+    serializer's validate_<field> method as a function of the cleaned value:
+    it returns the final value or raises FieldInvalid.
+    """
+    __slots__ = (
+        'name', 'kind', 'required', 'allow_blank', 'allow_null', 'default',
+        'max_length', 'min_length', 'min_value', 'choices', 'check', '_messages',
+    )
+
+    def __init__(self, name: str, kind: str = 'char', *, required: bool = True, allow_blank: bool = False,
+                 allow_null: bool = False, default: Any = MISSING, max_length: Optional[int] = None,
+                 min_length: Optional[int] = None, min_value: Optional[int] = None, choices=None,
+                 check: Optional[Callable[[Any], Any]] = None):
+        self.name = name
+        self.kind = kind
+        self.required = required and default is MISSING
+        self.allow_blank = allow_blank
+        self.allow_null = allow_null
+        self.default = default
+        self.max_length = max_length
+        self.min_length = min_length
+        self.min_value = min_value
+        self.choices = {str(choice): choice for choice in choices or ()}
+        self.check = check
+        self._messages = {
+            'max_length': lazy_format(_CHAR_MESSAGES['max_length'], max_length=max_length),
+            'min_length': lazy_format(_CHAR_MESSAGES['min_length'], min_length=min_length),
+            'min_value': lazy_format(_INT_MESSAGES['min_value'], min_value=min_value),
+        }
+
+    def clean(self, raw: Any) -> Any:
+        """Cleaned value, or MISSING to leave the key out of the model kwargs"""
+        if raw is MISSING:
+            if self.default is not MISSING:
+                value = self.default
+            elif self.required:
+                raise FieldInvalid(_REQUIRED, code='required')
+            else:
+                return MISSING
+        elif raw is None:
+            if not self.allow_null:
+                raise FieldInvalid(_NULL, code='null')
+            value = None
+        elif self.kind == 'int':
+            value = self._clean_int(raw)
+        elif self.kind == 'choice':
+            try:
+                value = self.choices[str(raw)]
+            except KeyError:
+                raise FieldInvalid(lazy_format(serializers.ChoiceField.default_error_messages['invalid_choice'],
+                                               input=raw), code='invalid_choice')
+        else:
+            value = self._clean_text(raw)
+        return value if self.check is None else self.check(value)
+
+    def _clean_text(self, raw: Any) -> str:
+        value = (raw if type(raw) is str else str(raw)).strip()
+        if not value:
+            if not self.allow_blank:
+                raise FieldInvalid(_CHAR_MESSAGES['blank'], code='blank')
+            return ''
+        if isinstance(raw, bool) or not isinstance(raw, (str, int, float)):
+            # EmailField/URLField override CharField's 'invalid' message
+            raise FieldInvalid(_INVALID_TEXT[self.kind])
+
+        # Same validators and order as the DRF field; all failures are reported
+        errors = []
+        if self.max_length is not None and len(value) > self.max_length:
+            errors.append(ErrorDetail(str(self._messages['max_length']), 'max_length'))
+        if self.min_length is not None and len(value) < self.min_length:
+            errors.append(ErrorDetail(str(self._messages['min_length']), 'min_length'))
+        if '\x00' in value:
+            errors.append(ErrorDetail(str(ProhibitNullCharactersValidator.message), ProhibitNullCharactersValidator.code))
+        if not value.isascii():
+            try:
+                ProhibitSurrogateCharactersValidator()(value)
+            except serializers.ValidationError as exc:
+                errors.extend(exc.detail)
+        if self.kind in ('email', 'url'):
+            try:
+                (_EMAIL_VALIDATOR if self.kind == 'email' else _URL_VALIDATOR)(value)
+            except DjangoValidationError as exc:
+                errors.extend(ErrorDetail(message, exc.code) for message in exc.messages)
+        if errors:
+            raise FieldInvalid(*errors)
+        return value
+
+    def _clean_int(self, raw: Any) -> int:
+        if isinstance(raw, str) and len(raw) > serializers.IntegerField.MAX_STRING_LENGTH:
+            raise FieldInvalid(_INT_MESSAGES['max_string_length'], code='max_string_length')
+        try:
+            value = int(_DECIMAL_SUFFIX.sub('', str(raw)))
+        except (ValueError, TypeError):
+            raise FieldInvalid(_INT_MESSAGES['invalid'])
+        if self.min_value is not None and value < self.min_value:
+            raise FieldInvalid(self._messages['min_value'], code='min_value')
+        return value
+
+
+class FormValidator:
+    """
+    Compiled validator for one submit form
+
+    Args:
+        fields: Fields in serializer declaration order (the error order)
+        checks: Cross-field rules, each (values, errors) -> None, adding to errors
+        build: (values) -> model kwargs; defaults to the cleaned values
+    """
+
+    def __init__(self, fields, checks=(), build: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None):
+        self.fields = tuple(fields)
+        self.checks = tuple(checks)
+        self.build = build
+
+    def run(self, data: Dict[str, Any]):
+        """(model kwargs, errors); kwargs is None when there are errors"""
+        values, errors = {}, {}
+        get = data.get
+        for field in self.fields:
+            try:
+                value = field.clean(get(field.name, MISSING))
+            except FieldInvalid as exc:
+                errors[field.name] = exc.messages
+                continue
+            if value is not MISSING:
+                values[field.name] = value
+        for check in self.checks:
+            check(values, errors)
+        if errors:
+            return None, errors
+        return (self.build(values) if self.build else values), {}
+
+    def validate(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Model kwargs for a valid payload
+
+        Raises:
+            serializers.ValidationError: With {field: [messages]} for every invalid field
+        """
+        kwargs, errors = self.run(data)
+        if errors:
+            raise serializers.ValidationError(errors)
+        return kwargs
+
+
+# ---------------------------------------------------------------------------
+# Field checks (the serializers' validate_<field> methods)
+# ---------------------------------------------------------------------------
+
+def _message_length(value):
+    if value is not None and len(value) < 10:
+        raise FieldInvalid('Message must be at least 10 characters long.')
+    return value
+
+
+def _age_of_mc_authority(value):
+    if value is None or value < 0:
+        raise FieldInvalid('Age of MC authority must be a positive number.')
+    return value
+
+
+def _applicant_name(value):
+    if len(value) < 2:
+        raise FieldInvalid('Full name must be at least 2 characters long.')
+    return value
+
+
+def _applicant_phone(value):
+    cleaned_phone = value.translate(_PHONE_FORMATTING)
+    if not cleaned_phone.isdigit() or len(cleaned_phone) < 10:
+        raise FieldInvalid('Please enter a valid phone number.')
+    return value
+
+
+def _lowercase(value):
+    return value.lower()
+
+
+def _linkedin_url(value):
+    if value:
+        if not value.startswith(('http://', 'https://')):
+            raise FieldInvalid('LinkedIn URL must start with http:// or https://')
+        if 'linkedin.com' not in value.lower():
+            raise FieldInvalid('Please enter a valid LinkedIn URL.')
+    return value
+
+
+# ---------------------------------------------------------------------------
+# Signup cross-field rules and model kwargs
+# ---------------------------------------------------------------------------
+
+SIGNUP_TYPE_FIELDS = {
+    'company': (
+        ('company_name', 'Company name is required for company signup.'),
+        ('company_email', 'Company email is required for company signup.'),
+        ('company_contact_number', 'Company contact number is required for company signup.'),
+    ),
+    'owner-operator': (
+        ('owner_name', 'Owner name is required for owner-operator signup.'),
+        ('owner_email', 'Owner email is required for owner-operator signup.'),
+        ('owner_contact_number', 'Owner contact number is required for owner-operator signup.'),
+    ),
+}
+
+SIGNUP_REQUIRED_FIELDS = (
+    ('email', 'Email is required.'),
+    ('motor_carrier_no', 'MC Authority / USDOT is required.'),
+    ('communication_method', 'Communication method is required.'),
+    ('number_of_trucks', 'Number of trucks is required.'),
+    ('truck_type', 'Truck type is required.'),
+)
+
+
+def _signup_required(values, errors):
+    """Per-type and common required fields (SignupCreateSerializer.validate)"""
+    if 'signup_type' in errors:
+        return
+    for name, message in SIGNUP_TYPE_FIELDS[values['signup_type']] + SIGNUP_REQUIRED_FIELDS:
+        if name not in errors and not values.get(name):
+            errors[name] = [message]
+
+
+def _signup_kwargs(values):
+    """Signup model kwargs (SignupSubmissionService.build_signup_data)"""
+    kwargs = {
+        'signup_type': values['signup_type'],
+        'first_name': values.get('first_name', ''),
+        'last_name': values.get('last_name', ''),
+        'contact_number': values.get('contact_number', ''),
+        'communication_method': values['communication_method'],
+        'email': values['email'].lower(),
+        'motor_carrier_no': values['motor_carrier_no'],
+        'authority_age': values.get('authority_age'),
+        'number_of_trucks': values['number_of_trucks'],
+        'truck_type': values['truck_type'],
+        'operation_area': values.get('operation_area', ''),
+    }
+    prefix = 'company' if values['signup_type'] == 'company' else 'owner'
+    kwargs.update({
+        f'{prefix}_name': values[f'{prefix}_name'],
+        f'{prefix}_email': values[f'{prefix}_email'].lower(),
+        f'{prefix}_contact_number': values[f'{prefix}_contact_number'],
+    })
+    return kwargs
+
+
+def _application_kwargs(values):
+    """CareerApplication model kwargs (CareerApplicationSubmissionService.build_application_data)"""
+    return {
+        'full_name': values['full_name'],
+        'email': values['email'],
+        'phone': values['phone'],
+        'city_state': values.get('city_state') or None,
+        'linkedin_url': values.get('linkedin_url') or None,
+        'years_of_experience': values.get('years_of_experience') or None,
+        'position_type': values['position_type'],
+        'job_title': values['job_title'],
+        'cover_note': values.get('cover_note') or None,
+        'status': 'pending',
+    }
+
+
+FORM_VALIDATORS = {
+    'contact': FormValidator([
+        Field('first_name', max_length=100),
+        Field('last_name', max_length=100),
+        Field('email', 'email', max_length=255),
+        Field('phone', max_length=20, required=False, allow_blank=True, allow_null=True),
+        Field('message', min_length=10, max_length=5000, check=_message_length),
+    ]),
+    'signup': FormValidator(
+        [
+            Field('signup_type', 'choice', choices=['company', 'owner-operator']),
+            Field('company_name', max_length=255, required=False, allow_blank=True),
+            Field('company_email', 'email', max_length=255, required=False, allow_blank=True),
+            Field('company_contact_number', max_length=20, required=False, allow_blank=True),
+            Field('owner_name', max_length=255, required=False, allow_blank=True),
+            Field('owner_email', 'email', max_length=255, required=False, allow_blank=True),
+            Field('owner_contact_number', max_length=20, required=False, allow_blank=True),
+            Field('motor_carrier_no', max_length=50, required=False, allow_blank=True),
+            Field('authority_age', 'int', required=False, allow_null=True, min_value=0),
+            Field('number_of_trucks', max_length=50),
+            Field('truck_type', max_length=100),
+            Field('operation_area', max_length=100, required=False, allow_blank=True),
+            Field('first_name', max_length=100, required=False, allow_blank=True),
+            Field('last_name', max_length=100, required=False, allow_blank=True),
+            Field('contact_number', max_length=20, required=False, allow_blank=True),
+            Field('communication_method', max_length=50),
+            Field('email', 'email', max_length=255),
+        ],
+        checks=[_signup_required],
+        build=_signup_kwargs,
+    ),
+    'claim': FormValidator([
+        Field('full_name', max_length=255),
+        Field('email', 'email', max_length=255),
+        Field('phone', max_length=20, required=False, allow_blank=True, allow_null=True),
+        Field('company_name', max_length=255, required=False, allow_blank=True, allow_null=True),
+        Field('preferred_route', max_length=255, required=False, allow_blank=True, allow_null=True),
+        Field('age_of_mc_authority', 'int', min_value=0, check=_age_of_mc_authority),
+    ]),
+    'career_application': FormValidator(
+        [
+            Field('full_name', max_length=255, check=_applicant_name),
+            Field('email', 'email', max_length=255, check=_lowercase),
+            Field('phone', max_length=20, check=_applicant_phone),
+            Field('city_state', max_length=255, required=False, allow_blank=True, allow_null=True),
+            Field('linkedin_url', 'url', max_length=500, required=False, allow_blank=True, allow_null=True,
+                  check=_linkedin_url),
+            Field('years_of_experience', max_length=50, required=False, allow_blank=True, allow_null=True),
+            Field('position_type', 'choice', choices=['remote', 'onsite']),
+            Field('job_title', max_length=255, required=False, allow_blank=True,
+                  default='Truck Dispatching Sales Executive'),
+            Field('cover_note', required=False, allow_blank=True, allow_null=True),
+        ],
+        build=_application_kwargs,
+    ),
+}
+
+# DRF serializer used for payloads the compiled validators do not take
+FORM_SERIALIZERS = {
+    'contact': ContactCreateSerializer,
+    'signup': SignupCreateSerializer,
+    'claim': ClaimCreateSerializer,
+    'career_application': CareerApplicationCreateSerializer,
+}
+
+
+def uses_compiled_validator(data: Any) -> bool:
+    """Whether a payload takes the compiled path (a parsed JSON object)"""
+    return type(data) is dict and getattr(settings, 'COMPILED_FORM_VALIDATORS', True)
+
+
+def validate_submission(kind: str, data: Any, build: Optional[Callable] = None) -> Dict[str, Any]:
+    """
+    Model kwargs for one submission of the given form kind
+
+    Args:
+        kind: 'contact', 'signup', 'claim' or 'career_application'
+        data: Request payload
+        build: Turns the serializer's validated_data into model kwargs on
+            the DRF path (the compiled validators build them themselves)
+
+    Raises:
+        serializers.ValidationError: If validation fails
+    """
+    with timing.phase('validate'):
+        if uses_compiled_validator(data):
+            return FORM_VALIDATORS[kind].validate(data)
+        serializer = FORM_SERIALIZERS[kind](data=data)
+        if not serializer.is_valid():
+            raise serializers.ValidationError(serializer.errors)
+        return build(serializer.validated_data) if build else serializer.validated_data
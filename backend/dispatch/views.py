@@ -2,19 +2,41 @@
 Presentation Layer: API Views
 Handles HTTP requests and responses for the contact and signup APIs.
 """
-from rest_framework.decorators import api_view
+from rest_framework.decorators import api_view, parser_classes, permission_classes, throttle_classes
+from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework import serializers
-from django.http import JsonResponse
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse
+from django.utils import timezone
+from django.utils.crypto import constant_time_compare
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET, require_POST
+import json
 import logging
+from datetime import date, timedelta
 from .services import (
     ContactSubmissionService,
     SignupSubmissionService,
     ClaimSubmissionService,
-    CareerApplicationSubmissionService
+    CareerApplicationSubmissionService,
+    BatchSubmissionService,
+    LeadListService,
+    LeadSearchService,
+    FuzzyNameLookupService,
+    LeadStatsService,
+    LeadInboxService,
+    LeadBulkActionService
 )
 from .serializers import ContactResponseSerializer
+from .parsers import FastJSONParser, NDJSONParser
+from .idempotency import idempotent
+from .throttles import BatchRateThrottle
+from .exports import csv_export_response
+from . import metrics
+from . import query_cache
+from . import timing
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +58,7 @@ def test_api(request):
 
 
 @api_view(['POST'])
+@idempotent('contact')
 def submit_contact(request):
     """
     API Endpoint: Submit contact form
@@ -50,7 +73,7 @@ def submit_contact(request):
         # Use domain service to handle business logic
         result = ContactSubmissionService.create_contact_submission(data)
         
-        logger.info(f"Contact submission created: {result['data'].get('email')}")
+        logger.info("Contact submission created: %s", result['data'].get('email'))
         
         return Response(
             {
@@ -63,7 +86,7 @@ def submit_contact(request):
         
     except serializers.ValidationError as e:
         # Handle validation errors
-        logger.warning(f"Contact submission validation error: {e.detail}")
+        logger.warning("Contact submission validation error: %s", e.detail)
         return Response(
             {
                 'success': False,
@@ -74,10 +97,9 @@ def submit_contact(request):
         )
     except Exception as e:
         # Handle database and other unexpected errors
-        error_message = str(e)
         error_type = type(e).__name__
         
-        logger.error(f"Contact submission error [{error_type}]: {error_message}", exc_info=True)
+        logger.error("Contact submission error [%s]: %s", error_type, e, exc_info=True)
         
         return Response(
             {
@@ -90,6 +112,7 @@ def submit_contact(request):
 
 
 @api_view(['POST'])
+@idempotent('signup')
 def submit_signup(request):
     """
     API Endpoint: Submit signup form
@@ -105,7 +128,7 @@ def submit_signup(request):
         # Use domain service to handle business logic
         result = SignupSubmissionService.create_signup_submission(data)
         
-        logger.info(f"Signup submission created: {result['data'].get('email')} (Type: {result['data'].get('signup_type')})")
+        logger.info("Signup submission created: %s (Type: %s)", result['data'].get('email'), result['data'].get('signup_type'))
         
         return Response(
             {
@@ -118,7 +141,7 @@ def submit_signup(request):
         
     except serializers.ValidationError as e:
         # Handle validation errors
-        logger.warning(f"Signup submission validation error: {e.detail}")
+        logger.warning("Signup submission validation error: %s", e.detail)
         return Response(
             {
                 'success': False,
@@ -129,10 +152,9 @@ def submit_signup(request):
         )
     except Exception as e:
         # Handle database and other unexpected errors
-        error_message = str(e)
         error_type = type(e).__name__
         
-        logger.error(f"Signup submission error [{error_type}]: {error_message}", exc_info=True)
+        logger.error("Signup submission error [%s]: %s", error_type, e, exc_info=True)
         
         return Response(
             {
@@ -145,6 +167,7 @@ def submit_signup(request):
 
 
 @api_view(['POST'])
+@idempotent('claim')
 def submit_claim(request):
     """
     API Endpoint: Submit claim form
@@ -159,7 +182,7 @@ def submit_claim(request):
         # Use domain service to handle business logic
         result = ClaimSubmissionService.create_claim_submission(data)
         
-        logger.info(f"Claim submission created: {result['data'].get('email')}")
+        logger.info("Claim submission created: %s", result['data'].get('email'))
         
         return Response(
             {
@@ -172,7 +195,7 @@ def submit_claim(request):
         
     except serializers.ValidationError as e:
         # Handle validation errors
-        logger.warning(f"Claim submission validation error: {e.detail}")
+        logger.warning("Claim submission validation error: %s", e.detail)
         return Response(
             {
                 'success': False,
@@ -183,10 +206,9 @@ def submit_claim(request):
         )
     except Exception as e:
         # Handle database and other unexpected errors
-        error_message = str(e)
         error_type = type(e).__name__
         
-        logger.error(f"Claim submission error [{error_type}]: {error_message}", exc_info=True)
+        logger.error("Claim submission error [%s]: %s", error_type, e, exc_info=True)
         
         return Response(
             {
@@ -199,6 +221,7 @@ def submit_claim(request):
 
 
 @api_view(['POST'])
+@idempotent('career_application')
 def submit_career_application(request):
     """
     API Endpoint: Submit career application form
@@ -213,7 +236,7 @@ def submit_career_application(request):
         # Use domain service to handle business logic
         result = CareerApplicationSubmissionService.create_career_application(data)
         
-        logger.info(f"Career application created: {result['data'].get('email')} (Position: {result['data'].get('position_type')})")
+        logger.info("Career application created: %s (Position: %s)", result['data'].get('email'), result['data'].get('position_type'))
         
         return Response(
             {
@@ -226,7 +249,7 @@ def submit_career_application(request):
         
     except serializers.ValidationError as e:
         # Handle validation errors
-        logger.warning(f"Career application validation error: {e.detail}")
+        logger.warning("Career application validation error: %s", e.detail)
         return Response(
             {
                 'success': False,
@@ -237,10 +260,9 @@ def submit_career_application(request):
         )
     except Exception as e:
         # Handle database and other unexpected errors
-        error_message = str(e)
         error_type = type(e).__name__
         
-        logger.error(f"Career application error [{error_type}]: {error_message}", exc_info=True)
+        logger.error("Career application error [%s]: %s", error_type, e, exc_info=True)
         
         return Response(
             {
@@ -250,3 +272,660 @@ def submit_career_application(request):
             },
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
+
+
+@api_view(['POST'])
+@parser_classes([FastJSONParser, NDJSONParser])
+@permission_classes([IsAdminUser])
+@throttle_classes([BatchRateThrottle])
+@idempotent('batch')
+def submit_batch(request, kind):
+    """
+    API Endpoint: Submit a batch of contacts, claims or signups (staff only)
+    POST /api/v1/dispatch/batch/<kind>/   (kind: contact, claim, signup)
+    
+    Accepts a JSON array or NDJSON body (Content-Type: application/x-ndjson).
+    Each item is validated independently; valid items are inserted in bulk.
+    Pass ?notify=true to queue admin notifications for created contacts.
+    Returns 201 if every item was created, 207 if only some were, 400 if none were.
+    """
+    try:
+        notify = request.query_params.get('notify', '').lower() in ('1', 'true', 'yes')
+        
+        # Use domain service to handle business logic
+        result = BatchSubmissionService.create_batch(kind, request.data, notify=notify)
+        
+        logger.info("Batch %s submission: %s created, %s failed", kind, result['created'], result['failed'])
+        
+        if result['failed'] == 0:
+            response_status = status.HTTP_201_CREATED
+        elif result['created'] > 0:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_400_BAD_REQUEST
+        
+        return Response(
+            {
+                'success': result['failed'] == 0,
+                'message': f"{result['created']} of {result['created'] + result['failed']} items created.",
+                'data': result
+            },
+            status=response_status
+        )
+        
+    except serializers.ValidationError as e:
+        # Handle validation errors for the batch as a whole
+        logger.warning("Batch %s submission validation error: %s", kind, e.detail)
+        return Response(
+            {
+                'success': False,
+                'message': 'Validation failed',
+                'errors': e.detail
+            },
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    except Exception as e:
+        # Handle database and other unexpected errors
+        error_type = type(e).__name__
+        
+        logger.error("Batch %s submission error [%s]: %s", kind, error_type, e, exc_info=True)
+        
+        return Response(
+            {
+                'success': False,
+                'message': 'An error occurred while processing your request. Please try again later.',
+                'error_type': error_type
+            },
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def list_leads(request, kind):
+    """
+    API Endpoint: List leads newest first with keyset pagination (staff only)
+    GET /api/v1/dispatch/contacts/
+    GET /api/v1/dispatch/signups/
+    GET /api/v1/dispatch/claims/
+    GET /api/v1/dispatch/career-applications/
+    
+    Query parameters: limit, cursor (the previous page's next_cursor) and the
+    per-model filters is_read, is_archived, status, signup_type, position_type,
+    is_approved, is_active. Contacts and claims accept source=archive to read
+    rows moved to the archive tables by archive_leads.
+    """
+    try:
+        result = LeadListService.list_leads(kind, request.query_params)
+        
+        return Response(
+            {
+                'success': True,
+                'data': result
+            },
+            status=status.HTTP_200_OK
+        )
+        
+    except serializers.ValidationError as e:
+        return Response(
+            {
+                'success': False,
+                'message': 'Validation failed',
+                'errors': e.detail
+            },
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    except Exception as e:
+        error_type = type(e).__name__
+        logger.error("Lead list error [%s]: %s", error_type, e, exc_info=True)
+        return Response(
+            {
+                'success': False,
+                'message': 'An error occurred while processing your request. Please try again later.',
+                'error_type': error_type
+            },
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def search_leads(request):
+    """
+    API Endpoint: Ranked full-text search over leads (staff only)
+    GET /api/v1/dispatch/search/?q=<terms>[&type=contact|signup|claim|career_application][&limit=20]
+    
+    Supports web-search syntax: "quoted phrases", OR, and -excluded words.
+    """
+    try:
+        results = LeadSearchService.search(
+            request.query_params.get('q', ''),
+            kind=request.query_params.get('type') or None,
+            limit=LeadListService.page_size(request.query_params),
+        )
+        
+        return Response(
+            {
+                'success': True,
+                'data': {'results': results}
+            },
+            status=status.HTTP_200_OK
+        )
+        
+    except serializers.ValidationError as e:
+        return Response(
+            {
+                'success': False,
+                'message': 'Validation failed',
+                'errors': e.detail
+            },
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    except Exception as e:
+        error_type = type(e).__name__
+        logger.error("Lead search error [%s]: %s", error_type, e, exc_info=True)
+        return Response(
+            {
+                'success': False,
+                'message': 'An error occurred while processing your request. Please try again later.',
+                'error_type': error_type
+            },
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def fuzzy_name_lookup(request):
+    """
+    API Endpoint: Fuzzy lookup of company, owner and claimant names (staff only)
+    GET /api/v1/dispatch/names/?q=<partial name>[&type=signup|claim][&limit=10][&min_score=0.4]
+    
+    Returns the top matches with their trigram word-similarity scores.
+    """
+    try:
+        min_score = request.query_params.get('min_score')
+        try:
+            min_score = float(min_score) if min_score else None
+        except ValueError:
+            raise serializers.ValidationError({'min_score': ['Must be a number.']})
+        
+        results = FuzzyNameLookupService.lookup(
+            request.query_params.get('q', ''),
+            kind=request.query_params.get('type') or None,
+            limit=LeadListService.page_size({'limit': request.query_params.get('limit', 10)}),
+            min_score=min_score,
+        )
+        
+        return Response(
+            {
+                'success': True,
+                'data': {'results': results}
+            },
+            status=status.HTTP_200_OK
+        )
+        
+    except serializers.ValidationError as e:
+        return Response(
+            {
+                'success': False,
+                'message': 'Validation failed',
+                'errors': e.detail
+            },
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    except Exception as e:
+        error_type = type(e).__name__
+        logger.error("Fuzzy name lookup error [%s]: %s", error_type, e, exc_info=True)
+        return Response(
+            {
+                'success': False,
+                'message': 'An error occurred while processing your request. Please try again later.',
+                'error_type': error_type
+            },
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def export_leads(request, kind):
+    """
+    API Endpoint: Stream leads as CSV (staff only)
+    GET /api/v1/dispatch/export/<kind>/[?gzip=true]   (kind: contact, signup, claim, career_application)
+    
+    Accepts the same filters and source as the list endpoints. Rows are streamed from a
+    server-side cursor, so exports of any size run in constant memory.
+    """
+    if kind not in LeadListService.KINDS:
+        return Response(
+            {
+                'success': False,
+                'message': f'Unsupported export kind "{kind}".'
+            },
+            status=status.HTTP_404_NOT_FOUND
+        )
+    
+    try:
+        filters = LeadListService.parse_filters(kind, request.query_params)
+        model, _ = LeadListService.source(kind, request.query_params)
+    except serializers.ValidationError as e:
+        return Response(
+            {
+                'success': False,
+                'message': 'Validation failed',
+                'errors': e.detail
+            },
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    compress = request.query_params.get('gzip', '').lower() in ('1', 'true', 'yes')
+    queryset = model.objects.filter(**filters).order_by('-created_at')
+    
+    logger.info("Lead export started: %s (gzip: %s)", kind, compress)
+    return csv_export_response(queryset, model._meta.db_table, compress=compress)
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def lead_stats(request):
+    """
+    API Endpoint: Daily lead statistics (staff only)
+    GET /api/v1/dispatch/stats/[?from=YYYY-MM-DD][&to=YYYY-MM-DD][&type=contact|claim|signup|career_application]
+    
+    Defaults to the last 30 days. Reads only the daily rollup table.
+    """
+    try:
+        try:
+            end = date.fromisoformat(request.query_params['to']) if request.query_params.get('to') else timezone.localdate()
+            start = (
+                date.fromisoformat(request.query_params['from']) if request.query_params.get('from')
+                else end - timedelta(days=29)
+            )
+        except ValueError:
+            raise serializers.ValidationError({'date': ['Dates must be in YYYY-MM-DD format.']})
+        if start > end:
+            raise serializers.ValidationError({'from': ['Must be on or before "to".']})
+        
+        result = LeadStatsService.get_stats(start, end, lead_type=request.query_params.get('type') or None)
+        
+        return Response(
+            {
+                'success': True,
+                'data': result
+            },
+            status=status.HTTP_200_OK
+        )
+        
+    except serializers.ValidationError as e:
+        return Response(
+            {
+                'success': False,
+                'message': 'Validation failed',
+                'errors': e.detail
+            },
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    except Exception as e:
+        error_type = type(e).__name__
+        logger.error("Lead stats error [%s]: %s", error_type, e, exc_info=True)
+        return Response(
+            {
+                'success': False,
+                'message': 'An error occurred while processing your request. Please try again later.',
+                'error_type': error_type
+            },
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def lead_inbox(request):
+    """
+    API Endpoint: Unified lead inbox across all lead types (staff only)
+    GET /api/v1/dispatch/inbox/[?unread=true][&type=contact,claim][&limit=50][&cursor=...]
+    
+    Returns compact rows (type, id, name, email, phone, created_at, is_read),
+    newest first, excluding archived and deactivated leads.
+    """
+    try:
+        result = LeadInboxService.list_inbox(request.query_params)
+        
+        return Response(
+            {
+                'success': True,
+                'data': result
+            },
+            status=status.HTTP_200_OK
+        )
+        
+    except serializers.ValidationError as e:
+        return Response(
+            {
+                'success': False,
+                'message': 'Validation failed',
+                'errors': e.detail
+            },
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    except Exception as e:
+        error_type = type(e).__name__
+        logger.error("Lead inbox error [%s]: %s", error_type, e, exc_info=True)
+        return Response(
+            {
+                'success': False,
+                'message': 'An error occurred while processing your request. Please try again later.',
+                'error_type': error_type
+            },
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def query_cache_stats(request):
+    """
+    API Endpoint: Query cache hit/miss counters for this worker process (staff only)
+    GET /api/v1/dispatch/cache/stats/
+    """
+    return Response(
+        {
+            'success': True,
+            'data': {
+                'enabled': query_cache.is_enabled(),
+                'namespaces': query_cache.stats()
+            }
+        },
+        status=status.HTTP_200_OK
+    )
+
+
+@require_GET
+def prometheus_metrics(request):
+    """
+    Metrics Endpoint: Prometheus text exposition for all worker processes
+    GET /metrics
+
+    The scraper must send METRICS_TOKEN as a bearer token. Without a token
+    the endpoint is only served with DEBUG on.
+    """
+    if not metrics.is_enabled():
+        return HttpResponse(status=status.HTTP_404_NOT_FOUND)
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    if not token:
+        if not settings.DEBUG:
+            logger.warning('Refusing a /metrics scrape: METRICS_TOKEN is not set')
+            return HttpResponse(status=status.HTTP_403_FORBIDDEN)
+    elif not constant_time_compare(request.headers.get('Authorization', ''), f'Bearer {token}'):
+        return HttpResponse(status=status.HTTP_401_UNAUTHORIZED)
+    return HttpResponse(metrics.render(), content_type=metrics.CONTENT_TYPE)
+
+
+@api_view(['POST'])
+@permission_classes([IsAdminUser])
+def bulk_update_leads(request, kind):
+    """
+    API Endpoint: Apply a state transition to many leads at once (staff only)
+    POST /api/v1/dispatch/bulk/<kind>/
+    
+    Body: {"action": "mark_as_read" | "archive" | "approve" | "deactivate" | "update_status",
+           "ids": [...], "status": "...", "reviewed_by": "..."}
+    Rows already in the target state are skipped; 'affected' is the number
+    of rows the UPDATE changed.
+    """
+    try:
+        result = LeadBulkActionService.apply(kind, request.data, reviewed_by=request.user.get_username())
+        
+        logger.info("Bulk %s on %s: %s of %s rows updated", result['action'], kind, result['affected'], result['requested'])
+        
+        return Response(
+            {
+                'success': True,
+                'message': f"{result['affected']} {kind} row(s) updated.",
+                'data': result
+            },
+            status=status.HTTP_200_OK
+        )
+        
+    except serializers.ValidationError as e:
+        return Response(
+            {
+                'success': False,
+                'message': 'Validation failed',
+                'errors': e.detail
+            },
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    except Exception as e:
+        error_type = type(e).__name__
+        logger.error("Bulk %s update error [%s]: %s", kind, error_type, e, exc_info=True)
+        return Response(
+            {
+                'success': False,
+                'message': 'An error occurred while processing your request. Please try again later.',
+                'error_type': error_type
+            },
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+# ---------------------------------------------------------------------------
+# Async submit endpoints
+#
+# Native coroutine views for ASGI deployments (core.asgi). They return the
+# same payloads as the DRF views above but await the async service methods
+# instead of holding a thread-pool worker for the whole request. Enabled for
+# the public URLs with DISPATCH_ASYNC_VIEWS=True.
+# ---------------------------------------------------------------------------
+
+def _parse_request_data(request):
+    """Parse a JSON or form-encoded body the way DRF's default parsers would"""
+    with timing.phase('parse'):
+        if request.content_type == 'application/json':
+            return json.loads(request.body or b'{}')
+        return request.POST
+
+
+def _parse_error_response(e):
+    return JsonResponse({'detail': f'JSON parse error - {e}'}, status=status.HTTP_400_BAD_REQUEST)
+
+
+@csrf_exempt
+@require_POST
+@idempotent('contact')
+async def asubmit_contact(request):
+    """
+    API Endpoint (async): Submit contact form
+    POST /api/v1/dispatch/contact/
+    """
+    try:
+        data = _parse_request_data(request)
+    except ValueError as e:
+        return _parse_error_response(e)
+    
+    try:
+        result = await ContactSubmissionService.acreate_contact_submission(data)
+        
+        logger.info("Contact submission created: %s", result['data'].get('email'))
+        
+        return JsonResponse(
+            {
+                'success': True,
+                'message': result['message'],
+                'data': result['data']
+            },
+            status=status.HTTP_201_CREATED
+        )
+        
+    except serializers.ValidationError as e:
+        logger.warning("Contact submission validation error: %s", e.detail)
+        return JsonResponse(
+            {
+                'success': False,
+                'message': 'Validation failed',
+                'errors': e.detail
+            },
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    except Exception as e:
+        error_type = type(e).__name__
+        logger.error("Contact submission error [%s]: %s", error_type, e, exc_info=True)
+        return JsonResponse(
+            {
+                'success': False,
+                'message': 'An error occurred while processing your request. Please try again later.',
+                'error_type': error_type
+            },
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@csrf_exempt
+@require_POST
+@idempotent('signup')
+async def asubmit_signup(request):
+    """
+    API Endpoint (async): Submit signup form
+    POST /api/v1/dispatch/signup/
+    """
+    try:
+        data = _parse_request_data(request)
+    except ValueError as e:
+        return _parse_error_response(e)
+    
+    try:
+        result = await SignupSubmissionService.acreate_signup_submission(data)
+        
+        logger.info("Signup submission created: %s (Type: %s)", result['data'].get('email'), result['data'].get('signup_type'))
+        
+        return JsonResponse(
+            {
+                'success': True,
+                'message': result['message'],
+                'data': result['data']
+            },
+            status=status.HTTP_201_CREATED
+        )
+        
+    except serializers.ValidationError as e:
+        logger.warning("Signup submission validation error: %s", e.detail)
+        return JsonResponse(
+            {
+                'success': False,
+                'message': 'Validation failed',
+                'errors': e.detail
+            },
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    except Exception as e:
+        error_type = type(e).__name__
+        logger.error("Signup submission error [%s]: %s", error_type, e, exc_info=True)
+        return JsonResponse(
+            {
+                'success': False,
+                'message': 'An error occurred while processing your request. Please try again later.',
+                'error_type': error_type
+            },
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@csrf_exempt
+@require_POST
+@idempotent('claim')
+async def asubmit_claim(request):
+    """
+    API Endpoint (async): Submit claim form
+    POST /api/v1/dispatch/claim/
+    """
+    try:
+        data = _parse_request_data(request)
+    except ValueError as e:
+        return _parse_error_response(e)
+    
+    try:
+        result = await ClaimSubmissionService.acreate_claim_submission(data)
+        
+        logger.info("Claim submission created: %s", result['data'].get('email'))
+        
+        return JsonResponse(
+            {
+                'success': True,
+                'message': result['message'],
+                'data': result['data']
+            },
+            status=status.HTTP_201_CREATED
+        )
+        
+    except serializers.ValidationError as e:
+        logger.warning("Claim submission validation error: %s", e.detail)
+        return JsonResponse(
+            {
+                'success': False,
+                'message': 'Validation failed',
+                'errors': e.detail
+            },
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    except Exception as e:
+        error_type = type(e).__name__
+        logger.error("Claim submission error [%s]: %s", error_type, e, exc_info=True)
+        return JsonResponse(
+            {
+                'success': False,
+                'message': 'An error occurred while processing your request. Please try again later.',
+                'error_type': error_type
+            },
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@csrf_exempt
+@require_POST
+@idempotent('career_application')
+async def asubmit_career_application(request):
+    """
+    API Endpoint (async): Submit career application form
+    POST /api/v1/dispatch/career-application/
+    """
+    try:
+        data = _parse_request_data(request)
+    except ValueError as e:
+        return _parse_error_response(e)
+    
+    try:
+        result = await CareerApplicationSubmissionService.acreate_career_application(data)
+        
+        logger.info("Career application created: %s (Position: %s)", result['data'].get('email'), result['data'].get('position_type'))
+        
+        return JsonResponse(
+            {
+                'success': True,
+                'message': result['message'],
+                'data': result['data']
+            },
+            status=status.HTTP_201_CREATED
+        )
+        
+    except serializers.ValidationError as e:
+        logger.warning("Career application validation error: %s", e.detail)
+        return JsonResponse(
+            {
+                'success': False,
+                'message': 'Validation failed',
+                'errors': e.detail
+            },
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    except Exception as e:
+        error_type = type(e).__name__
+        logger.error("Career application error [%s]: %s", error_type, e, exc_info=True)
+        return JsonResponse(
+            {
+                'success': False,
+                'message': 'An error occurred while processing your application. Please try again later.',
+                'error_type': error_type
+            },
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )